@@ -0,0 +1,13 @@
+"""
+Benchmarks based on `pytest-benchmark`, they are not collected by the unit tests.
+
+Run the benchmarks and store the results as a baseline:
+
+    pytest benchmarks --benchmark-storage=benchmarks/baselines --benchmark-save=<name>
+
+Compare a later run against the stored baseline:
+
+    pytest benchmarks --benchmark-storage=benchmarks/baselines --benchmark-compare=<id>
+
+Use `--benchmark-disable` to only check that the benchmarks run.
+"""
@@ -0,0 +1,176 @@
+"""
+Benchmarks of the converters in `polymat/expressiontree/to.py`.
+"""
+
+import io
+
+import numpy as np
+import pytest
+
+import polymat
+from polymat.expression.to import to_numpy, to_variables
+from benchmarks.workloads import (
+    DEGREES,
+    N_VARIABLES,
+    SIZES,
+    prepare,
+    random_array,
+    random_polynomial_vector,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(params=N_VARIABLES, ids=lambda n: f"n_var={n}")
+def n_var(request):
+    return request.param
+
+
+@pytest.fixture(params=DEGREES, ids=lambda d: f"degree={d}")
+def degree(request):
+    return request.param
+
+
+@pytest.fixture(params=SIZES, ids=lambda s: f"size={s}")
+def size(request):
+    return request.param
+
+
+@pytest.fixture
+def polynomial_vector(n_var, degree, size):
+    """A random polynomial vector computed beforehand."""
+
+    x = polymat.define_variable("x", size=n_var)
+    return prepare(x, random_polynomial_vector(x, n_var, degree, 10 * size))
+
+
+@pytest.fixture
+def constant_matrix(size):
+    return prepare(polymat.from_(random_array(10 * size, size, density=0.5)))
+
+
+def convert(state_monad, state):
+    _, result = state_monad.apply(state)
+    return result
+
+
+@pytest.fixture
+def affine_vector(n_var, size):
+    """An affine polynomial vector computed beforehand."""
+
+    x = polymat.define_variable("x", size=n_var)
+    a = polymat.from_(random_array(10 * size, n_var, density=0.5))
+    b = polymat.from_(random_array(10 * size, 1, density=0.5))
+    return prepare(x, a @ x + b)
+
+
+def test_to_affine_arrays(benchmark, affine_vector):
+    state, (x, p) = affine_vector
+    benchmark(convert, polymat.to_affine_arrays(p, x), state)
+
+
+def test_to_array(benchmark, polynomial_vector):
+    state, (x, p) = polynomial_vector
+    benchmark(convert, polymat.to_array(p, x), state)
+
+
+def test_to_array_chunks(benchmark, polynomial_vector):
+    state, (x, p) = polynomial_vector
+
+    def convert_chunks():
+        _, chunks = polymat.to_array_chunks(p, x, chunk_size=256).apply(state)
+        for _ in chunks:
+            pass
+
+    benchmark(convert_chunks)
+
+
+def test_to_array_memory_mapped(benchmark, polynomial_vector, tmp_path):
+    state, (x, p) = polynomial_vector
+    benchmark(convert, polymat.to_array(p, x, directory=tmp_path), state)
+
+
+def test_evaluate_array_memory_mapped(benchmark, polynomial_vector, n_var, tmp_path):
+    state, (x, p) = polynomial_vector
+    _, array_repr = polymat.to_array(p, x, directory=tmp_path).apply(state)
+    benchmark(array_repr, np.linspace(-1, 1, n_var).reshape(-1, 1))
+
+
+def test_to_array_affine(benchmark, affine_vector):
+    state, (x, p) = affine_vector
+    benchmark(convert, polymat.to_array(p, x), state)
+
+
+def test_to_degree(benchmark, polynomial_vector):
+    state, (x, p) = polynomial_vector
+    benchmark(convert, polymat.to_degree(p, x), state)
+
+
+def test_to_numpy(benchmark, constant_matrix):
+    state, (a,) = constant_matrix
+    benchmark(convert, to_numpy(a), state)
+
+
+def test_to_shape(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(convert, polymat.to_shape(p), state)
+
+
+def test_to_scipy_sparse(benchmark, constant_matrix):
+    state, (a,) = constant_matrix
+    benchmark(convert, polymat.to_scipy_sparse(a), state)
+
+
+def test_to_scipy_sparse_per_monomial(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(convert, polymat.to_scipy_sparse(p, per_monomial=True), state)
+
+
+def test_to_sparse_repr(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(convert, polymat.to_sparse_repr(p), state)
+
+
+@pytest.mark.parametrize("sparse", (False, True), ids=("dense", "sparse"))
+def test_to_sympy(benchmark, polynomial_vector, sparse):
+    state, (_, p) = polynomial_vector
+    benchmark(convert, polymat.to_sympy(p, sparse=sparse), state)
+
+
+def test_to_tuple(benchmark, constant_matrix):
+    state, (a,) = constant_matrix
+    benchmark(convert, polymat.to_tuple(a), state)
+
+
+def test_to_variable_indices(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(convert, polymat.to_variable_indices(p), state)
+
+
+def test_to_variables(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(convert, to_variables(p), state)
+
+
+# serialization
+###############
+
+
+def test_save(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    _, sparse_repr = p.apply(state)
+    benchmark(polymat.save, io.BytesIO(), sparse_repr)
+
+
+def test_load(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    _, sparse_repr = p.apply(state)
+
+    file = io.BytesIO()
+    polymat.save(file, sparse_repr)
+
+    def load():
+        file.seek(0)
+        return polymat.load(file)
+
+    benchmark(load)
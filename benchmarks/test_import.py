@@ -0,0 +1,21 @@
+"""
+Benchmark of the time it takes to import polymat in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("module", ("polymat", "sympy"))
+def test_import(benchmark, module):
+    # sympy is given as a reference, it is not imported by polymat
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", f"import {module}"],),
+        kwargs={"check": True},
+        rounds=5,
+    )
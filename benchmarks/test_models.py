@@ -0,0 +1,64 @@
+"""
+End-to-end benchmarks building a model from scratch and exporting it, as done by
+an application of the library.
+"""
+
+import pytest
+
+import polymat
+from benchmarks.workloads import monomial_vector, n_monomials, random_polynomial_vector
+
+pytest.importorskip("pytest_benchmark")
+
+
+def build_readme_example(n_var: int):
+    """Scaled version of the example in the README."""
+
+    state = polymat.init_state()
+
+    variables = tuple(polymat.define_variable(f"x{i}") for i in range(n_var))
+    x = polymat.v_stack(variables)
+
+    f = sum(
+        (x1 + x2) + (x1 + x1 * x2) for x1, x2 in zip(variables[:-1], variables[1:])
+    )
+
+    state, sympy_repr = polymat.to_sympy(f).apply(state)
+    state, array_repr = polymat.to_array(f, x).apply(state)
+
+    return sympy_repr, array_repr
+
+
+def build_sos_problem(n_var: int, degree: int):
+    """
+    Sum-of-squares decomposition f(x) = z(x)^T Q z(x) of a random polynomial f,
+    where z(x) is the vector of monomials up to half the degree of f.
+    """
+
+    state = polymat.init_state()
+
+    x = polymat.define_variable("x", size=n_var)
+    z = monomial_vector(x, degree).cache()
+    n_z = n_monomials(n_var, degree)
+
+    f = random_polynomial_vector(x, n_var, 2 * degree, 1)
+
+    q = polymat.define_variable("q", size=n_z * n_z)
+    Q = q.reshape(n_z, n_z)
+
+    # equality constraints that are linear in the entries of Q
+    residual = (f - z.T @ Q @ z).to_linear_coefficients(x).T
+
+    state, array_repr = polymat.to_array(residual, q).apply(state)
+
+    return array_repr
+
+
+@pytest.mark.parametrize("n_var", (5, 20))
+def test_readme_example(benchmark, n_var):
+    benchmark(build_readme_example, n_var)
+
+
+@pytest.mark.parametrize("n_var,degree", ((2, 2), (3, 2), (4, 1)))
+def test_sos_problem(benchmark, n_var, degree):
+    benchmark(build_sos_problem, n_var, degree)
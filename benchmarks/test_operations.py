@@ -0,0 +1,340 @@
+"""
+Benchmarks of the operators in `polymat/expressiontree/operations`.
+"""
+
+import numpy as np
+import pytest
+import scipy.sparse
+import sympy
+
+import polymat
+from polymat.expression.from_ import from_variables
+from polymat.expression.init import init_expression
+from polymat.expressiontree.init import (
+    from_vector_to_symmetric_matrix,
+    init_from_numpy,
+    init_from_sparse_repr,
+)
+from polymat.symbol import Symbol
+from benchmarks.workloads import (
+    DEGREES,
+    DENSITIES,
+    N_VARIABLES,
+    SIZES,
+    apply,
+    define_variables,
+    monomial_vector,
+    prepare,
+    random_array,
+    random_polynomial_matrix,
+    random_polynomial_vector,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(params=N_VARIABLES, ids=lambda n: f"n_var={n}")
+def n_var(request):
+    return request.param
+
+
+@pytest.fixture(params=DEGREES, ids=lambda d: f"degree={d}")
+def degree(request):
+    return request.param
+
+
+@pytest.fixture(params=SIZES, ids=lambda s: f"size={s}")
+def size(request):
+    return request.param
+
+
+@pytest.fixture(params=DENSITIES, ids=lambda d: f"density={d}")
+def density(request):
+    return request.param
+
+
+@pytest.fixture
+def x(n_var):
+    return define_variables(n_var)
+
+
+@pytest.fixture
+def polynomial_matrices(x, n_var, degree, size, density):
+    """Two random polynomial matrices computed beforehand."""
+
+    return prepare(
+        random_polynomial_matrix(x, n_var, degree, size, density, seed=0),
+        random_polynomial_matrix(x, n_var, degree, size, density, seed=1),
+    )
+
+
+@pytest.fixture
+def polynomial_vector(x, n_var, degree, size, density):
+    """A random polynomial vector computed beforehand."""
+
+    return prepare(
+        x,
+        random_polynomial_vector(x, n_var, degree, size, density),
+    )
+
+
+# element-wise operations
+#########################
+
+
+def test_addition(benchmark, polynomial_matrices):
+    state, (left, right) = polynomial_matrices
+    benchmark(apply, left + right, state)
+
+
+@pytest.mark.parametrize("n_summands", (10, 1000))
+def test_addition_chain(benchmark, x, n_var, n_summands):
+    state, summands = prepare(
+        *(random_polynomial_vector(x, n_var, 2, 5, seed=s) for s in range(10))
+    )
+    expr = sum(summands[s % 10] for s in range(n_summands))
+    benchmark(apply, expr, state)
+
+
+def test_add_all(benchmark, polynomial_matrices):
+    state, (left, right) = polynomial_matrices
+    benchmark(apply, polymat.add_all((left, right, left, right)), state)
+
+
+def test_elementwise_mult(benchmark, polynomial_matrices):
+    state, (left, right) = polynomial_matrices
+    benchmark(apply, left * right, state)
+
+
+def test_broadcast_mult(benchmark, polynomial_matrices):
+    state, (left, right) = polynomial_matrices
+    benchmark(apply, left[0, 0] * right, state)
+
+
+def test_matrix_mult(benchmark, polynomial_matrices):
+    state, (left, right) = polynomial_matrices
+    benchmark(apply, left @ right, state)
+
+
+def test_matrix_mult_constant(benchmark, polynomial_vector, size, density):
+    state, (_, p) = polynomial_vector
+    a = polymat.from_(random_array(size, size, density))
+    benchmark(apply, a @ p, state)
+
+
+def test_kron(benchmark, x, n_var):
+    state, (p, q) = prepare(
+        random_polynomial_matrix(x, n_var, degree=1, size=6, seed=0),
+        random_polynomial_matrix(x, n_var, degree=1, size=6, seed=1),
+    )
+    benchmark(apply, p.kron(q), state)
+
+
+# stacking
+##########
+
+
+@pytest.mark.parametrize("n_blocks", (10, 200))
+def test_v_stack(benchmark, x, n_var, n_blocks):
+    state, blocks = prepare(
+        *(random_polynomial_vector(x, n_var, 2, 5, seed=s) for s in range(n_blocks))
+    )
+    benchmark(apply, polymat.v_stack(blocks), state)
+
+
+@pytest.mark.parametrize("n_blocks", (10, 200))
+def test_h_stack(benchmark, x, n_var, n_blocks):
+    state, blocks = prepare(
+        *(random_polynomial_vector(x, n_var, 2, 5, seed=s).T for s in range(n_blocks))
+    )
+    benchmark(apply, polymat.h_stack(blocks), state)
+
+
+@pytest.mark.parametrize("n_blocks", (10, 100))
+def test_block_diag(benchmark, x, n_var, n_blocks):
+    state, blocks = prepare(
+        *(random_polynomial_matrix(x, n_var, 2, 4, seed=s) for s in range(n_blocks))
+    )
+    benchmark(apply, polymat.block_diag(blocks), state)
+
+
+# single child operations
+#########################
+
+
+def test_cache(benchmark, x, n_var, degree, size):
+    expr = random_polynomial_matrix(x, n_var, degree, size).cache()
+
+    def apply_twice():
+        state = polymat.init_state()
+        state, _ = expr.apply(state)
+        state, _ = expr.apply(state)
+
+    benchmark(apply_twice)
+
+
+def test_combinations(benchmark, x, degree):
+    benchmark(apply, monomial_vector(x, degree))
+
+
+def test_product(benchmark, x, degree):
+    benchmark(apply, polymat.product((x,) * degree))
+
+
+def test_define_variable(benchmark, n_var):
+    benchmark(apply, polymat.define_variable("y", size=100 * n_var))
+
+
+def test_diag_of_matrix(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    benchmark(apply, p.diag(), state)
+
+
+def test_diag_of_vector(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(apply, p.diag(), state)
+
+
+def test_differentiate(benchmark, polynomial_vector):
+    state, (x, p) = polynomial_vector
+    benchmark(apply, p.diff(x), state)
+
+
+def test_evaluate(benchmark, polynomial_vector, n_var):
+    state, (_, p) = polynomial_vector
+    values = tuple(np.linspace(-1, 1, n_var))
+    benchmark(apply, p.eval({Symbol("x"): values}), state)
+
+
+def test_filter_non_zero(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(apply, p.filter_non_zero(), state)
+
+
+def test_filter_predicate(benchmark, polynomial_vector, size):
+    state, (_, p) = polynomial_vector
+    predicate = tuple(row % 2 for row in range(size))
+    benchmark(apply, p.filter_predicate(predicate), state)
+
+
+def test_get_item(benchmark, polynomial_matrices, size):
+    state, (p, _) = polynomial_matrices
+    key = (slice(0, size // 2), tuple(range(0, size, 2)))
+    benchmark(apply, p[key], state)
+
+
+def test_linear_coefficients(benchmark, polynomial_vector):
+    state, (x, p) = polynomial_vector
+    benchmark(apply, p.to_linear_coefficients(x), state)
+
+
+def test_linear_monomials(benchmark, polynomial_vector):
+    state, (x, p) = polynomial_vector
+    benchmark(apply, p.to_linear_monomials(x), state)
+
+
+def test_quadratic_coefficients(benchmark, x, n_var, degree):
+    state, (x, p) = prepare(x, random_polynomial_vector(x, n_var, 2 * degree, 1))
+    benchmark(apply, p.to_gram_matrix(x), state)
+
+
+def test_quadratic_monomials(benchmark, x, n_var, degree):
+    state, (x, p) = prepare(x, random_polynomial_vector(x, n_var, 2 * degree, 1))
+    benchmark(apply, p.to_quadratic_monomials(x), state)
+
+
+def test_rep_mat(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    benchmark(apply, p.rep_mat(3, 2), state)
+
+
+def test_reshape(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    benchmark(apply, p.reshape(-1, 1), state)
+
+
+def test_row_summation(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    benchmark(apply, p.sum(), state)
+
+
+def test_to_symmetric_matrix(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    benchmark(apply, p.symmetric(), state)
+
+
+def test_from_vector_to_symmetric_matrix(benchmark, x, n_var, degree, size):
+    n_vector = size * (size + 1) // 2
+    state, (p,) = prepare(random_polynomial_vector(x, n_var, degree, n_vector))
+    expr = init_expression(from_vector_to_symmetric_matrix(p.child, stack=tuple()))
+    benchmark(apply, expr, state)
+
+
+def test_transpose(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    benchmark(apply, p.T, state)
+
+
+def test_to_variable_vector(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(apply, p.to_variable_vector(), state)
+
+
+def test_truncate_monomials(benchmark, polynomial_vector, degree):
+    state, (x, p) = polynomial_vector
+    benchmark(apply, p.truncate_monomials(x, tuple(range(degree))), state)
+
+
+def test_assert_shape(benchmark, polynomial_vector):
+    state, (_, p) = polynomial_vector
+    benchmark(apply, p.to_monomial_vector(), state)
+
+
+# construction from data
+########################
+
+
+def test_from_any_numpy(benchmark, size, density):
+    array = random_array(size, size, density)
+    benchmark(apply, polymat.from_(array))
+
+
+def test_from_any_scipy_sparse(benchmark, size, density):
+    array = scipy.sparse.csr_array(random_array(size, size, density))
+    benchmark(apply, polymat.from_(array))
+
+
+def test_from_any_tuple(benchmark, size, density):
+    data = tuple(tuple(row) for row in random_array(size, size, density).tolist())
+    benchmark(apply, polymat.from_(data))
+
+
+def test_from_any_sympy(benchmark, n_var, degree):
+    symbols = sympy.symbols(f"y:{n_var}")
+    monomials = sympy.itermonomials(symbols, degree)
+    matrix = sympy.Matrix([[sum(i * m for i, m in enumerate(monomials))]])
+    benchmark(apply, polymat.from_(matrix))
+
+
+def test_from_numpy(benchmark, size, density):
+    array = random_array(size, size, density)
+    benchmark(apply, init_expression(init_from_numpy(array, stack=tuple())))
+
+
+def test_from_sparse_repr(benchmark, polynomial_matrices):
+    state, (p, _) = polynomial_matrices
+    _, sparse_repr = p.apply(state)
+    benchmark(apply, init_expression(init_from_sparse_repr(sparse_repr)), state)
+
+
+def test_from_variables(benchmark, n_var):
+    variables = tuple(Symbol(f"y{i}") for i in range(100 * n_var))
+    state, _ = prepare(*(polymat.define_variable(variable) for variable in variables))
+    benchmark(apply, from_variables(variables), state)
+
+
+def test_from_variable_indices(benchmark, n_var):
+    state, _ = prepare(define_variables(100 * n_var))
+    indices = tuple(range(100 * n_var))
+    benchmark(apply, polymat.from_variable_indices(indices), state)
+
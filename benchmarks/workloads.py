@@ -0,0 +1,104 @@
+"""
+Parameterized workloads shared by the benchmarks.
+
+The expressions are built outside of the timed function, such that the benchmarks
+only measure the application of an expression to a fresh state.
+"""
+
+import math
+
+import numpy as np
+
+import polymat
+from polymat.expression.expression import Expression
+from polymat.expression.init import init_expression
+from polymat.expressiontree.init import init_from_sparse_repr
+from polymat.sparserepr.sparserepr import SparseRepr
+from polymat.state import State
+
+
+N_VARIABLES = (3, 6)
+DEGREES = (1, 2)
+SIZES = (4, 12)
+DENSITIES = (0.2, 1.0)
+
+
+def define_variables(n_var: int, name: str = "x") -> Expression:
+    return polymat.define_variable(name, size=n_var)
+
+
+def n_monomials(n_var: int, degree: int) -> int:
+    """Number of monomials in `n_var` variables up to the given degree."""
+
+    return math.comb(n_var + degree, degree)
+
+
+def monomial_vector(x: Expression, degree: int) -> Expression:
+    """Vector of all monomials of `x` up to the given degree."""
+
+    return x.combinations(tuple(range(degree + 1)))
+
+
+def random_array(
+    n_row: int, n_col: int, density: float = 1.0, seed: int = 0
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    values = rng.standard_normal((n_row, n_col))
+    mask = rng.random((n_row, n_col)) < density
+    return values * mask
+
+
+def random_polynomial_vector(
+    x: Expression,
+    n_var: int,
+    degree: int,
+    n_row: int,
+    density: float = 1.0,
+    seed: int = 0,
+) -> Expression:
+    """Vector of random linear combinations of the monomials of `x`."""
+
+    coefficients = random_array(n_row, n_monomials(n_var, degree), density, seed)
+    return polymat.from_(coefficients) @ monomial_vector(x, degree)
+
+
+def random_polynomial_matrix(
+    x: Expression,
+    n_var: int,
+    degree: int,
+    size: int,
+    density: float = 1.0,
+    seed: int = 0,
+) -> Expression:
+    vector = random_polynomial_vector(x, n_var, degree, size * size, density, seed)
+    return vector.reshape(size, size)
+
+
+def materialize(sparse_repr: SparseRepr):
+    """Lazy views are only computed when their entries are accessed."""
+
+    return dict(sparse_repr.entries())
+
+
+def prepare(*exprs: Expression) -> tuple[State, tuple[Expression, ...]]:
+    """
+    Compute the operands of a benchmarked operator beforehand, such that only the
+    operator itself is timed. The returned state contains the indexed variables.
+    """
+
+    state = polymat.init_state()
+    operands = []
+
+    for expr in exprs:
+        state, sparse_repr = expr.apply(state)
+        operands.append(init_expression(init_from_sparse_repr(sparse_repr)))
+
+    return state, tuple(operands)
+
+
+def apply(expr: Expression, state: State | None = None):
+    if state is None:
+        state = polymat.init_state()
+
+    state, sparse_repr = expr.apply(state)
+    return materialize(sparse_repr)
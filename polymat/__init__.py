@@ -6,6 +6,16 @@ They all contain an abc.py exposing the interfaces that can be extended by an ex
 from polymat.state import (
     init_state as _init_state,
 )
+from polymat.utils.profiler import (
+    Profiler as _Profiler,
+)
+from polymat.utils.memoryreport import (
+    memory_report as _memory_report,
+)
+from polymat.utils.serialization import (
+    load as _load,
+    save as _save,
+)
 from polymat.expression.from_ import (
     from_ as _from_,
     from_symmetric as _from_symmetric,
@@ -14,6 +24,7 @@ from polymat.expression.from_ import (
     from_polynomial as _from_polynomial,
     from_variable_indices as _from_variable_indices,
     define_variable as _define_variable,
+    add_all as _add_all,
     block_diag as _block_diag,
     concat as _concat,
     h_stack as _h_stack,
@@ -21,8 +32,11 @@ from polymat.expression.from_ import (
     v_stack as _v_stack,
 )
 from polymat.expression.to import (
+    to_affine_arrays as _to_affine_arrays,
     to_array as _to_array,
+    to_array_chunks as _to_array_chunks,
     to_degree as _to_degree,
+    to_scipy_sparse as _to_scipy_sparse,
     to_shape as _to_shape,
     to_sparse_repr as _to_sparse_repr,
     to_sympy as _to_sympy,
@@ -31,6 +45,10 @@ from polymat.expression.to import (
 )
 
 init_state = _init_state
+Profiler = _Profiler
+memory_report = _memory_report
+load = _load
+save = _save
 
 from_ = _from_
 from_symmetric = _from_symmetric
@@ -40,14 +58,18 @@ from_polynomial = _from_polynomial
 from_variable_indices = _from_variable_indices
 define_variable = _define_variable
 
+add_all = _add_all
 block_diag = _block_diag
 concat = _concat
 h_stack = _h_stack
 product = _product
 v_stack = _v_stack
 
+to_affine_arrays = _to_affine_arrays
 to_array = _to_array
+to_array_chunks = _to_array_chunks
 to_degree = _to_degree
+to_scipy_sparse = _to_scipy_sparse
 to_shape = _to_shape
 to_sparse_repr = _to_sparse_repr
 to_sympy = _to_sympy
@@ -1,7 +1,6 @@
 from abc import abstractmethod
 from functools import cached_property
 import numpy as np
-import scipy.sparse
 import itertools
 
 from numpy.typing import NDArray
@@ -32,6 +31,8 @@ class ArrayRepr:
                 buffer = np.zeros((self.n_eq, self.n_param**degree), dtype=np.double)
 
             else:
+                import scipy.sparse
+
                 buffer = scipy.sparse.dok_array(
                     (self.n_eq, self.n_param**degree), dtype=np.double
                 )
@@ -43,16 +44,23 @@ class ArrayRepr:
     def __str__(self):
         def gen_deg_array():
             for deg, array in self.data.items():
-                if scipy.sparse.issparse(array):
-                    yield deg, array.toarray()
-                else:
+                if isinstance(array, np.ndarray):
                     yield deg, array
+                else:
+                    # scipy sparse array
+                    yield deg, array.toarray()
 
         return str(dict(gen_deg_array()))
 
     def add(self, row: int, col: int, degree: int, value: float):
         self[degree][row, col] = value
 
+    def finalize(self):
+        """Called after all entries have been added."""
+
+    def discard(self):
+        """Called if adding the entries failed."""
+
     def __call__(self, x: NDArray) -> NDArray:
         assert x.shape[1] == 1, f'{x} must be a numpy vector'
 
@@ -79,7 +87,8 @@ class ArrayRepr:
                 else:
                     yield equation @ x_powers[idx - 2]
 
-        result = sum(gen_value())
+        # an array without entries evaluates to a zero vector
+        result = sum(gen_value(), start=np.zeros((self.n_eq, 1), dtype=np.double))
 
         if self.n_row:
             return np.reshape(result, (self.n_row, -1), order='F')
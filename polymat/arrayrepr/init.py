@@ -1,8 +1,12 @@
+import json
+from pathlib import Path
+
 from numpy.typing import NDArray
 
 from dataclassabc import dataclassabc
 
 from polymat.arrayrepr.arrayrepr import ArrayRepr
+from polymat.arrayrepr.memorymapped import CSRWriter, MemoryMappedArrayRepr
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -24,3 +28,57 @@ def init_array_repr(
         n_param=n_param,
         n_row=n_row,
     )
+
+
+@dataclassabc(frozen=True, slots=True)
+class MemoryMappedArrayReprImpl(MemoryMappedArrayRepr):
+    directory: Path
+    n_eq: int
+    n_param: int
+    n_row: int | None
+    writers: dict[int, CSRWriter]
+    blocks: dict
+    chunk_size: int
+
+
+def init_memory_mapped_array_repr(
+    directory: str | Path,
+    n_eq: int,
+    n_param: int,
+    n_row: int | None = None,
+    chunk_size: int = 2**16,
+):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    return MemoryMappedArrayReprImpl(
+        directory=directory,
+        n_eq=n_eq,
+        n_param=n_param,
+        n_row=n_row,
+        writers={},
+        blocks={},
+        chunk_size=chunk_size,
+    )
+
+
+def load_memory_mapped_array_repr(
+    directory: str | Path,
+    chunk_size: int = 2**16,
+):
+    """Open the array representation written to a directory by `to_array`."""
+
+    directory = Path(directory)
+
+    with open(directory / MemoryMappedArrayRepr.METADATA) as file:
+        metadata = json.load(file)
+
+    return MemoryMappedArrayReprImpl(
+        directory=directory,
+        n_eq=metadata["n_eq"],
+        n_param=metadata["n_param"],
+        n_row=metadata["n_row"],
+        writers={},
+        blocks=MemoryMappedArrayRepr.open_blocks(directory, metadata),
+        chunk_size=chunk_size,
+    )
@@ -0,0 +1,264 @@
+from abc import abstractmethod
+import json
+from pathlib import Path
+from typing import override
+
+import numpy as np
+from numpy.typing import NDArray
+
+from polymat.arrayrepr.arrayrepr import ArrayRepr
+
+
+class CSRWriter:
+    """
+    Writes the CSR components of a degree block to files, one row after the other.
+
+    The entries of a row are buffered until an entry of a later row is added, such
+    that the rows have to be added in increasing order.
+    """
+
+    def __init__(self, directory: Path, degree: int):
+        self.paths = {
+            name: directory / f"degree_{degree}_{name}.bin"
+            for name in ("data", "indices", "indptr")
+        }
+        self.files = {}
+
+        try:
+            for name, path in self.paths.items():
+                self.files[name] = open(path, "wb")
+
+        except BaseException:
+            self.discard()
+            raise
+
+        self.nnz = 0
+        self.n_rows = 0
+        self.row_entries: dict[int, float] = {}
+
+        # indptr[0]
+        self.files["indptr"].write(np.zeros(1, dtype=np.int64).tobytes())
+
+    def _write_row(self):
+        cols = np.fromiter(self.row_entries.keys(), dtype=np.int64)
+        values = np.fromiter(self.row_entries.values(), dtype=np.double)
+        order = np.argsort(cols)
+
+        self.files["indices"].write(cols[order].tobytes())
+        self.files["data"].write(values[order].tobytes())
+
+        self.nnz += len(cols)
+        self.n_rows += 1
+        self.row_entries = {}
+
+        self.files["indptr"].write(np.array([self.nnz], dtype=np.int64).tobytes())
+
+    def _write_rows_until(self, row: int):
+        while self.n_rows < row:
+            self._write_row()
+
+    def add(self, row: int, col: int, value: float):
+        if row < self.n_rows:
+            raise AssertionError(
+                f"Row {row} cannot be added after row {self.n_rows} has been written."
+            )
+
+        self._write_rows_until(row)
+        self.row_entries[col] = value
+
+    def close(self, n_rows: int):
+        self._write_rows_until(n_rows)
+
+        for file in self.files.values():
+            file.close()
+
+    def discard(self):
+        """Close and remove the files without writing the buffered row."""
+
+        for file in self.files.values():
+            file.close()
+
+        for path in self.paths.values():
+            path.unlink(missing_ok=True)
+
+
+def _open_memmap(path: Path, dtype, size: int) -> NDArray:
+    # numpy cannot memory-map an empty file
+    if size == 0:
+        return np.zeros(0, dtype=dtype)
+
+    return np.memmap(path, dtype=dtype, mode="r", shape=(size,))
+
+
+class MemoryMappedArrayRepr(ArrayRepr):
+    """
+    Array representation whose degree blocks are stored as CSR components in
+    memory-mapped files of a directory, such that models larger than the memory
+    can be built and evaluated.
+
+    The entries are written to the files while they are added. After `finalize`
+    is called, the blocks are read from the memory-mapped files and evaluated
+    `chunk_size` rows at a time. If adding the entries fails, `discard` closes and
+    removes the files.
+    """
+
+    METADATA = "metadata.json"
+
+    @property
+    @abstractmethod
+    def directory(self) -> Path: ...
+
+    @property
+    @abstractmethod
+    def writers(self) -> dict[int, CSRWriter]:
+        """Writers of the degree blocks, empty after the array is finalized."""
+
+    @property
+    @abstractmethod
+    def blocks(self) -> dict:
+        """Memory-mapped degree blocks, filled when the array is finalized."""
+
+    @property
+    @abstractmethod
+    def chunk_size(self) -> int: ...
+
+    @property
+    @override
+    def data(self) -> dict:
+        """Memory-mapped degree blocks, empty while the entries are being added."""
+
+        return self.blocks
+
+    def _assert_finalized(self):
+        if self.writers:
+            raise AssertionError(
+                "Cannot read the entries of an array that is not finalized."
+            )
+
+    @override
+    def __getitem__(self, degree):
+        """
+        Like `ArrayRepr.__getitem__`, the blocks of degree 0 and 1 are returned as
+        dense arrays and a missing degree is returned as a block of zeros.
+        """
+
+        import scipy.sparse
+
+        self._assert_finalized()
+
+        shape = (self.n_eq, self.n_param**degree)
+
+        if degree in self.data:
+            block = self.data[degree]
+        else:
+            block = scipy.sparse.csr_array(shape, dtype=np.double)
+
+        if degree <= 1:
+            return block.toarray()
+
+        return block
+
+    @override
+    def add(self, row: int, col: int, degree: int, value: float):
+        if degree not in self.writers:
+            if self.blocks:
+                raise AssertionError("Cannot add entries to a finalized array.")
+
+            self.writers[degree] = CSRWriter(self.directory, degree)
+
+        self.writers[degree].add(row, col, value)
+
+    @override
+    def discard(self):
+        for writer in self.writers.values():
+            writer.discard()
+
+        self.writers.clear()
+
+    @override
+    def finalize(self):
+        if not self.writers:
+            return
+
+        degrees = {}
+
+        for degree, writer in self.writers.items():
+            writer.close(self.n_eq)
+            degrees[degree] = writer.nnz
+
+        self.writers.clear()
+
+        metadata = {
+            "n_eq": self.n_eq,
+            "n_param": self.n_param,
+            "n_row": self.n_row,
+            "degrees": degrees,
+        }
+
+        with open(self.directory / self.METADATA, "w") as file:
+            json.dump(metadata, file)
+
+        self.blocks.update(self.open_blocks(self.directory, metadata))
+
+    @staticmethod
+    def open_blocks(directory: Path, metadata: dict) -> dict:
+        import scipy.sparse
+
+        n_eq = metadata["n_eq"]
+        n_param = metadata["n_param"]
+
+        def gen_blocks():
+            for degree, nnz in metadata["degrees"].items():
+                degree = int(degree)
+
+                def get_path(name):
+                    return directory / f"degree_{degree}_{name}.bin"
+
+                yield degree, scipy.sparse.csr_array(
+                    (
+                        _open_memmap(get_path("data"), np.double, nnz),
+                        _open_memmap(get_path("indices"), np.int64, nnz),
+                        _open_memmap(get_path("indptr"), np.int64, n_eq + 1),
+                    ),
+                    shape=(n_eq, n_param**degree),
+                    copy=False,
+                )
+
+        return dict(gen_blocks())
+
+    @override
+    def __call__(self, x: NDArray) -> NDArray:
+        assert x.shape[1] == 1, f"{x} must be a numpy vector"
+
+        self._assert_finalized()
+
+        x = np.asarray(x, dtype=np.double).reshape(-1)
+        result = np.zeros(self.n_eq, dtype=np.double)
+
+        for degree, block in self.data.items():
+            for start in range(0, self.n_eq, self.chunk_size):
+                stop = min(start + self.chunk_size, self.n_eq)
+
+                indptr = np.asarray(block.indptr[start : stop + 1])
+                first, last = indptr[0], indptr[-1]
+
+                cols = np.asarray(block.indices[first:last])
+                values = np.array(block.data[first:last])
+
+                # the column encodes the variables of the monomial as digits of
+                # base n_param, see `ArrayRepr.to_column_indices`
+                for _ in range(degree):
+                    cols, variables = np.divmod(cols, self.n_param)
+                    values *= x[variables]
+
+                rows = np.repeat(np.arange(stop - start), np.diff(indptr))
+                result[start:stop] += np.bincount(
+                    rows, weights=values, minlength=stop - start
+                )
+
+        result = result.reshape(-1, 1)
+
+        if self.n_row:
+            return np.reshape(result, (self.n_row, -1), order="F")
+        else:
+            return result
@@ -36,7 +36,9 @@ from polymat.expressiontree.init import (
     init_rep_mat,
     init_reshape,
     init_get_item,
+    init_h_stack,
     init_row_summation,
+    init_summation,
     init_to_symmetric_matrix,
     init_transpose,
     init_truncate_monomials,
@@ -55,6 +57,8 @@ from polymat.symbol import Symbol
 
 
 class Expression(SingleChildExpressionNode, ABC):
+    is_profiled = False
+
     def __add__(self, other: FromAnyTypes):
         return self._binary(init_addition, self, other)
 
@@ -178,6 +182,16 @@ class Expression(SingleChildExpressionNode, ABC):
     def assert_polynomial(self, stack=get_frame_summary()):
         return self.copy(child=init_assert_polynomial(stack=stack, child=self))
 
+    def add_all(self, others: Iterable[Expression]):
+        stack = get_frame_summary()
+
+        return self.copy(
+            child=init_summation(
+                children=self._get_children(others, stack=stack),
+                stack=stack,
+            )
+        )
+
     def block_diag(self, others: Iterable[Expression]):
         stack = get_frame_summary()
 
@@ -250,7 +264,14 @@ class Expression(SingleChildExpressionNode, ABC):
         )
 
     def h_stack(self, others: Iterable[Expression]):
-        return self.T.v_stack((e.T for e in others)).T
+        stack = get_frame_summary()
+
+        return self.copy(
+            child=init_h_stack(
+                children=self._get_children(others, stack=stack),
+                stack=stack,
+            )
+        )
 
     def kron(self, other: Expression):
         return self.copy(child=init_kronecker(left=self.child, right=other.child))
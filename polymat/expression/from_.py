@@ -34,6 +34,11 @@ def _split_first[T: FromAnyTypes | MatrixExpression](
     return first, others  # type: ignore
 
 
+def add_all(expressions: Iterable[MatrixExpression]) -> MatrixExpression:
+    first, others = _split_first(expressions)
+    return first.add_all(others=others)
+
+
 def block_diag(expressions: Iterable[MatrixExpression]) -> MatrixExpression:
     first, others = _split_first(expressions)
     return first.block_diag(others=others)
@@ -90,7 +95,8 @@ def from_variable_indices(indices: tuple[int, ...]):
 
 
 def h_stack(expressions: Iterable[MatrixExpression]) -> MatrixExpression:
-    return v_stack((expr.T for expr in expressions)).T
+    first, others = _split_first(expressions)
+    return first.h_stack(others=others)
 
 
 def product(
@@ -1,5 +1,7 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
 from numpy.typing import NDArray
-import sympy
 
 from statemonad.typing import StateMonad
 
@@ -7,9 +9,12 @@ from polymat.arrayrepr.arrayrepr import ArrayRepr
 from polymat.symbol import Symbol
 from polymat.state import State
 from polymat.expressiontree.to import (
+    to_affine_arrays as _to_affine_arrays,
     to_array as _to_array,
+    to_array_chunks as _to_array_chunks,
     to_degree as _to_degree,
     to_numpy as _to_numpy,
+    to_scipy_sparse as _to_scipy_sparse,
     to_shape as _to_shape,
     to_sparse_repr as _to_sparse_repr,
     to_sympy as _to_sympy,
@@ -22,13 +27,42 @@ from polymat.expression.typedexpressions import (
     VariableVectorExpression,
 )
 
+if TYPE_CHECKING:
+    import sympy
+
+
+def to_affine_arrays(
+    expr: MatrixExpression,
+    variables: VariableVectorExpression | tuple[int, ...],
+    format: str = "csc",
+    b_out: NDArray | None = None,
+    a_out: NDArray | None = None,
+):
+    return _to_affine_arrays(
+        expr.child,
+        variables,
+        format=format,
+        b_out=b_out,
+        a_out=a_out,
+    )
+
 
 def to_array(
     expr: MatrixExpression,
     variables: VariableVectorExpression | tuple[int, ...],
     name: str | None = None,
+    directory: str | Path | None = None,
 ) -> StateMonad[State, ArrayRepr]:
-    return _to_array(expr.child, variables, name=name)
+    return _to_array(expr.child, variables, name=name, directory=directory)
+
+
+def to_array_chunks(
+    expr: MatrixExpression,
+    variables: VariableVectorExpression | tuple[int, ...],
+    chunk_size: int,
+    name: str | None = None,
+) -> StateMonad[State, Iterator[ArrayRepr]]:
+    return _to_array_chunks(expr.child, variables, chunk_size=chunk_size, name=name)
 
 
 def to_degree(
@@ -38,8 +72,24 @@ def to_degree(
     return _to_degree(expr.child, variables)
 
 
-def to_numpy(expr: MatrixExpression) -> StateMonad[State, NDArray]:
-    return _to_numpy(expr.child)
+def to_numpy(
+    expr: MatrixExpression, assert_constant: bool = True
+) -> StateMonad[State, NDArray]:
+    return _to_numpy(expr.child, assert_constant=assert_constant)
+
+
+def to_scipy_sparse(
+    expr: MatrixExpression,
+    format: str = "csr",
+    per_monomial: bool = False,
+    assert_constant: bool = True,
+):
+    return _to_scipy_sparse(
+        expr.child,
+        format=format,
+        per_monomial=per_monomial,
+        assert_constant=assert_constant,
+    )
 
 
 def to_shape(expr: MatrixExpression) -> StateMonad[State, tuple[int, int]]:
@@ -50,8 +100,11 @@ def to_sparse_repr(expr: MatrixExpression):
     return _to_sparse_repr(expr.child)
 
 
-def to_sympy(expr: MatrixExpression) -> StateMonad[State, sympy.Expr]:
-    return _to_sympy(expr.child)
+def to_sympy(
+    expr: MatrixExpression,
+    sparse: bool = False,
+) -> StateMonad[State, "sympy.Expr"]:
+    return _to_sympy(expr.child, sparse=sparse)
 
 
 def to_tuple(
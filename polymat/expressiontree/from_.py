@@ -1,21 +1,29 @@
+from typing import TYPE_CHECKING, Union
+
 import numpy as np
 from numpy.typing import NDArray
-import sympy
 
-from polymat.expressiontree.init import init_from_any
+from polymat.expressiontree.init import init_from_any, init_from_numpy
 from polymat.expressiontree.nodes import ExpressionNode
 from polymat.expressiontree.operations.fromany import FromAny
 from polymat.utils.getstacklines import FrameSummary
+from polymat.utils.lazyimport import is_scipy_sparse, is_sympy_instance
+
+if TYPE_CHECKING:
+    import scipy.sparse
+    import sympy
 
 
 # Types that can be converted to an Expression
-FromAnyTypes = (
-    FromAny.ValueType
-    | NDArray
-    | sympy.Matrix
-    | tuple[FromAny.ValueType, ...]
-    | tuple[tuple[FromAny.ValueType, ...], ...]
-)
+FromAnyTypes = Union[
+    FromAny.ValueType,
+    NDArray,
+    "scipy.sparse.sparray",
+    "scipy.sparse.spmatrix",
+    "sympy.Matrix",
+    tuple[FromAny.ValueType, ...],
+    tuple[tuple[FromAny.ValueType, ...], ...],
+]
 
 
 def from_any_or_none(
@@ -29,30 +37,27 @@ def from_any_or_none(
         wrapped = ((value,),)
         return init_from_any(wrapped, stack=stack)
 
-    elif isinstance(value, np.ndarray):
+    elif isinstance(value, np.ndarray) or is_scipy_sparse(value):
         # Case when it is a (n,) array
         if len(value.shape) != 2:
             value = value.reshape(-1, 1)
 
-        # if value.dtype == np.object_ or True:
+        # numeric arrays are converted without iterating over their elements
+        if is_scipy_sparse(value) or value.dtype.kind in "biuf":
+            return init_from_numpy(value, stack=stack)
 
         def gen_elements():
             for row in value:
-                if isinstance(row, np.ndarray):
-                    yield tuple(row)
-                else:
-                    yield (row,)
+                yield tuple(row)
 
         return init_from_any(tuple(gen_elements()), stack=stack)
-        # else:
-        #     return init_from_numpy(value)
 
-    elif isinstance(value, sympy.Matrix):
+    elif is_sympy_instance(value, "Matrix"):
         data = tuple(tuple(v for v in value.row(row)) for row in range(value.rows))
         return init_from_any(data, stack)
 
-    elif isinstance(value, sympy.Expr):
-        data = ((sympy.expand(value),),)
+    elif is_sympy_instance(value, "Expr"):
+        data = ((value.expand(),),)
         return init_from_any(data, stack)
 
     elif isinstance(value, tuple):
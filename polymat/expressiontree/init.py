@@ -1,5 +1,5 @@
+import numpy as np
 from dataclassabc import dataclassabc
-from numpy.typing import NDArray
 
 from polymat.expressiontree.data.variables import VariableType
 from polymat.expressiontree.operations.assertshape import AssertShape
@@ -19,6 +19,7 @@ from polymat.expressiontree.operations.fromvariableindices import (
     FromVariableIndices,
 )
 from polymat.expressiontree.operations.fromvariables import FromVariables
+from polymat.expressiontree.operations.horizontalstack import HorizontalStack
 from polymat.expressiontree.operations.kronecker import Kronecker
 from polymat.expressiontree.operations.linearcoefficients import LinearCoefficients
 from polymat.expressiontree.operations.linearmonomials import (
@@ -39,10 +40,11 @@ from polymat.expressiontree.operations.tosymmetricmatrix import ToSymmetricMatri
 from polymat.expressiontree.operations.fromvectortosymmetricmatrix import (
     FromVectorToSymmetricMatrix,
 )
+from polymat.expressiontree.operations.summation import Summation
 from polymat.expressiontree.operations.tovariablevector import (
     ToVariableVector,
 )
-from polymat.expressiontree.nodes import ExpressionNode
+from polymat.expressiontree.nodes import ExpressionNode, MultiChildrenExpressionNode
 from polymat.expressiontree.operations.addition import Addition
 from polymat.expressiontree.operations.combinations import (
     Combinations,
@@ -124,8 +126,27 @@ class BlockDiagonalImpl(BlockDiagonal):
     children: tuple[ExpressionNode, ...]
 
 
+def _flatten_children(
+    children: tuple[ExpressionNode, ...],
+    node_type: type[MultiChildrenExpressionNode],
+) -> tuple[ExpressionNode, ...]:
+    """
+    Replace the children that are themselves stacks of the same kind by their
+    children, such that building a stack incrementally results in a single node.
+    """
+
+    def gen_children():
+        for child in children:
+            if isinstance(child, node_type):
+                yield from child.children
+            else:
+                yield child
+
+    return tuple(gen_children())
+
+
 def init_block_diagonal(children: tuple[ExpressionNode, ...]):
-    return BlockDiagonalImpl(children=children)
+    return BlockDiagonalImpl(children=_flatten_children(children, BlockDiagonal))
 
 
 @dataclassabc(frozen=True, repr=False)
@@ -279,13 +300,33 @@ def init_filter_non_zero(
     )
 
 
-@dataclassabc(frozen=True, slots=True)
+@dataclassabc(frozen=True, slots=True, eq=False)
 class FromNumpyImpl(FromNumpy):
-    data: NDArray
+    data: FromNumpy.ArrayType
+    stack: tuple[FrameSummary, ...]
+
+    # arrays are not hashable, the expression is compared by identity instead
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return id(self)
+
 
+def init_from_numpy(
+    data: FromNumpy.ArrayType,
+    stack: tuple[FrameSummary, ...],
+):
+    # the array is not copied, a read-only view prevents the expression from
+    # modifying it
+    if isinstance(data, np.ndarray):
+        data = data.view()
+        data.flags.writeable = False
 
-def init_from_numpy(data: NDArray):
-    return FromNumpyImpl(data=data)
+    return FromNumpyImpl(
+        data=data,
+        stack=stack,
+    )
 
 
 @dataclassabc(frozen=True, repr=False)
@@ -331,6 +372,22 @@ def init_from_variable_indices(indices: tuple[int, ...]):
     return FromVariableIndicesImpl(indices=indices)
 
 
+@dataclassabc(frozen=True, repr=False)
+class HorizontalStackImpl(HorizontalStack):
+    children: tuple[ExpressionNode, ...]
+    stack: tuple[FrameSummary, ...]
+
+
+def init_h_stack(
+    children: tuple[ExpressionNode, ...],
+    stack: tuple[FrameSummary, ...],
+):
+    return HorizontalStackImpl(
+        children=_flatten_children(children, HorizontalStack),
+        stack=stack,
+    )
+
+
 @dataclassabc(frozen=True, slots=True)
 class KroneckerImpl(Kronecker):
     left: ExpressionNode
@@ -536,6 +593,19 @@ def init_reshape(
     return ReshapeImpl(child=child, new_shape=new_shape)
 
 
+@dataclassabc(frozen=True, repr=False)
+class SummationImpl(Summation):
+    children: tuple[ExpressionNode, ...]
+    stack: tuple[FrameSummary, ...]
+
+
+def init_summation(
+    children: tuple[ExpressionNode, ...],
+    stack: tuple[FrameSummary, ...],
+):
+    return SummationImpl(children=children, stack=stack)
+
+
 @dataclassabc(frozen=True, slots=True)
 class ToVariableVectorImpl(ToVariableVector):
     child: ExpressionNode
@@ -579,4 +649,7 @@ def init_v_stack(
     children: tuple[ExpressionNode, ...],
     stack: tuple[FrameSummary, ...],
 ):
-    return VerticalStackImpl(children=children, stack=stack)
+    return VerticalStackImpl(
+        children=_flatten_children(children, VerticalStack),
+        stack=stack,
+    )
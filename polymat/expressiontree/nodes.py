@@ -1,13 +1,256 @@
 from abc import abstractmethod
-from itertools import accumulate
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+from itertools import batched
+from typing import Callable, Iterable
 
 from statemonad.abc import StateMonadNode
 
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.init import init_from_polynomial_matrix
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
+from polymat.utils.profiler import Profiler
 
 
-class ExpressionNode(StateMonadNode[State, SparseRepr]): ...
+_pending_results: ContextVar[dict[int, deque[SparseRepr]] | None] = ContextVar(
+    "pending_results", default=None
+)
+
+
+def _is_driven(node) -> bool:
+    return hasattr(type(node).apply, "raw_apply")
+
+
+def _drive(root: "ExpressionNode", state: State) -> tuple[State, SparseRepr]:
+    """
+    Apply an expression tree without recursion.
+
+    The operands of each node are applied before the node, in post-order using an
+    explicit stack, which threads the state exactly like the recursive evaluation.
+    Their results are kept until the node calls `apply` on its operands, which then
+    returns the pending result instead of evaluating the operand again.
+
+    If the state provides an executor, the operands of nodes that apply them
+    concurrently are left to the node. If it provides a profiler, a node is recorded
+    from the time its operands start being applied until it returns, such that the
+    records are nested like in the recursive evaluation.
+    """
+
+    pending = {}
+    token = _pending_results.set(pending)
+
+    profiler = state.profiler
+    profiler_depth = None if profiler is None else profiler.depth
+
+    try:
+        stack = [(root, False)]
+
+        while stack:
+            node, is_expanded = stack.pop()
+
+            if not is_expanded:
+                if profiler is not None:
+                    profiler.enter(node)
+
+                if state.executor is not None and node.applies_operands_concurrently:
+                    operands = tuple()
+                else:
+                    operands = tuple(op for op in node.operands() if _is_driven(op))
+
+                if operands:
+                    stack.append((node, True))
+                    stack.extend((op, False) for op in reversed(operands))
+                    continue
+
+            state, result = type(node).apply.raw_apply(node, state)
+
+            if profiler is not None:
+                profiler.exit(result)
+
+            if id(node) in pending:
+                pending[id(node)].append(result)
+            else:
+                pending[id(node)] = deque((result,))
+
+        return state, pending[id(root)].popleft()
+
+    except BaseException:
+        # stop recording the nodes that did not return
+        if profiler is not None:
+            while profiler_depth < profiler.depth:
+                profiler.exit()
+
+        raise
+
+    finally:
+        _pending_results.reset(token)
+
+
+def _wrap_apply(apply):
+    @wraps(apply)
+    def driven_apply(self, state: State):
+        pending = _pending_results.get()
+
+        if pending is not None and pending.get(id(self)):
+            return state, pending[id(self)].popleft()
+
+        return _drive(self, state)
+
+    driven_apply.raw_apply = apply
+    return driven_apply
+
+
+class ExpressionNode(StateMonadNode[State, SparseRepr]):
+    # set to False for nodes that only delegate to their child
+    is_profiled = True
+
+    # set to True for nodes that apply their operands using `apply_nodes`
+    applies_operands_concurrently = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # evaluates the expression tree without recursion, and records the calls of
+        # apply if the state provides a profiler
+        if "apply" in cls.__dict__ and cls.__dict__.get("is_profiled", True):
+            cls.apply = _wrap_apply(cls.__dict__["apply"])
+
+    def operands(self) -> tuple["ExpressionNode", ...]:
+        """
+        Nodes that `apply` applies first and exactly once, in this order. Nodes that
+        apply a child conditionally return an empty tuple.
+        """
+
+        return tuple()
+
+
+def _apply_node(node: ExpressionNode, state: State):
+    return node.apply(state=state)
+
+
+def _renumber_indices(
+    sparse_repr: SparseRepr, index_map: dict[int, int]
+) -> SparseRepr:
+    # the renumbering preserves the order of the indices, hence the monomials
+    # stay sorted
+    def renumber_monomial(monomial):
+        return tuple((index_map.get(index, index), power) for index, power in monomial)
+
+    data = {
+        entry: {
+            renumber_monomial(monomial): value
+            for monomial, value in polynomial.items()
+        }
+        for entry, polynomial in sparse_repr.entries()
+    }
+
+    return init_from_polynomial_matrix(data=data, shape=sparse_repr.shape)
+
+
+def apply_nodes(
+    state: State, nodes: tuple[ExpressionNode, ...]
+) -> tuple[State, tuple[SparseRepr, ...]]:
+    """
+    Apply independent expression nodes one after the other.
+
+    If the state provides an executor, the nodes are applied concurrently starting from
+    the same state. The resulting states are then merged in the order of the nodes, and
+    the variables indexed by a node are renumbered like in a sequential evaluation. A
+    node whose indices cannot be renumbered is applied again on the merged state, such
+    that the result does not depend on the scheduling.
+
+    If the state provides a profiler, each node is recorded by its own profiler within
+    the worker, whose records are then merged into the profiler of the state.
+    """
+
+    if state.executor is None or len(nodes) < 2:
+
+        children = []
+
+        for node in nodes:
+            state, child = node.apply(state=state)
+            children.append(child)
+
+        return state, tuple(children)
+
+    # nested nodes are applied sequentially within the workers
+    worker_state = state.copy(executor=None, profiler=None)
+
+    def init_worker_state():
+        if state.profiler is None:
+            return worker_state
+        else:
+            return worker_state.copy(profiler=Profiler())
+
+    futures = tuple(
+        state.executor.submit(_apply_node, node, init_worker_state()) for node in nodes
+    )
+
+    children = []
+
+    for node, future in zip(nodes, futures):
+        node_state, child = future.result()
+
+        merged = state.merge(node_state)
+
+        if merged is None:
+            state, child = node.apply(state=state)
+
+        else:
+            state, index_map = merged
+
+            if state.profiler is not None:
+                state.profiler.merge(node_state.profiler)
+
+            if index_map:
+                child = _renumber_indices(child, index_map)
+
+        children.append(child)
+
+    return state, tuple(children)
+
+
+def _map_polynomials_chunk(func, chunk):
+    return tuple((index, func(*args)) for index, args in chunk)
+
+
+def map_polynomials(
+    state: State,
+    func: Callable[..., MaybePolynomialType],
+    tasks: Iterable[tuple[MatrixIndexType, tuple]],
+    chunk_size: int = 512,
+) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+    """
+    Compute the entries of a polynomial matrix by calling `func` with the arguments
+    of each task, and skip the zero entries.
+
+    If the state provides an executor, the tasks are partitioned into chunks that are
+    computed by the executor. For a process pool, `func` needs to be a module-level
+    function and each chunk is pickled once, such that polynomials shared among the
+    tasks of a chunk are transferred only once.
+    """
+
+    if state.executor is None:
+        for index, args in tasks:
+            result = func(*args)
+
+            if result:
+                yield index, result
+
+        return
+
+    futures = tuple(
+        state.executor.submit(_map_polynomials_chunk, func, chunk)
+        for chunk in batched(tasks, chunk_size)
+    )
+
+    for future in futures:
+        for index, result in future.result():
+            if result:
+                yield index, result
 
 
 class SingleChildExpressionNode(
@@ -17,6 +260,9 @@ class SingleChildExpressionNode(
     @abstractmethod
     def child(self) -> ExpressionNode: ...
 
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        return (self.child,)
+
 
 class TwoChildrenExpressionNode(
     ExpressionNode,
@@ -29,21 +275,26 @@ class TwoChildrenExpressionNode(
     @abstractmethod
     def right(self) -> ExpressionNode: ...
 
+    applies_operands_concurrently = True
+
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        return (self.left, self.right)
+
+    def apply_children(self, state: State):
+        state, (left, right) = apply_nodes(state, (self.left, self.right))
+
+        return state, left, right
+
 
 class MultiChildrenExpressionNode(ExpressionNode):
     @property
     @abstractmethod
     def children(self) -> tuple[ExpressionNode, ...]: ...
 
-    def apply_children(self, state: State):
-        def acc_children(acc, next):
-            state, children = acc
-
-            state, child = next.apply(state=state)
-            return state, children + (child,)
+    applies_operands_concurrently = True
 
-        *_, (state, children) = accumulate(
-            self.children, acc_children, initial=(state, tuple())
-        )
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        return self.children
 
-        return state, children
+    def apply_children(self, state: State):
+        return apply_nodes(state, self.children)
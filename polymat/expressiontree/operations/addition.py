@@ -1,16 +1,19 @@
+from functools import cached_property
+from typing import override
+
+from polymat.expressiontree.nodes import ExpressionNode, apply_nodes
 from polymat.expressiontree.operations.elementwiseopmixin import ElementwiseOpMixin
-from polymat.sparserepr.data.polynomial import (
-    MaybePolynomialType,
-    add_maybe_polynomials,
+from polymat.expressiontree.operations.summation import (
+    add_sparse_reprs,
+    flatten_summands,
 )
+from polymat.sparserepr.data.polynomial import add_maybe_polynomials
+from polymat.sparserepr.sparserepr import SparseRepr
+from polymat.state import State
 
 
 class Addition(ElementwiseOpMixin):
-    @staticmethod
-    def operator(
-        left: MaybePolynomialType, right: MaybePolynomialType
-    ) -> MaybePolynomialType:
-        return add_maybe_polynomials(left, right)
+    operator = staticmethod(add_maybe_polynomials)
 
     @property
     def operator_name(self) -> str:
@@ -19,3 +22,22 @@ class Addition(ElementwiseOpMixin):
     @property
     def is_addition(self) -> bool:
         return True
+
+    @cached_property
+    def summands(self) -> tuple[tuple[ExpressionNode, int], ...]:
+        return flatten_summands((self.left, self.right))
+
+    @override
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        return tuple(node for node, _ in self.summands)
+
+    @override
+    def apply(self, state: State) -> tuple[State, SparseRepr]:
+        # the summands of a chain of additions are accumulated in a single pass
+        state, summands = apply_nodes(state, self.operands())
+
+        return state, add_sparse_reprs(
+            summands,
+            stack=self.stack,
+            multiplicities=tuple(m for _, m in self.summands),
+        )
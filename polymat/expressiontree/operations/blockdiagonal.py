@@ -43,4 +43,5 @@ class BlockDiagonal(MultiChildrenExpressionNode):
             children=children,
             shape=(row_range.stop, col_range.stop),
             row_col_ranges=row_col_ranges,
+            policy=state.materialization_policy,
         )
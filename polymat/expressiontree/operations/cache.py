@@ -6,7 +6,7 @@ from polymat.sparserepr.operations.frompolynomialmixin import (
 )
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
-from polymat.expressiontree.nodes import SingleChildExpressionNode
+from polymat.expressiontree.nodes import ExpressionNode, SingleChildExpressionNode
 from polymat.utils.getstacklines import FrameSummaryMixin, to_operator_traceback
 
 
@@ -16,11 +16,15 @@ class Cache(FrameSummaryMixin, SingleChildExpressionNode):
     def __str__(self):
         return str(self.child)
 
+    @override
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        # the child is not applied if the result is cached
+        return tuple()
+
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         try:
-            if self in state.cache:
-                return state, state.cache[self]
+            is_cached = self in state.cache
         except TypeError:
             raise TypeError(
                 to_operator_traceback(
@@ -29,6 +33,12 @@ class Cache(FrameSummaryMixin, SingleChildExpressionNode):
                 )
             )
 
+        if state.profiler is not None:
+            state.profiler.mark_cache(is_cached)
+
+        if is_cached:
+            return state, state.cache[self]
+
         state, child = self.child.apply(state)
 
         if isinstance(child, FromPolynomialMatrixMixin):
@@ -32,18 +32,25 @@ class Diagonal(FrameSummaryMixin, SingleChildExpressionNode):
             # Vector to diagonal matrix
             case (n_row, 1):
                 return state, init_diag_matrix_from_vec_sparse_repr(
-                    child=child, shape=(n_row, n_row)
+                    child=child,
+                    shape=(n_row, n_row),
+                    policy=state.materialization_policy,
                 )
             case (1, n_col):
                 return state, init_diag_matrix_from_vec_sparse_repr(
-                    child=init_transpose_sparse_repr(child), 
-                    shape=(n_col, n_col)
+                    child=init_transpose_sparse_repr(
+                        child, policy=state.materialization_policy
+                    ),
+                    shape=(n_col, n_col),
+                    policy=state.materialization_policy,
                 )
 
             # Diagonal matrix to vector
             case (n_row, n_col) if n_row == n_col:
                 return state, init_vec_from_diag_matrix_sparse_repr(
-                    child=child, shape=(n_row, 1)
+                    child=child,
+                    shape=(n_row, 1),
+                    policy=state.materialization_policy,
                 )
             
             case _:
@@ -1,14 +1,9 @@
 from polymat.expressiontree.operations.elementwiseopmixin import ElementwiseOpMixin
-from polymat.sparserepr.data.polynomial import MaybePolynomialType, multiply_polynomials
+from polymat.sparserepr.data.polynomial import multiply_maybe_polynomials
 
 
 class ElementwiseMult(ElementwiseOpMixin):
-    @staticmethod
-    def operator(
-        left: MaybePolynomialType, right: MaybePolynomialType
-    ) -> MaybePolynomialType:
-        if left and right:
-            return multiply_polynomials(left, right)
+    operator = staticmethod(multiply_maybe_polynomials)
 
     @property
     def operator_name(self) -> str:
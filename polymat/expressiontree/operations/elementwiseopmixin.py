@@ -2,7 +2,7 @@ from abc import abstractmethod
 
 from typing_extensions import override
 
-from polymat.expressiontree.nodes import TwoChildrenExpressionNode
+from polymat.expressiontree.nodes import TwoChildrenExpressionNode, map_polynomials
 from polymat.sparserepr.data.polynomial import MaybePolynomialType
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
@@ -27,6 +27,8 @@ class ElementwiseOpMixin(FrameSummaryMixin, TwoChildrenExpressionNode):
     def __str__(self):
         return f"{self.operator_name}({self.left}, {self.right})"
 
+    # A module-level function, such that an executor with a process pool pickles
+    # it by reference instead of the expression
     @staticmethod
     @abstractmethod
     def operator(
@@ -43,23 +45,19 @@ class ElementwiseOpMixin(FrameSummaryMixin, TwoChildrenExpressionNode):
 
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
-        state, left = self.left.apply(state=state)
-        state, right = self.right.apply(state=state)
+        state, left, right = self.apply_children(state)
 
         def single_element_operation(left, right):
             left_polynomial = left.at(0, 0)
 
             if left_polynomial:
 
-                def gen_polynomial_matrix():
+                def gen_tasks():
                     for index, right_polynomial in right.entries():
-                        result = self.operator(right_polynomial, left_polynomial)
-
-                        if result:
-                            yield index, result
+                        yield index, (right_polynomial, left_polynomial)
 
                 return init_sparse_repr_from_iterable(
-                    gen_polynomial_matrix(), right.shape
+                    map_polynomials(state, self.operator, gen_tasks()), right.shape
                 )
 
             elif self.is_addition:
@@ -100,19 +98,16 @@ class ElementwiseOpMixin(FrameSummaryMixin, TwoChildrenExpressionNode):
                         )
                     )
 
-                def gen_polynomial_matrix():
+                def gen_tasks():
                     for row in range(n_rows):
                         for col in range(n_cols):
                             left_polynomial = left.at(row=row, col=col)
                             right_polynomial = right.at(row=row, col=col)
 
-                            result = self.operator(left_polynomial, right_polynomial)
-
-                            if result:
-                                yield (row, col), result
+                            yield (row, col), (left_polynomial, right_polynomial)
 
                 sparse_repr = init_sparse_repr_from_iterable(
-                    gen_polynomial_matrix(), left.shape
+                    map_polynomials(state, self.operator, gen_tasks()), left.shape
                 )
 
         return state, sparse_repr
@@ -1,18 +1,14 @@
 from abc import abstractmethod
 import itertools
-from typing import Iterable, override
-
-from polymat.sparserepr.data.monomial import PowerVariableType, MonomialType
-from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
-from polymat.sparserepr.data.polynomial import (
-    CoefficientType,
-    PolynomialType,
-    add_polynomial_terms_iterable,
-)
+from typing import override
+
+import numpy as np
+
+from polymat.sparserepr.data.substitution import prepare_substitution
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
-from polymat.expressiontree.nodes import SingleChildExpressionNode
-from polymat.sparserepr.init import init_sparse_repr_from_iterable
+from polymat.expressiontree.nodes import ExpressionNode, SingleChildExpressionNode
+from polymat.sparserepr.init import init_from_polynomial_matrix
 from polymat.utils.getstacklines import (
     FrameSummaryMixin,
     to_operator_traceback,
@@ -30,9 +26,30 @@ class Evaluate(FrameSummaryMixin, SingleChildExpressionNode):
     def __str__(self):
         return f"eval({self.child}, {self.substitutions})"
 
+    @override
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        # the child is not applied if the result is cached
+        return tuple()
+
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
-        state, child = self.child.apply(state=state)
+        # The symbolic structure of the substitution does not depend on the values.
+        # It is kept in the cache, such that evaluating the same expression with
+        # new values does not reprocess the child polynomial matrix.
+        key = (Evaluate, self.child, tuple(symbol for symbol, _ in self.substitutions))
+
+        try:
+            cached = state.cache.get(key)
+        except TypeError:
+            # unhashable polynomial expression
+            key = None
+            cached = None
+
+        if key is not None and state.profiler is not None:
+            state.profiler.mark_cache(cached is not None)
+
+        if cached is None:
+            state, child = self.child.apply(state=state)
 
         def acc_indices_and_values(
             acc: tuple[State, dict[int, float]], next: tuple[Symbol, tuple[float, ...]]
@@ -71,44 +88,26 @@ class Evaluate(FrameSummaryMixin, SingleChildExpressionNode):
             initial=(state, {}),
         )
 
-        def gen_polynomial_matrix() -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
-            for index, polynomial in child.entries():
-
-                def gen_polynomial_data() -> (
-                    Iterable[tuple[MonomialType, CoefficientType]]
-                ):
-                    for monomial, coeff in polynomial.items():
-
-                        def acc_monomial(
-                            acc: tuple[MonomialType, CoefficientType],
-                            power_var: PowerVariableType,
-                        ):
-                            monomial, coeff = acc
-                            index, power = power_var
-
-                            if index in index_value_map:
-                                new_coeff = coeff * index_value_map[index] ** power
-                                return monomial, new_coeff
-
-                            else:
-                                return monomial + (power_var,), coeff
-
-                        *_, (eval_monomial, eval_coeff) = tuple(
-                            itertools.accumulate(
-                                monomial,
-                                acc_monomial,
-                                initial=(tuple(), coeff),
-                            )
-                        )
+        if cached is None:
+            prepared = prepare_substitution(
+                entries=child.entries(),
+                indices=tuple(index_value_map.keys()),
+            )
+            shape = child.shape
 
-                        yield eval_monomial, eval_coeff
+            if key is not None:
+                state = state.copy(cache=state.cache | {key: (prepared, shape)})
 
-                result = add_polynomial_terms_iterable(terms=gen_polynomial_data())
+        else:
+            prepared, shape = cached
 
-                if result:
-                    yield index, result
+        values = np.fromiter(
+            (index_value_map[index] for index in prepared.indices),
+            dtype=np.double,
+            count=len(prepared.indices),
+        )
 
-        return state, init_sparse_repr_from_iterable(
-            data=gen_polynomial_matrix(),
-            shape=child.shape,
+        return state, init_from_polynomial_matrix(
+            data=prepared.substitute(values),
+            shape=shape,
         )
@@ -1,12 +1,10 @@
 from abc import abstractmethod
-from itertools import accumulate
 import math
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import override
 
 import numpy as np
-import sympy
-from sympy.polys.polyerrors import GeneratorsNeeded
 
 from polymat.expressiontree.nodes import ExpressionNode
 from polymat.sparserepr.data.monomial import sort_monomial
@@ -20,10 +18,14 @@ from polymat.utils.getstacklines import (
     to_operator_traceback,
 )
 from polymat.symbol import Symbol
+from polymat.utils.lazyimport import is_sympy_instance
+
+if TYPE_CHECKING:
+    import sympy
 
 
 class FromAny(FrameSummaryMixin, ExpressionNode):
-    ValueType = float | int | np.number | sympy.Expr | ExpressionNode
+    ValueType = Union[float, int, np.number, "sympy.Expr", ExpressionNode]
 
     def __str__(self):
         if len(self.data) == 1:
@@ -44,115 +46,133 @@ class FromAny(FrameSummaryMixin, ExpressionNode):
 
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
-        def acc_polynomial_matrix_data(
-            acc: tuple[State, tuple[tuple[MatrixIndexType, PolynomialType], ...]],
-            next: tuple[int, int, FromAny.ValueType],
-        ):
-            state, data = acc
-            row, col, entry = next
+        data: dict[MatrixIndexType, PolynomialType | None] = {}
 
-            matrix_index = (row, col)
+        # sympy expressions are converted together after collecting all entries
+        sympy_entries: list[tuple[MatrixIndexType, "sympy.Expr"]] = []
 
-            match entry:
-                case ExpressionNode():
-                    state, instance = entry.apply(state)
+        for row, row_data in enumerate(self.data):
+            for col, entry in enumerate(row_data):
+                matrix_index = (row, col)
 
-                    if not (instance.shape == (1, 1)):
-                        raise AssertionError(
-                            to_operator_traceback(
-                                message=f"{instance.shape=} is not (1, 1)",
-                                stack=self.stack,
+                match entry:
+                    case ExpressionNode():
+                        state, instance = entry.apply(state)
+
+                        if not (instance.shape == (1, 1)):
+                            raise AssertionError(
+                                to_operator_traceback(
+                                    message=f"{instance.shape=} is not (1, 1)",
+                                    stack=self.stack,
+                                )
                             )
-                        )
 
-                    entry = instance.at(0, 0)
+                        entry = instance.at(0, 0)
 
-                    if entry:
-                        data = data + ((matrix_index, entry),)
+                        if entry:
+                            data[matrix_index] = entry
 
-                    return state, data
+                        continue
 
-                case bool() | np.bool_():
-                    value = int(entry)
+                    case bool() | np.bool_():
+                        value = int(entry)
 
-                case np.number():
-                    value = float(entry)
+                    case np.number():
+                        value = float(entry)
 
-                case _:
-                    value = entry
+                    case _:
+                        value = entry
 
-            match value:
-                case int() | float():
-                    if math.isclose(value, 0):
-                        return state, data
+                match value:
+                    case int() | float():
+                        if not math.isclose(value, 0):
+                            data[matrix_index] = constant_polynomial(value)
 
-                    polynomial = constant_polynomial(value)
+                    case _ if is_sympy_instance(value, "Expr"):
+                        # reserve the position to keep the entries in row major order
+                        data[matrix_index] = None
+                        sympy_entries.append((matrix_index, value))
 
-                case sympy.Expr():
-                    try:
-                        sympy_poly = sympy.poly(value)
+                    case _:
+                        raise AssertionError(
+                            to_operator_traceback(
+                                message=f"unknown data type {type(value)=}",
+                                stack=self.stack,
+                            )
+                        )
 
-                    except GeneratorsNeeded:
-                        if math.isclose(value, 0):
-                            return state, data
+        if sympy_entries:
+            state = self._convert_sympy_entries(state, sympy_entries, data)
 
-                        polynomial = constant_polynomial(float(value))
+        return state, init_from_polynomial_matrix(
+            data=data,  # type: ignore
+            shape=(len(self.data), len(self.data[0])),
+        )
+
+    def _convert_sympy_entries(
+        self,
+        state: State,
+        entries: list[tuple[MatrixIndexType, "sympy.Expr"]],
+        data: dict[MatrixIndexType, PolynomialType | None],
+    ) -> State:
+        """
+        Convert the sympy expressions to polynomials sharing a single set of generators,
+        and register their variables in one batch.
+        """
+
+        from sympy.polys.polyutils import parallel_dict_from_expr
+
+        # sympy.Poly is not constructed, because its dense representation is
+        # expensive for many generators
+        # a5 x1 x3**2 -> c=a5, m_cnt=(1, 0, 2)
+        terms, gens = parallel_dict_from_expr(tuple(value for _, value in entries))
+
+        # the variables are indexed in the order of their first appearance
+        used_gens = {}
+
+        for poly_terms in terms:
+            used = {
+                gen_index
+                for variable_powers in poly_terms
+                for gen_index, power in enumerate(variable_powers)
+                if 0 < power
+            }
+
+            for gen_index in sorted(used):
+                used_gens[gen_index] = None
+
+        state, index_ranges = state.register_all(
+            symbols=((Symbol(str(gens[gen_index])), 1) for gen_index in used_gens),
+            stack=self.stack,
+        )
 
-                    except ValueError:
-                        raise ValueError(f"{value=}")
+        indices = [None] * len(gens)
+        for gen_index, index_range in zip(used_gens, index_ranges):
+            indices[gen_index] = index_range.start
 
-                    else:
-                        for symbol in sympy_poly.gens:
-                            state, _ = state.register(
-                                symbol=Symbol(str(symbol)),
-                                size=1,
-                                stack=self.stack,
-                            )
+        for (matrix_index, _), poly_terms in zip(entries, terms):
 
-                        def gen_polynomial():
-                            # a5 x1 x3**2 -> c=a5, m_cnt=(1, 0, 2)
-                            for value, variable_powers in zip(
-                                sympy_poly.coeffs(), sympy_poly.monoms()
-                            ):
-                                if math.isclose(value, 0):
-                                    continue
-
-                                # m_cnt=(1, 0, 2) -> m=((0, 1) (1, 2))
-                                def gen_monomial():
-                                    for sympy_index, power in enumerate(variable_powers):
-                                        if 0 < power:
-                                            variable = Symbol(
-                                                str(sympy_poly.gens[sympy_index])
-                                            )
-                                            index = state.indices[variable]
-                                            yield (index.start, power)
-
-                                monomial = sort_monomial(tuple(gen_monomial()))
-
-                                yield monomial, value
-
-                        polynomial = dict(gen_polynomial())
-
-                case _:
-                    raise AssertionError(
-                        to_operator_traceback(
-                            message=f"unknown data type {type(value)=}",
-                            stack=self.stack,
+            def gen_polynomial():
+                for variable_powers, value in poly_terms.items():
+                    if math.isclose(value, 0):
+                        continue
+
+                    # m_cnt=(1, 0, 2) -> m=((0, 1) (1, 2))
+                    monomial = sort_monomial(
+                        tuple(
+                            (indices[gen_index], power)
+                            for gen_index, power in enumerate(variable_powers)
+                            if 0 < power
                         )
                     )
 
-            return state, data + ((matrix_index, polynomial),)
+                    yield monomial, float(value)
 
-        def gen_entries():
-            for row, row_data in enumerate(self.data):
-                for col, entry in enumerate(row_data):
-                    yield row, col, entry
+            polynomial = dict(gen_polynomial())
 
-        *_, (state, data) = accumulate(
-            gen_entries(), acc_polynomial_matrix_data, initial=(state, tuple())
-        )
+            if polynomial:
+                data[matrix_index] = polynomial
+            else:
+                del data[matrix_index]
 
-        return state, init_from_polynomial_matrix(
-            data=dict(data),
-            shape=(len(self.data), len(self.data[0])),
-        )
+        return state
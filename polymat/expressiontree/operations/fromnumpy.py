@@ -1,50 +1,103 @@
-import math
-
 from abc import abstractmethod
+from typing import TYPE_CHECKING, Union
 from typing_extensions import override
+
+import numpy as np
 from numpy.typing import NDArray
 
 from polymat.expressiontree.nodes import ExpressionNode
-from polymat.sparserepr.data.polynomial import constant_polynomial
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
-from polymat.sparserepr.init import init_sparse_repr_from_iterable
+from polymat.sparserepr.init import init_from_polynomial_matrix
+from polymat.utils.getstacklines import (
+    FrameSummaryMixin,
+    to_operator_traceback,
+)
+from polymat.utils.lazyimport import is_scipy_sparse
+
+if TYPE_CHECKING:
+    import scipy.sparse
 
 
-class FromNumpy(ExpressionNode):
+class FromNumpy(FrameSummaryMixin, ExpressionNode):
     """
-    Make a (constant) expression from a numpy array.
+    Make a (constant) expression from a numeric numpy array or a scipy sparse matrix.
+
+    The non-zero entries are selected without iterating over the elements of the
+    array. The array is not copied, hence it must not be modified after the
+    expression is created. `to_numpy` and `to_scipy_sparse` convert the array
+    directly without building the polynomial matrix.
 
     ..code:: py
-        identity = polymatrix.from_numpy(np.eye(3))
+        identity = polymatrix.from_(np.eye(3))
     """
 
+    ArrayType = Union[NDArray, "scipy.sparse.sparray", "scipy.sparse.spmatrix"]
+
     def __str__(self):
         return f"from_numpy({self.data})"
 
     @property
     @abstractmethod
-    def data(self) -> NDArray:
-        """The Numpy array."""
+    def data(self) -> ArrayType:
+        """The Numpy array or scipy sparse matrix."""
+
+    def to_dense_array(self) -> NDArray:
+        if is_scipy_sparse(self.data):
+            return self.data.toarray().astype(np.double)
+
+        return np.array(self.data, dtype=np.double)
+
+    def to_sparse_array(self, format: str) -> "scipy.sparse.sparray":
+        import scipy.sparse
+
+        array = scipy.sparse.csr_array(self.data, dtype=np.double, copy=True)
+        array.sum_duplicates()
+
+        # explicitly stored zeros are skipped
+        array.eliminate_zeros()
+
+        return array.asformat(format)
 
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
-        if len(self.data.shape) > 2:
-            raise ValueError(
-                "Cannot construct expression from numpy array with "
-                f"shape {self.data.shape}, only vectors and matrices are allowed"
+        data = self.data
+
+        if len(data.shape) != 2:
+            raise AssertionError(
+                to_operator_traceback(
+                    message=(
+                        "Cannot construct expression from numpy array with "
+                        f"shape {data.shape}, only matrices are allowed"
+                    ),
+                    stack=self.stack,
+                )
             )
 
-        data = self.data
+        if is_scipy_sparse(data):
+            import scipy.sparse
+
+            coo = scipy.sparse.coo_array(data)
+            coo.sum_duplicates()
 
-        nrows, ncols = data.shape
+            # explicitly stored zeros are skipped
+            mask = coo.data != 0
+            rows, cols, values = coo.row[mask], coo.col[mask], coo.data[mask]
 
-        def gen_polynomial_matrix():
-            for row in range(nrows):
-                for col in range(ncols):
-                    if not math.isclose(data[row, col], 0):
-                        yield (row, col), constant_polynomial(data[row, col])
+        else:
+            rows, cols = np.nonzero(data)
+            values = data[rows, cols]
+
+        polynomial_matrix = {
+            (row, col): {tuple(): value}
+            for row, col, value in zip(
+                rows.tolist(),
+                cols.tolist(),
+                values.astype(np.double).tolist(),
+            )
+        }
 
-        return state, init_sparse_repr_from_iterable(
-            data=gen_polynomial_matrix(), shape=(nrows, ncols)
+        return state, init_from_polynomial_matrix(
+            data=polynomial_matrix,
+            shape=data.shape,
         )
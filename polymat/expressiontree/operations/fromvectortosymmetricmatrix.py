@@ -33,8 +33,8 @@ class FromVectorToSymmetricMatrix(FrameSummaryMixin, SingleChildExpressionNode):
             def gen_polynomial_matrix():
                 v_row = 0
 
-                for m_row in range(n_row):
-                    for m_col in range(m_row, n_row):
+                for m_row in range(n_rows):
+                    for m_col in range(m_row, n_rows):
                         polynomial = child.at(v_row, 0)
 
                         if polynomial:
@@ -48,6 +48,7 @@ class FromVectorToSymmetricMatrix(FrameSummaryMixin, SingleChildExpressionNode):
 
             return init_symmetric_sparse_repr(
                 child=sparse_repr,
+                policy=state.materialization_policy,
             )
 
         match child.shape:
@@ -58,7 +59,9 @@ class FromVectorToSymmetricMatrix(FrameSummaryMixin, SingleChildExpressionNode):
             
             case (1, int()):
                 return state, from_vector_to_symmetric_matrix(
-                    child=init_transpose_sparse_repr(child),
+                    child=init_transpose_sparse_repr(
+                        child, policy=state.materialization_policy
+                    ),
                 )
 
             # Diagonal matrix to vector
@@ -49,4 +49,5 @@ class GetItem(SingleChildExpressionNode):
             child=child,
             shape=(len(row_key), len(col_key)),
             key=(row_key, col_key),
+            policy=state.materialization_policy,
         )
@@ -0,0 +1,45 @@
+import itertools
+
+from typing import override
+
+from polymat.utils.getstacklines import FrameSummaryMixin, to_operator_traceback
+from polymat.sparserepr.sparserepr import SparseRepr
+from polymat.sparserepr.init import init_hstack_sparse_repr
+from polymat.state import State
+from polymat.expressiontree.nodes import MultiChildrenExpressionNode
+
+
+class HorizontalStack(FrameSummaryMixin, MultiChildrenExpressionNode):
+    def __str__(self):
+        children = ",".join(str(c) for c in self.children)
+        return f"h_stack({children})"
+
+    @override
+    def apply(self, state: State) -> tuple[State, SparseRepr]:
+        state, children = self.apply_children(state)
+
+        n_row = children[0].shape[0]
+        for child in children[1:]:
+            if not (child.shape[0] == n_row):
+                raise AssertionError(
+                    to_operator_traceback(
+                        message=f"{child.shape[0]} not equal {n_row}",
+                        stack=self.stack,
+                    )
+                )
+
+        col_ranges = tuple(
+            range(a, b)
+            for a, b in itertools.pairwise(
+                itertools.accumulate((child.shape[1] for child in children), initial=0)
+            )
+        )
+
+        n_col = col_ranges[-1].stop
+
+        return state, init_hstack_sparse_repr(
+            children=children,
+            col_ranges=col_ranges,
+            shape=(n_row, n_col),
+            policy=state.materialization_policy,
+        )
@@ -1,9 +1,13 @@
 from typing import override
 
+from polymat.sparserepr.data.polynomial import multiply_polynomials
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
-from polymat.expressiontree.nodes import TwoChildrenExpressionNode
-from polymat.sparserepr.init import init_kron_sparse_repr
+from polymat.expressiontree.nodes import TwoChildrenExpressionNode, map_polynomials
+from polymat.sparserepr.init import (
+    init_kron_sparse_repr,
+    init_sparse_repr_from_iterable,
+)
 
 
 class Kronecker(TwoChildrenExpressionNode):
@@ -12,11 +16,28 @@ class Kronecker(TwoChildrenExpressionNode):
 
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
-        state, left = self.left.apply(state)
-        state, right = self.right.apply(state)
+        state, left, right = self.apply_children(state)
 
-        return state, init_kron_sparse_repr(
-            left=left,
-            right=right,
-            shape=(left.shape[0] * right.shape[0], left.shape[1] * right.shape[1]),
+        shape = (left.shape[0] * right.shape[0], left.shape[1] * right.shape[1])
+
+        if state.executor is None:
+            return state, init_kron_sparse_repr(
+                left=left,
+                right=right,
+                shape=shape,
+                policy=state.materialization_policy,
+            )
+
+        # compute the products in parallel instead of on access
+        def gen_tasks():
+            for (left_row, left_col), left_polynomial in left.entries():
+                for (right_row, right_col), right_polynomial in right.entries():
+                    row = left_row * right.shape[0] + right_row
+                    col = left_col * right.shape[1] + right_col
+
+                    yield (row, col), (left_polynomial, right_polynomial)
+
+        return state, init_sparse_repr_from_iterable(
+            map_polynomials(state, multiply_polynomials, gen_tasks()),
+            shape=shape,
         )
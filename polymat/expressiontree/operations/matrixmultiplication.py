@@ -1,10 +1,7 @@
 from typing import override
 
-from polymat.expressiontree.nodes import TwoChildrenExpressionNode
-from polymat.sparserepr.data.polynomial import (
-    add_polynomial_iterable,
-    multiply_polynomials,
-)
+from polymat.expressiontree.nodes import TwoChildrenExpressionNode, map_polynomials
+from polymat.sparserepr.data.polynomial import add_polynomial_products
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
 from polymat.utils.getstacklines import FrameSummaryMixin, to_operator_traceback
@@ -17,8 +14,7 @@ class MatrixMultiplication(FrameSummaryMixin, TwoChildrenExpressionNode):
 
     @override
     def apply(self, state: State) -> tuple[State, SparseRepr]:
-        state, left = self.left.apply(state=state)
-        state, right = self.right.apply(state=state)
+        state, left, right = self.apply_children(state)
 
         if not (left.shape[1] == right.shape[0]):
             msg = (
@@ -32,27 +28,21 @@ class MatrixMultiplication(FrameSummaryMixin, TwoChildrenExpressionNode):
                 )
             )
 
-        def gen_polynomial_matrix():
+        def gen_tasks():
             for row in range(left.shape[0]):
                 for col in range(right.shape[1]):
 
-                    def gen_polynomials():
+                    def gen_polynomial_pairs():
                         for k in range(left.shape[1]):
                             left_polynomial = left.at(row, k)
                             right_polynomial = right.at(k, col)
 
                             if left_polynomial and right_polynomial:
-                                result = multiply_polynomials(
-                                    left_polynomial, right_polynomial
-                                )
-                                if result:
-                                    yield result
+                                yield left_polynomial, right_polynomial
 
-                    summation = add_polynomial_iterable(gen_polynomials())
-
-                    if summation:
-                        yield (row, col), summation
+                    yield (row, col), (tuple(gen_polynomial_pairs()),)
 
         return state, init_sparse_repr_from_iterable(
-            gen_polynomial_matrix(), shape=(left.shape[0], right.shape[1])
+            map_polynomials(state, add_polynomial_products, gen_tasks()),
+            shape=(left.shape[0], right.shape[1]),
         )
@@ -4,7 +4,7 @@ from itertools import product
 
 from polymat.sparserepr.data.polynomial import multiply_polynomial_iterable
 from polymat.utils.getstacklines import FrameSummaryMixin, to_operator_traceback
-from polymat.expressiontree.nodes import MultiChildrenExpressionNode
+from polymat.expressiontree.nodes import MultiChildrenExpressionNode, map_polynomials
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
 from polymat.sparserepr.init import init_from_polynomial_matrix
@@ -55,20 +55,17 @@ class Product(FrameSummaryMixin, MultiChildrenExpressionNode):
 
             product_rows = filter(lambda v: sum(v) in degrees, product_rows)
 
-        def gen_polynomial_matrix():
+        def gen_tasks():
             for output_row, sel_product_rows in enumerate(product_rows):
                 # select one polynomial from each child
-                polynomials = (
+                polynomials = tuple(
                     polymatrix.at(row, 0)
                     for polymatrix, row in zip(children, sel_product_rows)
                 )
 
-                result = multiply_polynomial_iterable(polynomials)
+                yield (output_row, 0), (polynomials,)
 
-                if result:
-                    yield (output_row, 0), result
-
-        data = dict(gen_polynomial_matrix())
+        data = dict(map_polynomials(state, multiply_polynomial_iterable, gen_tasks()))
 
         return state, init_from_polynomial_matrix(
             data=data,
@@ -28,4 +28,5 @@ class RepeatMatrix(SingleChildExpressionNode):
             child=child,
             shape=(n_rows * row_rep, n_cols * col_rep),
             child_shape=child.shape,
+            policy=state.materialization_policy,
         )
@@ -36,4 +36,5 @@ class Reshape(SingleChildExpressionNode):
         return state, init_reshape_sparse_repr(
             child=child,
             shape=shape,
+            policy=state.materialization_policy,
         )
@@ -1,6 +1,5 @@
 from typing import override
 
-from polymat.sparserepr.data.polynomial import add_polynomial_iterable
 from polymat.sparserepr.init import init_transpose_sparse_repr
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
@@ -25,24 +24,13 @@ class RowSummation(SingleChildExpressionNode):
 
         if child.shape[1] == 1:
             # sum elements of column vector
-            child = init_transpose_sparse_repr(child=child)
+            child = init_transpose_sparse_repr(
+                child=child, policy=state.materialization_policy
+            )
 
         def gen_polynomial_matrix():
-            for row in range(child.shape[0]):
-                result = {}
-
-                def gen_polynomials():
-                    for col in range(child.shape[1]):
-                        polynomial = child.at(row, col)
-
-                        if polynomial:
-                            yield polynomial
-
-
-                result = add_polynomial_iterable(gen_polynomials())
-
-                if result:
-                    yield ((row, 0), result)
+            for (row, _), polynomial in child.entries():
+                yield (row, 0), polynomial
 
         return state, init_sparse_repr_from_iterable(
             data=gen_polynomial_matrix(), shape=(child.shape[0], 1)
@@ -0,0 +1,170 @@
+from functools import cached_property
+from typing import override
+
+from polymat.expressiontree.nodes import (
+    ExpressionNode,
+    MultiChildrenExpressionNode,
+    apply_nodes,
+)
+from polymat.sparserepr.data.polynomial import multiply_with_scalar
+from polymat.sparserepr.init import init_sparse_repr_from_iterable
+from polymat.sparserepr.sparserepr import SparseRepr
+from polymat.state import State
+from polymat.utils.getstacklines import (
+    FrameSummary,
+    FrameSummaryMixin,
+    to_operator_traceback,
+)
+
+
+def flatten_summands(
+    nodes: tuple[ExpressionNode, ...],
+) -> tuple[tuple[ExpressionNode, int], ...]:
+    """
+    Replace nested additions by their summands, such that a chain of additions
+    built with `+` in a loop is evaluated as a single summation.
+
+    A nested addition that is shared, e.g. `a` in `a + a`, is visited only once.
+    The summands are returned without duplicates together with the number of times
+    they are added:
+
+        (x1 + x2) + (x1 + x2)  ->  ((x1, 2), (x2, 2)).
+    """
+
+    # avoid circular import
+    from polymat.expressiontree.operations.addition import Addition
+
+    def get_children(node):
+        match node:
+            case Addition():
+                return (node.left, node.right)
+            case Summation():
+                return node.children
+            case _:
+                return None
+
+    # collect the nested additions in post-order and the summands in the order of
+    # their first occurrence, visiting each node once
+    visited = set()
+    nested = []
+    summands = {}
+    stack = [(node, False) for node in reversed(nodes)]
+
+    while stack:
+        node, expanded = stack.pop()
+
+        if expanded:
+            nested.append(node)
+
+        elif id(node) in visited:
+            continue
+
+        elif (children := get_children(node)) is None:
+            summands[id(node)] = node
+
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children))
+
+        visited.add(id(node))
+
+    # the reversed post-order visits an addition before its children
+    multiplicities = {}
+    for node in nodes:
+        multiplicities[id(node)] = multiplicities.get(id(node), 0) + 1
+
+    for node in reversed(nested):
+        multiplicity = multiplicities[id(node)]
+
+        for child in get_children(node):
+            multiplicities[id(child)] = multiplicities.get(id(child), 0) + multiplicity
+
+    return tuple((node, multiplicities[key]) for key, node in summands.items())
+
+
+def add_sparse_reprs(
+    summands: tuple[SparseRepr, ...],
+    stack: tuple[FrameSummary, ...],
+    multiplicities: tuple[int, ...] | None = None,
+) -> SparseRepr:
+    """
+    Add the polynomial matrices in a single pass by accumulating the terms of each
+    entry in a polynomial owned by the result. A summand of size (1, 1) is broadcasted:
+
+        [[x1], [x2]] + [[1]] + [[x1]]  ->  [[2*x1 + 1], [x2 + x1 + 1]].
+
+    If given, the summands are scaled by their multiplicities.
+    """
+
+    if multiplicities is None:
+        multiplicities = (1,) * len(summands)
+
+    shapes = set(summand.shape for summand in summands if summand.shape != (1, 1))
+
+    if 1 < len(shapes):
+        raise AssertionError(
+            to_operator_traceback(
+                message=(
+                    "Cannot do element-wise add of matrices with shapes "
+                    f"{', '.join(str(shape) for shape in shapes)}."
+                ),
+                stack=stack,
+            )
+        )
+
+    if shapes:
+        (shape,) = shapes
+    else:
+        shape = (1, 1)
+
+    n_rows, n_cols = shape
+
+    def gen_polynomial_matrix():
+        for summand, multiplicity in zip(summands, multiplicities):
+            if summand.shape == shape:
+                if multiplicity == 1:
+                    yield from summand.entries()
+
+                else:
+                    for index, polynomial in summand.entries():
+                        yield index, multiply_with_scalar(polynomial, multiplicity)
+
+            elif polynomial := summand.at(0, 0):
+                if multiplicity != 1:
+                    polynomial = multiply_with_scalar(polynomial, multiplicity)
+
+                for row in range(n_rows):
+                    for col in range(n_cols):
+                        yield (row, col), polynomial
+
+    return init_sparse_repr_from_iterable(gen_polynomial_matrix(), shape=shape)
+
+
+class Summation(FrameSummaryMixin, MultiChildrenExpressionNode):
+    """
+    Adds an arbitrary number of polymatrices
+
+        add_all([[x1], [x2]], [[x2], [x1]], [[1], [1]])  ->  [[x1+x2+1], [x1+x2+1]].
+    """
+
+    def __str__(self):
+        children = ",".join(str(c) for c in self.children)
+        return f"add_all({children})"
+
+    @cached_property
+    def summands(self) -> tuple[tuple[ExpressionNode, int], ...]:
+        return flatten_summands(self.children)
+
+    @override
+    def operands(self) -> tuple[ExpressionNode, ...]:
+        return tuple(node for node, _ in self.summands)
+
+    @override
+    def apply(self, state: State) -> tuple[State, SparseRepr]:
+        state, summands = apply_nodes(state, self.operands())
+
+        return state, add_sparse_reprs(
+            summands,
+            stack=self.stack,
+            multiplicities=tuple(m for _, m in self.summands),
+        )
@@ -14,6 +14,8 @@ class ToSymmetricMatrix(SingleChildExpressionNode):
     def apply(self, state: State) -> tuple[State, SparseRepr]:
         state, child = self.child.apply(state)
 
-        polymatrix = init_symmetric_sparse_repr(child=child)
+        polymatrix = init_symmetric_sparse_repr(
+            child=child, policy=state.materialization_policy
+        )
 
         return state, polymatrix
@@ -16,4 +16,5 @@ class Transpose(SingleChildExpressionNode):
 
         return state, init_transpose_sparse_repr(
             child=child,
+            policy=state.materialization_policy,
         )
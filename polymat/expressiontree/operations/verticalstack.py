@@ -41,4 +41,5 @@ class VerticalStack(FrameSummaryMixin, MultiChildrenExpressionNode):
             children=children,
             row_ranges=row_ranges,
             shape=(n_row, n_col),
+            policy=state.materialization_policy,
         )
@@ -1,6 +1,6 @@
 import math
-from typing import Callable
-import sympy
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator
 
 import numpy as np
 from numpy.typing import NDArray
@@ -11,25 +11,192 @@ import statemonad
 from statemonad.abc import StateMonadNode
 from statemonad.typing import StateMonad
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
 from polymat.sparserepr.init import init_reshape_sparse_repr
 from polymat.symbol import Symbol
 from polymat.arrayrepr.arrayrepr import ArrayRepr
-from polymat.arrayrepr.init import init_array_repr
+from polymat.arrayrepr.init import init_array_repr, init_memory_mapped_array_repr
 from polymat.sparserepr.data.monomial import (
     MonomialType,
     monomial_degree,
-    monomial_degree_in,
 )
 from polymat.sparserepr.sparserepr import SparseRepr
 from polymat.state import State
 from polymat.expressiontree.nodes import ExpressionNode
+from polymat.expressiontree.operations.fromnumpy import FromNumpy
+
+if TYPE_CHECKING:
+    import scipy.sparse
+    import sympy
+
+
+def _to_array_indices(
+    state: State,
+    variables: ExpressionNode | tuple[int, ...],
+) -> tuple[State, dict[int, int]]:
+    """Map the variable indices to the columns of the array representation."""
+
+    if isinstance(variables, tuple):
+        indices = variables
+    else:
+        state, variables_ = variables.apply(state)
+        indices = tuple(variables_.to_indices())
+
+    index_to_array_index = {index: col for col, index in enumerate(indices)}
+    assert len(index_to_array_index) == len(indices)
+
+    return state, index_to_array_index
+
+
+def _add_polynomial_to_array(
+    array_repr: ArrayRepr,
+    row: int,
+    polynomial: PolynomialType,
+    index_to_array_index: dict[int, int],
+    state: State,
+    name: str | None,
+):
+    """Add the terms of the polynomial to the given row of the array representation."""
+
+    n_param = len(index_to_array_index)
+
+    for monomial, value in polynomial.items():
+
+        def gen_array_variable_indices():
+            for index, power in monomial:
+                if index not in index_to_array_index:
+                    variable_name = state.get_name(index)
+                    raise Exception(
+                        f"While converting a polynomial expression {name} to an array representation, "
+                        f"the index {index} (associated with the variable {variable_name}) found in the expression "
+                        f"is not an element of the provided list of variable indices."
+                    )
+
+                array_index = index_to_array_index[index]
+
+                for _ in range(power):
+                    yield array_index
+
+        array_variable_indices = tuple(gen_array_variable_indices())
+
+        columns = ArrayRepr.to_column_indices(n_param, array_variable_indices)
+
+        col_value = value / len(columns)
+
+        for col in columns:
+            array_repr.add(row, col, monomial_degree(monomial), col_value)
+
+
+def to_affine_arrays(
+    expr: ExpressionNode,
+    variables: ExpressionNode | tuple[int, ...],
+    format: str = "csc",
+    b_out: NDArray | None = None,
+    a_out: NDArray | None = None,
+) -> StateMonad[State, tuple["scipy.sparse.sparray | NDArray", NDArray]]:
+    """
+    Convert a polynomial expression that is affine in the variables to the pair
+    (A, b) such that the expression, reshaped to a vector like in `to_array`,
+    equals `A @ x + b`.
+
+    The entries are processed in a single pass without an intermediate array
+    representation.
+
+    Args:
+        format: Sparse format of A, e.g. "csc", "csr" or "coo".
+        b_out: Preallocated vector of size `n_eq` that is filled with b.
+        a_out: Preallocated dense array of shape `(n_eq, n_param)` that is filled
+            with A, returned instead of a sparse array.
+    """
+
+    @dataclassabc(frozen=True, slots=True)
+    class ToAffineArraysStateMonadTree(StateMonadNode):
+        expr: ExpressionNode
+        variables: ExpressionNode | tuple[int, ...]
+
+        def __str__(self):
+            return f"to_affine_arrays({self.expr}, {self.variables})"
+
+        def apply(self, state: State):
+            state, polymatrix = self.expr.apply(state)
+            n_eq = polymatrix.n_entries
+
+            # the entries of the reshaped matrix are indexed using its shape,
+            # hence the shape is given explicitly
+            if 1 < polymatrix.shape[1]:
+                polymatrix = init_reshape_sparse_repr(
+                    child=polymatrix,
+                    shape=(n_eq, 1),
+                    policy=state.materialization_policy,
+                )
+
+            state, index_to_array_index = _to_array_indices(state, self.variables)
+
+            n_param = len(index_to_array_index)
+
+            if b_out is None:
+                b = np.zeros(n_eq, dtype=np.double)
+            else:
+                assert b_out.shape == (n_eq,), f"{b_out.shape=} is not {(n_eq,)}"
+                b = b_out
+                b[:] = 0
+
+            rows = []
+            cols = []
+            values = []
+
+            for (row, _), polynomial in polymatrix.entries():
+                for monomial, value in polynomial.items():
+                    match monomial:
+                        case ():
+                            b[row] = value
+
+                        case ((index, 1),) if index in index_to_array_index:
+                            rows.append(row)
+                            cols.append(index_to_array_index[index])
+                            values.append(value)
+
+                        case _:
+                            raise Exception(
+                                f"The term {monomial=} in row {row} is not affine in the "
+                                f"provided list of variable indices."
+                            )
+
+            rows = np.array(rows, dtype=np.int64)
+            cols = np.array(cols, dtype=np.int64)
+            values = np.array(values, dtype=np.double)
+
+            if a_out is not None:
+                assert a_out.shape == (n_eq, n_param), (
+                    f"{a_out.shape=} is not {(n_eq, n_param)}"
+                )
+                a_out[:] = 0
+                a_out[rows, cols] = values
+
+                return state, (a_out, b)
+
+            import scipy.sparse
+
+            A = scipy.sparse.coo_array(
+                (values, (rows, cols)),
+                shape=(n_eq, n_param),
+            ).asformat(format)
+
+            return state, (A, b)
+
+    return statemonad.from_node(
+        ToAffineArraysStateMonadTree(
+            expr=expr,
+            variables=variables,
+        )
+    )
 
 
 def to_array(
     expr: ExpressionNode,
     variables: ExpressionNode | tuple[int, ...],
-    name: str | None = None  # for debugging purposes
+    name: str | None = None,  # for debugging purposes
+    directory: str | Path | None = None,
 ) -> StateMonad[State, ArrayRepr]:
     """
     Given a monomial of degree d, this function returns the indices of a monomial
@@ -46,6 +213,10 @@ def to_array(
         z = [x**3, x**2*y, x**2*y, x*y**2, x**2*y, x*y**2, x*y**2, y**3]
 
     results in indices = (3, 5, 6)
+
+    If a directory is given, the degree blocks of the array representation are
+    written to files in the directory while they are computed, and then memory-mapped,
+    see `MemoryMappedArrayRepr`.
     """
 
     @dataclassabc(frozen=True, slots=True)
@@ -64,64 +235,139 @@ def to_array(
             if 1 < n_col:
                 polymatrix = init_reshape_sparse_repr(
                     child=polymatrix,
-                    shape=(-1, 1),
+                    shape=(n_eq, 1),
+                    policy=state.materialization_policy,
                 )
                 n_row_array = n_row
             else:
                 n_row_array = None
 
-            if isinstance(self.variables, tuple):
-                indices = self.variables
+            state, index_to_array_index = _to_array_indices(state, self.variables)
+            n_param = len(index_to_array_index)
+
+            if directory is None:
+                array_repr = init_array_repr(
+                    n_eq=n_eq,
+                    n_row=n_row_array,
+                    n_param=n_param,
+                )
+
             else:
-                state, variables = self.variables.apply(state)
-                indices = tuple(variables.to_indices())
+                array_repr = init_memory_mapped_array_repr(
+                    directory=directory,
+                    n_eq=n_eq,
+                    n_row=n_row_array,
+                    n_param=n_param,
+                )
 
-            n_param = len(indices)
-            index_to_array_index = {index: col for col, index in enumerate(indices)}
-            assert len(index_to_array_index) == len(indices)
+            try:
+                for row in range(n_eq):
+                    polynomial = polymatrix.at(row, 0)
 
-            array_repr = init_array_repr(
-                n_eq=n_eq,
-                n_row=n_row_array,
-                n_param=n_param,
-            )
+                    if polynomial is None:
+                        continue
 
-            for row in range(n_eq):
-                polynomial = polymatrix.at(row, 0)
+                    _add_polynomial_to_array(
+                        array_repr=array_repr,
+                        row=row,
+                        polynomial=polynomial,
+                        index_to_array_index=index_to_array_index,
+                        state=state,
+                        name=name,
+                    )
 
-                if polynomial is None:
-                    continue
+            except BaseException:
+                array_repr.discard()
+                raise
 
-                for monomial, value in polynomial.items():
+            array_repr.finalize()
+
+            return state, array_repr
+
+    return statemonad.from_node(
+        ToArrayStateMonadTree(
+            expr=expr,
+            variables=variables,
+        )
+    )
 
-                    def gen_array_variable_indices():
-                        for index, power in monomial:
-                            if index not in index_to_array_index:
-                                variable_name = state.get_name(index)
-                                raise Exception(
-                                    f"While converting a polynomial expression {name} to an array representation, "
-                                    f"the index {index} (associated with the variable {variable_name}) found in the expression "
-                                    f"is not an element of the provided list of variable indices."
-                                )
 
-                            array_index = index_to_array_index[index]
+def to_array_chunks(
+    expr: ExpressionNode,
+    variables: ExpressionNode | tuple[int, ...],
+    chunk_size: int,
+    name: str | None = None,  # for debugging purposes
+) -> StateMonad[State, Iterator[ArrayRepr]]:
+    """
+    Like `to_array`, but returns a generator of array representations, each one
+    covering `chunk_size` consecutive rows of the expression reshaped to a vector
+    (the last one possibly fewer).
+
+    The rows are pulled from the polynomial matrix using `at` only when the next
+    chunk is requested, such that only a single chunk is held in memory at a time.
 
-                            for _ in range(power):
-                                yield array_index
+    .. code:: py
 
-                    array_variable_indices = tuple(gen_array_variable_indices())
+        state, chunks = polymat.to_array_chunks(f, x, chunk_size=10_000).apply(state)
 
-                    columns = ArrayRepr.to_column_indices(n_param, array_variable_indices)
+        for chunk in chunks:
+            write(chunk[1])
+    """
 
-                    col_value = value / len(columns)
+    assert 0 < chunk_size, f"{chunk_size=} must be positive"
 
-                    for col in columns:
-                        array_repr.add(row, col, monomial_degree(monomial), col_value)
+    @dataclassabc(frozen=True, slots=True)
+    class ToArrayChunksStateMonadTree(StateMonadNode):
+        expr: ExpressionNode
+        variables: ExpressionNode | tuple[int, ...]
 
-            return state, array_repr
+        def __str__(self):
+            return f"to_array_chunks({self.expr}, {self.variables}, {chunk_size})"
+
+        def apply(self, state: State):
+            state, polymatrix = self.expr.apply(state)
+            n_eq = polymatrix.n_entries
+
+            if 1 < polymatrix.shape[1]:
+                polymatrix = init_reshape_sparse_repr(
+                    child=polymatrix,
+                    shape=(n_eq, 1),
+                    policy=state.materialization_policy,
+                )
+
+            state, index_to_array_index = _to_array_indices(state, self.variables)
+            n_param = len(index_to_array_index)
+
+            def gen_chunks():
+                for start in range(0, n_eq, chunk_size):
+                    stop = min(start + chunk_size, n_eq)
+
+                    array_repr = init_array_repr(
+                        n_eq=stop - start,
+                        n_param=n_param,
+                    )
+
+                    for row in range(start, stop):
+                        polynomial = polymatrix.at(row, 0)
+
+                        if polynomial is None:
+                            continue
+
+                        _add_polynomial_to_array(
+                            array_repr=array_repr,
+                            row=row - start,
+                            polynomial=polynomial,
+                            index_to_array_index=index_to_array_index,
+                            state=state,
+                            name=name,
+                        )
+
+                    yield array_repr
+
+            return state, gen_chunks()
 
     return statemonad.from_node(
-        ToArrayStateMonadTree(
+        ToArrayChunksStateMonadTree(
             expr=expr,
             variables=variables,
         )
@@ -145,36 +391,42 @@ def to_degree(
 
             if self.variables:
                 state, variables_ = to_variable_indices(self.variables).apply(state)
-
-                def get_degree(monomial: MonomialType):
-                    return monomial_degree_in(monomial, set(variables_))
+                entry_arrays = polymatrix.to_entry_arrays(variables=set(variables_))
 
             else:
+                entry_arrays = polymatrix.to_entry_arrays()
 
-                def get_degree(monomial: MonomialType):
-                    return monomial_degree(monomial)
+            degrees = np.zeros(polymatrix.shape, dtype=np.int64)
+            degrees[entry_arrays.rows, entry_arrays.cols] = entry_arrays.degrees
 
-            n_rows, n_cols = polymatrix.shape
+            return state, degrees
+
+    return statemonad.from_node(ToDegreeStateMonadTree(expr=expr, variables=variables))
 
-            def gen_tuple():
-                for row in range(n_rows):
 
-                    def gen_column():
-                        for col in range(n_cols):
-                            polynomial = polymatrix.at(row, col)
+def _to_constant_entry_arrays(polymatrix: SparseRepr, assert_constant: bool):
+    entry_arrays = polymatrix.to_entry_arrays()
 
-                            if polynomial:
-                                def gen_degrees():
-                                    for monomial in polynomial.keys():
-                                        yield get_degree(monomial)
+    if assert_constant and not entry_arrays.is_constant.all():
+        position = np.argmin(entry_arrays.is_constant)
+        polynomial = polymatrix.at(
+            int(entry_arrays.rows[position]), int(entry_arrays.cols[position])
+        )
+        monomial = next(monomial for monomial in polynomial if monomial)
+        raise Exception(f"non-constant term {monomial=}")
 
-                                yield max(gen_degrees())
+    return entry_arrays
 
-                    yield tuple(gen_column())
 
-            return state, tuple(gen_tuple())
+def _to_constant_array(polymatrix: SparseRepr, assert_constant: bool) -> NDArray:
+    """Dense array of the constant terms of the polynomial matrix."""
 
-    return statemonad.from_node(ToDegreeStateMonadTree(expr=expr, variables=variables))
+    entry_arrays = _to_constant_entry_arrays(polymatrix, assert_constant)
+
+    array = np.zeros(polymatrix.shape, dtype=np.double)
+    array[entry_arrays.rows, entry_arrays.cols] = entry_arrays.constants
+
+    return array
 
 
 def to_numpy(
@@ -189,22 +441,115 @@ def to_numpy(
             return f"to_numpy({self.expr})"
 
         def apply(self, state: State):
+            if isinstance(self.expr, FromNumpy):
+                return state, self.expr.to_dense_array()
+
+            state, polymatrix = self.expr.apply(state)
+
+            return state, _to_constant_array(polymatrix, self.assert_constant)
+
+    return statemonad.from_node(
+        ToNumpyStateMonadTree(expr=expr, assert_constant=assert_constant)
+    )
+
+
+def to_scipy_sparse(
+    expr: ExpressionNode,
+    format: str = "csr",
+    per_monomial: bool = False,
+    assert_constant: bool = True,
+) -> StateMonad[
+    State, "scipy.sparse.sparray | dict[MonomialType, scipy.sparse.sparray]"
+]:
+    """
+    Convert a constant polynomial matrix to a scipy sparse array, without allocating
+    a dense array.
+
+    Args:
+        format: Sparse format of the result, e.g. "csr", "csc" or "coo".
+        per_monomial: If True, the entries may depend on variables (e.g. parameters),
+            and a dictionary is returned that maps each monomial to the sparse array
+            of its coefficients. The constant terms are mapped to `tuple()`.
+        assert_constant: If False, the non-constant terms are ignored, otherwise an
+            exception is raised. Not used if `per_monomial` is True.
+    """
+
+    @dataclassabc(frozen=True, slots=True)
+    class ToScipySparseStateMonadTree(StateMonadNode):
+        expr: ExpressionNode
+        format: str
+        per_monomial: bool
+        assert_constant: bool
+
+        def __str__(self):
+            return f"to_scipy_sparse({self.expr})"
+
+        def apply(self, state: State):
+            import scipy.sparse
+
+            if isinstance(self.expr, FromNumpy):
+                array = self.expr.to_sparse_array(self.format)
+
+                if not self.per_monomial:
+                    return state, array
+                elif array.nnz:
+                    return state, {tuple(): array}
+                else:
+                    return state, {}
+
             state, polymatrix = self.expr.apply(state)
 
-            A = np.zeros(polymatrix.shape, dtype=np.double)
+            def to_sparse_array(rows, cols, values):
+                return scipy.sparse.coo_array(
+                    (
+                        np.asarray(values, dtype=np.double),
+                        (
+                            np.asarray(rows, dtype=np.int64),
+                            np.asarray(cols, dtype=np.int64),
+                        ),
+                    ),
+                    shape=polymatrix.shape,
+                ).asformat(self.format)
+
+            if not self.per_monomial:
+                entry_arrays = _to_constant_entry_arrays(
+                    polymatrix, self.assert_constant
+                )
+
+                # skip the entries without a constant term
+                mask = entry_arrays.constants != 0
+
+                return state, to_sparse_array(
+                    entry_arrays.rows[mask],
+                    entry_arrays.cols[mask],
+                    entry_arrays.constants[mask],
+                )
+
+            # rows, columns and coefficients of each monomial
+            terms = {}
 
             for (row, col), polynomial in polymatrix.entries():
                 for monomial, value in polynomial.items():
-                    if len(monomial) == 0:
-                        A[row, col] = value
+                    if monomial not in terms:
+                        terms[monomial] = ([], [], [])
 
-                    elif assert_constant:
-                        raise Exception(f"non-constant term {monomial=}")
+                    rows, cols, values = terms[monomial]
+                    rows.append(row)
+                    cols.append(col)
+                    values.append(value)
 
-            return state, A
+            return state, {
+                monomial: to_sparse_array(*monomial_terms)
+                for monomial, monomial_terms in terms.items()
+            }
 
     return statemonad.from_node(
-        ToNumpyStateMonadTree(expr=expr, assert_constant=assert_constant)
+        ToScipySparseStateMonadTree(
+            expr=expr,
+            format=format,
+            per_monomial=per_monomial,
+            assert_constant=assert_constant,
+        )
     )
 
 
@@ -228,44 +573,85 @@ def to_sparse_repr(expr: ExpressionNode) -> StateMonad[State, SparseRepr]:
     return statemonad.from_node(expr)
 
 
-def to_sympy(expr: ExpressionNode) -> StateMonad[State, sympy.Expr]:
+def to_sympy(
+    expr: ExpressionNode,
+    sparse: bool = False,
+) -> StateMonad[State, "sympy.Expr"]:
+    """
+    Convert the polynomial matrix to a sympy matrix, or to a sympy expression if
+    the shape is (1, 1).
+
+    Args:
+        sparse: If True, a `sympy.SparseMatrix` is returned instead of a dense
+            `sympy.Matrix`.
+    """
+
     @dataclassabc(frozen=True, slots=True)
     class ToSympyStateMonadTree(StateMonadNode):
         expr: ExpressionNode
+        sparse: bool
 
         def __str__(self):
             return f"to_sympy({self.expr})"
 
         def apply(self, state: State):
+            import sympy
+
             state, polymatrix = expr.apply(state)
 
-            sympy_matrix = sympy.zeros(*polymatrix.shape)
+            # a single sympy symbol per variable index and a single sympy expression
+            # per monomial
+            symbols = {}
+            monomials = {}
 
-            for (row, col), polynomial in polymatrix.entries():
-                # print(f'{row=}, {col=}, {polynomial=}')
-                sympy_poly_terms = []
-                for monomial, coeff in polynomial.items():
-                    sympy_monomial = math.prod(
-                        sympy.Symbol(state.get_name(index)) ** power
-                        for index, power in monomial
+            def get_symbol(index: int):
+                if index not in symbols:
+                    symbols[index] = sympy.Symbol(state.get_name(index))
+
+                return symbols[index]
+
+            def get_monomial(monomial: MonomialType):
+                if monomial not in monomials:
+                    monomials[monomial] = sympy.Mul(
+                        *(get_symbol(index) ** power for index, power in monomial)
                     )
 
-                    if math.isclose(coeff, 1.0):
-                        # no need to add 1 in front
-                        sympy_poly_terms.append(sympy_monomial)
+                return monomials[monomial]
+
+            def to_sympy_polynomial(polynomial):
+                def gen_terms():
+                    for monomial, coeff in polynomial.items():
+                        if math.isclose(coeff, 1.0):
+                            # no need to add 1 in front
+                            yield get_monomial(monomial)
 
-                    else:
-                        sympy_poly_terms.append(coeff * sympy_monomial)
+                        else:
+                            yield coeff * get_monomial(monomial)
 
-                sympy_matrix[row, col] = sum(sympy_poly_terms)
+                # sympy sums all terms at once, instead of one after the other
+                return sympy.Add(*gen_terms())
+
+            entries = {
+                index: to_sympy_polynomial(polynomial)
+                for index, polynomial in polymatrix.entries()
+            }
 
             if math.prod(polymatrix.shape) == 1:
                 # just return the expression
-                sympy_matrix = sympy_matrix[0, 0]
+                return state, entries.get((0, 0), sympy.S.Zero)
+
+            if self.sparse:
+                return state, sympy.SparseMatrix(*polymatrix.shape, entries)
 
-            return state, sympy_matrix
+            n_rows, n_cols = polymatrix.shape
+            flat = [sympy.S.Zero] * (n_rows * n_cols)
+
+            for (row, col), entry in entries.items():
+                flat[row * n_cols + col] = entry
+
+            return state, sympy.Matrix(n_rows, n_cols, flat)
 
-    return statemonad.from_node(ToSympyStateMonadTree(expr=expr))
+    return statemonad.from_node(ToSympyStateMonadTree(expr=expr, sparse=sparse))
 
 
 def to_tuple(
@@ -282,32 +668,9 @@ def to_tuple(
         def apply(self, state: State):
             state, polymatrix = self.expr.apply(state)
 
-            n_rows, n_cols = polymatrix.shape
-
-            def gen_tuple():
-                for row in range(n_rows):
-
-                    def gen_column():
-                        for col in range(n_cols):
-                            polynomial = polymatrix.at(row, col)
-
-                            if polynomial is None:
-                                yield 0
-
-                            else:
-                                # find constant monomial
-                                for monomial, value in polynomial.items():
-                                    if len(monomial) == 0:
-                                        yield value
-
-                                    elif assert_constant:
-                                        raise Exception(
-                                            f"non-constant term {monomial=}"
-                                        )
-
-                    yield tuple(gen_column())
+            array = _to_constant_array(polymatrix, self.assert_constant)
 
-            return state, tuple(gen_tuple())
+            return state, tuple(tuple(row) for row in array.tolist())
 
     return statemonad.from_node(
         ToTupleStateMonadTree(expr=expr, assert_constant=assert_constant)
@@ -0,0 +1,76 @@
+from typing import Iterable, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
+from polymat.sparserepr.data.polynomial import PolynomialType
+
+
+class EntryArrays(NamedTuple):
+    """
+    Non-zero entries of a polynomial matrix exported as flat arrays, such that
+    converters can fill NumPy arrays using fancy indexing:
+
+        array[rows, cols] = constants
+    """
+
+    rows: NDArray
+    cols: NDArray
+
+    constants: NDArray
+    """ Constant term of each entry, zero if there is none. """
+
+    degrees: NDArray
+    """ Maximum degree of the monomials of each entry. """
+
+    is_constant: NDArray
+    """ True if the entry has no non-constant term. """
+
+
+def entry_arrays_from_iterable(
+    entries: Iterable[tuple[MatrixIndexType, PolynomialType]],
+    variables: set[int] | None = None,
+) -> EntryArrays:
+    """
+    Collect the entries in a single pass.
+
+    Args:
+        variables: If given, the degrees only count the powers of these variables.
+    """
+
+    rows = []
+    cols = []
+    constants = []
+    degrees = []
+    is_constant = []
+
+    for (row, col), polynomial in entries:
+        rows.append(row)
+        cols.append(col)
+        constants.append(polynomial.get(tuple(), 0.0))
+        is_constant.append(all(not monomial for monomial in polynomial))
+
+        if variables is None:
+            degree = max(
+                (sum(power for _, power in monomial) for monomial in polynomial),
+                default=0,
+            )
+        else:
+            degree = max(
+                (
+                    sum(power for index, power in monomial if index in variables)
+                    for monomial in polynomial
+                ),
+                default=0,
+            )
+
+        degrees.append(degree)
+
+    return EntryArrays(
+        rows=np.array(rows, dtype=np.int64),
+        cols=np.array(cols, dtype=np.int64),
+        constants=np.array(constants, dtype=np.double),
+        degrees=np.array(degrees, dtype=np.int64),
+        is_constant=np.array(is_constant, dtype=np.bool_),
+    )
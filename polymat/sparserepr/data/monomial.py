@@ -1,3 +1,6 @@
+import os
+from itertools import pairwise
+from types import SimpleNamespace
 from typing import Iterable
 
 type IndexType = int
@@ -8,12 +11,43 @@ type MonomialType = tuple[PowerVariableType, ...]
 type MutableMonomialType = dict[IndexType, PowerType]
 
 
+# A monomial is in canonical form if its variable indices are unique and sorted in
+# ascending order, and its powers are positive. The operations producing monomials
+# maintain this form, such that the polynomial operations can use the monomials as
+# dictionary keys without sorting them.
+#
+# If enabled, the polynomial operations validate the monomials they receive. Enable it
+# with the environment variable POLYMAT_VALIDATE_MONOMIALS=1 or by setting
+# `monomial_validation.enabled = True`.
+monomial_validation = SimpleNamespace(
+    enabled=os.environ.get("POLYMAT_VALIDATE_MONOMIALS", "0") not in ("", "0"),
+)
+
+
+def is_canonical_monomial(monomial: MonomialType) -> bool:
+    return all(0 < power for _, power in monomial) and all(
+        left < right for (left, _), (right, _) in pairwise(monomial)
+    )
+
+
+def validate_monomial(monomial: MonomialType) -> MonomialType:
+    if not is_canonical_monomial(monomial):
+        raise AssertionError(f"Monomial {monomial} is not in canonical form.")
+
+    return monomial
+
+
 def add_monomials(
     left: MonomialType,
     right: MonomialType,
 ) -> MonomialType:
-    if len(left) < len(right):
-        left, right = right, left
+    """Product of two canonical monomials, the result is canonical."""
+
+    if not right:
+        return left
+
+    if not left:
+        return right
 
     # copy monomial
     monomial = dict(left)
@@ -21,7 +55,7 @@ def add_monomials(
     # add element of right to mutable dictionary monomial
     add_monomials_mutable(monomial, right)
 
-    return tuple(monomial.items())
+    return tuple(sorted(monomial.items()))
 
 
 def add_monomials_mutable(
@@ -51,6 +85,8 @@ def add_monomials_mutable(
 def differentiate_monomial(
     monomial: MonomialType, index: int
 ) -> tuple[MonomialType, int] | None:
+    """The order of the variables is preserved, hence a canonical monomial remains canonical."""
+
     diff_monomial = []
     power = None
 
@@ -88,9 +124,14 @@ def monomial_degree_in(monomial: MonomialType, variables: set[int]) -> int:
 
 
 def sort_monomial(monomial: MonomialType) -> MonomialType:
-    assert len(monomial) == len({index for index, _ in monomial})
+    """Bring a monomial with unique variable indices into canonical form."""
+
+    sorted_monomial = tuple(sorted(monomial))
+
+    if monomial_validation.enabled:
+        validate_monomial(sorted_monomial)
 
-    return tuple(sorted(monomial, key=lambda m: m[0]))
+    return sorted_monomial
 
 
 def sort_monomials(monomials: Iterable[MonomialType]) -> tuple[MonomialType, ...]:
@@ -6,7 +6,8 @@ from polymat.sparserepr.data.monomial import (
     MonomialType,
     add_monomials,
     differentiate_monomial,
-    sort_monomial,
+    monomial_validation,
+    validate_monomial,
 )
 
 
@@ -20,20 +21,26 @@ def add_polynomial_terms_mutable(
     mutable: PolynomialType,
     terms: Iterable[PolynomialTermType],
 ) -> PolynomialType:
-    for monomial, coefficient in terms:
-        sorted_monomial = sort_monomial(monomial)
+    """
+    Add the terms to the polynomial. The monomials are expected to be in canonical
+    form, see `monomial_validation`.
+    """
+
+    if monomial_validation.enabled:
+        terms = ((validate_monomial(monomial), c) for monomial, c in terms)
 
-        if sorted_monomial in mutable:
-            summation = mutable[sorted_monomial] + coefficient
+    for monomial, coefficient in terms:
+        if monomial in mutable:
+            summation = mutable[monomial] + coefficient
 
             if math.isclose(summation, 0):
-                del mutable[sorted_monomial]
+                del mutable[monomial]
 
             else:
-                mutable[sorted_monomial] = summation
+                mutable[monomial] = summation
 
         else:
-            mutable[sorted_monomial] = coefficient
+            mutable[monomial] = coefficient
 
     return mutable
 
@@ -46,32 +53,38 @@ def add_polynomial_terms_iterable(
 
 def add_polynomial_iterable(
     polynomials: Iterable[PolynomialType],
+    owned: bool = False,
 ) -> MaybePolynomialType:
-    # filter_polynomials = iter(p for p in polynomials if p is not None)
-    polynomials_iter = iter(polynomials)
+    """
+    Add the polynomials to the largest one, such that only the terms of the smaller
+    polynomials are iterated.
 
-    try:
-        first = next(polynomials_iter)
-    except StopIteration:
+    If `owned` is True, the polynomials are temporary results that are not referenced
+    anywhere else, e.g. the products computed by `add_polynomial_products`. The largest
+    one is then updated in place instead of copied.
+    """
+
+    polynomials = tuple(polynomials)
+
+    if not polynomials:
         return None
 
-    # copy and sort monomial dictionary
-    mutable = {
-        sort_monomial(monomial): coefficient for monomial, coefficient in first.items()
-    }
+    largest = max(range(len(polynomials)), key=lambda i: len(polynomials[i]))
+
+    if owned:
+        mutable = polynomials[largest]
 
-    assert len(mutable) == len(first)
+    else:
+        mutable = dict(polynomials[largest])
 
-    for polynomial in polynomials_iter:
-        add_polynomial_terms_mutable(mutable=mutable, terms=polynomial.items())
+    for index, polynomial in enumerate(polynomials):
+        if index != largest:
+            add_polynomial_terms_mutable(mutable=mutable, terms=polynomial.items())
 
     return mutable
 
 
 def add_polynomials(left: PolynomialType, right: PolynomialType) -> MaybePolynomialType:
-    if len(left) < len(right):
-        left, right = right, left
-
     return add_polynomial_iterable((left, right))
 
 
@@ -90,6 +103,13 @@ def add_maybe_polynomials(
         return result
 
 
+def multiply_maybe_polynomials(
+    left: MaybePolynomialType, right: MaybePolynomialType
+) -> MaybePolynomialType:
+    if left and right:
+        return multiply_polynomials(left, right)
+
+
 def constant_polynomial(value: float) -> PolynomialType:
     return {tuple(): value}
 
@@ -155,6 +175,22 @@ def multiply_polynomials(
         return result
 
 
+def add_polynomial_products(
+    pairs: Iterable[tuple[PolynomialType, PolynomialType]],
+) -> MaybePolynomialType:
+    """Sum of the products of the polynomial pairs, e.g. an entry of a matrix multiplication"""
+
+    def gen_polynomials():
+        for left, right in pairs:
+            result = multiply_polynomials(left, right)
+
+            if result:
+                yield result
+
+    # the products are not referenced elsewhere and can be added in place
+    return add_polynomial_iterable(gen_polynomials(), owned=True)
+
+
 def multiply_polynomial_iterable(
     polynomials: Iterable[MaybePolynomialType],
 ) -> MaybePolynomialType:
@@ -1,6 +1,10 @@
 from typing import Iterable
 
-from polymat.sparserepr.data.polynomial import PolynomialType, add_polynomials
+from polymat.sparserepr.data.polynomial import (
+    PolynomialType,
+    add_polynomial_terms_mutable,
+    add_polynomials,
+)
 
 
 type MatrixIndexType = tuple[int, int]
@@ -10,10 +14,32 @@ type PolynomialMatrixType = dict[MatrixIndexType, PolynomialType]
 def polynomial_matrix_from_iterable(
     values: Iterable[tuple[MatrixIndexType, PolynomialType]],
 ) -> PolynomialMatrixType:
+    """
+    Collect the polynomials and add the ones with the same index.
+
+    The first polynomial of an index is stored without copying it. It is copied
+    when a second polynomial is added to it, and the copy, which is owned by the
+    polynomial matrix, is then updated in place.
+    """
+
     polymatrix = {}
+    owned = set()
 
     for index, polynomial in values:
-        if index in polymatrix:
+        if index not in polymatrix:
+            polymatrix[index] = polynomial
+
+        elif index in owned:
+            mutable = add_polynomial_terms_mutable(
+                mutable=polymatrix[index],
+                terms=polynomial.items(),
+            )
+
+            if not mutable:
+                del polymatrix[index]
+                owned.remove(index)
+
+        else:
             summation = add_polynomials(
                 left=polymatrix[index],
                 right=polynomial,
@@ -21,9 +47,8 @@ def polynomial_matrix_from_iterable(
 
             if summation:
                 polymatrix[index] = summation
+                owned.add(index)
             else:
                 del polymatrix[index]
-        else:
-            polymatrix[index] = polynomial
 
     return polymatrix
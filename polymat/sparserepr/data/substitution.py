@@ -0,0 +1,151 @@
+import math
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from polymat.sparserepr.data.monomial import MonomialType
+from polymat.sparserepr.data.polynomialmatrix import (
+    MatrixIndexType,
+    PolynomialMatrixType,
+)
+from polymat.sparserepr.data.polynomial import PolynomialType
+
+if TYPE_CHECKING:
+    import scipy.sparse
+
+
+class PreparedSubstitution(NamedTuple):
+    """
+    Symbolic structure of a substitution that only depends on which variables
+    are substituted, and not on their values.
+
+    Each term of the polynomial matrix is mapped to the residual monomial it
+    collapses into. The coefficients of the residual monomials are then
+    obtained by a sparse matrix-vector product:
+
+        coefficients = matrix @ factors
+
+    where `factors` contains for each term the product of the powers of the
+    substituted variables.
+    """
+
+    indices: tuple[int, ...]
+    """ Substituted variable indices, in the order of the values. """
+
+    entries: tuple[tuple[MatrixIndexType, MonomialType], ...]
+    """ Matrix index and residual monomial of each row of the matrix. """
+
+    matrix: "scipy.sparse.csr_array"
+    """ Coefficients of the terms, mapped to the rows of their residual monomials. """
+
+    factor_terms: NDArray
+    """ Term of each substituted variable occurrence. """
+
+    factor_pairs: NDArray
+    """ Position in `indices` and power of the distinct substituted variable occurrences. """
+
+    factor_inverse: NDArray
+    """ Index into `factor_pairs` of each substituted variable occurrence. """
+
+    def substitute(self, values: NDArray) -> PolynomialMatrixType:
+        """Substitute the variables with the values given in the order of `indices`."""
+
+        factors = np.ones(self.matrix.shape[1], dtype=np.double)
+
+        if len(self.factor_terms):
+            # table of powers of the distinct (variable, power) pairs
+            table = values[self.factor_pairs[0]] ** self.factor_pairs[1]
+
+            np.multiply.at(factors, self.factor_terms, table[self.factor_inverse])
+
+        coefficients = self.matrix @ factors
+
+        polymatrix = {}
+
+        for (matrix_index, monomial), value in zip(self.entries, coefficients.tolist()):
+            if math.isclose(value, 0):
+                continue
+
+            if matrix_index in polymatrix:
+                polymatrix[matrix_index][monomial] = value
+            else:
+                polymatrix[matrix_index] = {monomial: value}
+
+        return polymatrix
+
+
+def prepare_substitution(
+    entries: Iterable[tuple[MatrixIndexType, PolynomialType]],
+    indices: tuple[int, ...],
+) -> PreparedSubstitution:
+    """
+    Split each term into the substituted variables and the residual monomial:
+
+        x1*x2**2  with x2 substituted  ->  (x1, x2**2)
+    """
+
+    import scipy.sparse
+
+    index_to_position = {index: position for position, index in enumerate(indices)}
+
+    # row of the matrix associated with a (matrix index, residual monomial) pair
+    rows = {}
+    term_rows = []
+    coefficients = []
+
+    # (term, variable position, power) for each substituted variable
+    factor_terms = []
+    factor_positions = []
+    factor_powers = []
+
+    for matrix_index, polynomial in entries:
+        for monomial, coefficient in polynomial.items():
+            term = len(coefficients)
+            residual = []
+
+            for index, power in monomial:
+                if index in index_to_position:
+                    factor_terms.append(term)
+                    factor_positions.append(index_to_position[index])
+                    factor_powers.append(power)
+                else:
+                    residual.append((index, power))
+
+            key = (matrix_index, tuple(residual))
+
+            if key not in rows:
+                rows[key] = len(rows)
+
+            term_rows.append(rows[key])
+            coefficients.append(coefficient)
+
+    n_terms = len(coefficients)
+
+    matrix = scipy.sparse.csr_array(
+        (
+            np.array(coefficients, dtype=np.double),
+            (np.array(term_rows, dtype=np.int64), np.arange(n_terms)),
+        ),
+        shape=(len(rows), n_terms),
+    )
+
+    if factor_terms:
+        factor_pairs, factor_inverse = np.unique(
+            np.array((factor_positions, factor_powers), dtype=np.int64),
+            axis=1,
+            return_inverse=True,
+        )
+    else:
+        factor_pairs = np.zeros((2, 0), dtype=np.int64)
+        factor_inverse = np.zeros(0, dtype=np.int64)
+
+    return PreparedSubstitution(
+        indices=indices,
+        entries=tuple(rows),
+        matrix=matrix,
+        factor_terms=np.array(factor_terms, dtype=np.int64),
+        factor_pairs=factor_pairs,
+        factor_inverse=factor_inverse.reshape(-1),
+    )
+
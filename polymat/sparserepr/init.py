@@ -1,5 +1,8 @@
+from dataclasses import field
+
 from dataclassabc import dataclassabc
 
+from polymat.utils.lrucache import LRUCache
 from polymat.sparserepr.data.polynomialmatrix import (
     MatrixIndexType,
     PolynomialMatrixType,
@@ -25,6 +28,9 @@ from polymat.sparserepr.operations.reshapesparsereprmixin import (
 from polymat.sparserepr.operations.getitemsparsereprmixin import (
     GetItemSparseReprMixin,
 )
+from polymat.sparserepr.operations.hstacksparsereprmixin import (
+    HStackSparseReprMixin,
+)
 from polymat.sparserepr.operations.symmetricsparsereprmixin import (
     SymmetricSparseReprMixin,
 )
@@ -37,21 +43,119 @@ from polymat.sparserepr.operations.vecfromdiagmatrixsparsereprmixin import (
 from polymat.sparserepr.operations.frompolynomialmixin import (
     FromPolynomialMatrixMixin,
 )
-from polymat.sparserepr.sparserepr import SparseRepr
+from polymat.sparserepr.materializationpolicy import (
+    DEFAULT_MATERIALIZATION_POLICY,
+    MaterializationPolicy,
+)
+from polymat.sparserepr.sparserepr import (
+    SparseRepr,
+    ViewSparseReprMixin,
+)
 from polymat.sparserepr.operations.vstacksparsereprmixin import (
     VStackSparseReprMixin,
 )
 from typing import Iterable
 
 
+def _init_entry_cache(policy: MaterializationPolicy) -> LRUCache | None:
+    maxsize = policy.entry_cache_size
+
+    if maxsize:
+        return LRUCache(maxsize=maxsize)
+
+
+def to_view_depth(sparse_repr: SparseRepr) -> int:
+    """Number of views chained on top of the polynomial matrices stored as dictionaries."""
+
+    if isinstance(sparse_repr, ViewSparseReprMixin):
+        return sparse_repr.view_depth
+    else:
+        return 0
+
+
+def to_access_cost(sparse_repr: SparseRepr) -> int:
+    """
+    Estimated cost of accessing an entry, counted in dictionary lookups and index
+    translations. A polynomial multiplication or addition is counted as 4.
+    """
+
+    if isinstance(sparse_repr, ViewSparseReprMixin):
+        return sparse_repr.access_cost
+    else:
+        return 1
+
+
+# the depth and the cost of a view are computed from the ones stored by its
+# children, such that creating a chain of views does not traverse it
+
+
+def _to_view_depth(children: Iterable[SparseRepr]) -> int:
+    return 1 + max((to_view_depth(child) for child in children), default=0)
+
+
+def _to_single_child_access_cost(child: SparseRepr) -> int:
+    return 1 + to_access_cost(child)
+
+
+def _to_multi_children_access_cost(children: Iterable[SparseRepr]) -> int:
+    # an entry is located in a single child
+    return 1 + max((to_access_cost(child) for child in children), default=0)
+
+
+def materialize(sparse_repr: SparseRepr) -> SparseRepr:
+    """Compute all entries of a view and store them in a dictionary."""
+
+    if isinstance(sparse_repr, FromPolynomialMatrixMixin):
+        return sparse_repr
+
+    return init_from_polynomial_matrix(
+        data=dict(sparse_repr.entries()),
+        shape=sparse_repr.shape,
+    )
+
+
+def apply_materialization_policy(
+    sparse_repr: ViewSparseReprMixin, policy: MaterializationPolicy
+) -> SparseRepr:
+    if policy.max_depth is not None and policy.max_depth < sparse_repr.view_depth:
+        return materialize(sparse_repr)
+
+    if (
+        policy.max_access_cost is not None
+        and policy.max_access_cost < sparse_repr.access_cost
+    ):
+        return materialize(sparse_repr)
+
+    return sparse_repr
+
+
 @dataclassabc(frozen=True, slots=True)
 class BlockDiagonalSparseReprImpl(BlockDiagonalSparseReprMixin):
     children: tuple[SparseRepr]
     row_col_ranges: tuple[tuple[range, range], ...]
     shape: tuple[int, int]
+    row_starts: tuple[int, ...]
+    view_depth: int
+    access_cost: int
 
 
-init_block_diagonal_sparse_repr = BlockDiagonalSparseReprImpl
+def init_block_diagonal_sparse_repr(
+    children: tuple[SparseRepr],
+    row_col_ranges: tuple[tuple[range, range], ...],
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        BlockDiagonalSparseReprImpl(
+            children=children,
+            row_col_ranges=row_col_ranges,
+            shape=shape,
+            row_starts=tuple(row_range.start for row_range, _ in row_col_ranges),
+            view_depth=_to_view_depth(children),
+            access_cost=_to_multi_children_access_cost(children),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -67,9 +171,24 @@ init_broadcast_sparse_repr = BroadcastSparseReprImpl
 class DiagMatrixFromVecSparseReprImpl(DiagMatrixFromVecSparseReprMixin):
     child: SparseRepr
     shape: tuple[int, int]
+    view_depth: int
+    access_cost: int
 
 
-init_diag_matrix_from_vec_sparse_repr = DiagMatrixFromVecSparseReprImpl
+def init_diag_matrix_from_vec_sparse_repr(
+    child: SparseRepr,
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        DiagMatrixFromVecSparseReprImpl(
+            child=child,
+            shape=shape,
+            view_depth=_to_view_depth((child,)),
+            access_cost=_to_single_child_access_cost(child),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -77,9 +196,29 @@ class KronSparseReprImpl(KronSparseReprMixin):
     left: SparseRepr
     right: SparseRepr
     shape: tuple[int, int]
+    # the cached entries do not change the polynomial matrix
+    entry_cache: LRUCache | None = field(compare=False)
+    view_depth: int
+    access_cost: int
 
 
-init_kron_sparse_repr = KronSparseReprImpl
+def init_kron_sparse_repr(
+    left: SparseRepr,
+    right: SparseRepr,
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        KronSparseReprImpl(
+            left=left,
+            right=right,
+            shape=shape,
+            entry_cache=_init_entry_cache(policy),
+            view_depth=_to_view_depth((left, right)),
+            access_cost=5 + to_access_cost(left) + to_access_cost(right),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -87,9 +226,55 @@ class GetItemSparseReprImpl(GetItemSparseReprMixin):
     child: SparseRepr
     key: tuple[tuple[int, ...], tuple[int, ...]]
     shape: tuple[int, int]
+    view_depth: int
+    access_cost: int
+
+
+def init_get_item_sparse_repr(
+    child: SparseRepr,
+    key: tuple[tuple[int, ...], tuple[int, ...]],
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        GetItemSparseReprImpl(
+            child=child,
+            key=key,
+            shape=shape,
+            view_depth=_to_view_depth((child,)),
+            access_cost=_to_single_child_access_cost(child),
+        ),
+        policy,
+    )
+
+
+@dataclassabc(frozen=True, slots=True)
+class HStackSparseReprImpl(HStackSparseReprMixin):
+    children: tuple[SparseRepr, ...]
+    col_ranges: tuple[range, ...]
+    shape: tuple[int, int]
+    col_starts: tuple[int, ...]
+    view_depth: int
+    access_cost: int
 
 
-init_get_item_sparse_repr = GetItemSparseReprImpl
+def init_hstack_sparse_repr(
+    children: tuple[SparseRepr, ...],
+    col_ranges: tuple[range, ...],
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        HStackSparseReprImpl(
+            children=children,
+            col_ranges=col_ranges,
+            shape=shape,
+            col_starts=tuple(col_range.start for col_range in col_ranges),
+            view_depth=_to_view_depth(children),
+            access_cost=_to_multi_children_access_cost(children),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -117,10 +302,26 @@ def init_sparse_repr_from_iterable(
 @dataclassabc(frozen=True, slots=True)
 class SymmetricSparseReprImpl(SymmetricSparseReprMixin):
     child: SparseRepr
+    # the cached entries do not change the polynomial matrix
+    entry_cache: LRUCache | None = field(compare=False)
+    view_depth: int
+    access_cost: int
 
 
-def init_symmetric_sparse_repr(child: SparseRepr):
-    return SymmetricSparseReprImpl(child=child)
+def init_symmetric_sparse_repr(
+    child: SparseRepr,
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        SymmetricSparseReprImpl(
+            child=child,
+            entry_cache=_init_entry_cache(policy),
+            view_depth=_to_view_depth((child,)),
+            # accesses the child twice and adds the results
+            access_cost=5 + 2 * to_access_cost(child),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -128,43 +329,95 @@ class RepMatSparseReprImpl(RepMatSparseReprMixin):
     child: SparseRepr
     child_shape: tuple[int, int]
     shape: tuple[int, int]
+    view_depth: int
+    access_cost: int
 
 
-init_repmat_sparse_repr = RepMatSparseReprImpl
+def init_repmat_sparse_repr(
+    child: SparseRepr,
+    child_shape: tuple[int, int],
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        RepMatSparseReprImpl(
+            child=child,
+            child_shape=child_shape,
+            shape=shape,
+            view_depth=_to_view_depth((child,)),
+            access_cost=_to_single_child_access_cost(child),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
 class ReshapeSparseReprImpl(ReshapeSparseReprMixin):
     child: SparseRepr
     shape: tuple[int, int]
+    view_depth: int
+    access_cost: int
 
 
 def init_reshape_sparse_repr(
     child: SparseRepr,
     shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
 ):
-    return ReshapeSparseReprImpl(
-        child=child,
-        shape=shape,
+    return apply_materialization_policy(
+        ReshapeSparseReprImpl(
+            child=child,
+            shape=shape,
+            view_depth=_to_view_depth((child,)),
+            access_cost=_to_single_child_access_cost(child),
+        ),
+        policy,
     )
 
 
 @dataclassabc(frozen=True, slots=True)
 class TransposeSparseReprImpl(TransposeSparseReprMixin):
     child: SparseRepr
+    view_depth: int
+    access_cost: int
 
 
-def init_transpose_sparse_repr(child: SparseRepr):
-    return TransposeSparseReprImpl(child=child)
+def init_transpose_sparse_repr(
+    child: SparseRepr,
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        TransposeSparseReprImpl(
+            child=child,
+            view_depth=_to_view_depth((child,)),
+            access_cost=_to_single_child_access_cost(child),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
 class VecFromDiagMatrixSparseReprImpl(VecFromDiagMatrixSparseReprMixin):
     child: SparseRepr
     shape: tuple[int, int]
+    view_depth: int
+    access_cost: int
 
 
-init_vec_from_diag_matrix_sparse_repr = VecFromDiagMatrixSparseReprImpl
+def init_vec_from_diag_matrix_sparse_repr(
+    child: SparseRepr,
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        VecFromDiagMatrixSparseReprImpl(
+            child=child,
+            shape=shape,
+            view_depth=_to_view_depth((child,)),
+            access_cost=_to_single_child_access_cost(child),
+        ),
+        policy,
+    )
 
 
 @dataclassabc(frozen=True, slots=True)
@@ -172,6 +425,25 @@ class VStackSparseReprImpl(VStackSparseReprMixin):
     children: tuple[SparseRepr, ...]
     row_ranges: tuple[range, ...]
     shape: tuple[int, int]
+    row_starts: tuple[int, ...]
+    view_depth: int
+    access_cost: int
 
 
-init_vstack_sparse_repr = VStackSparseReprImpl
+def init_vstack_sparse_repr(
+    children: tuple[SparseRepr, ...],
+    row_ranges: tuple[range, ...],
+    shape: tuple[int, int],
+    policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
+    return apply_materialization_policy(
+        VStackSparseReprImpl(
+            children=children,
+            row_ranges=row_ranges,
+            shape=shape,
+            row_starts=tuple(row_range.start for row_range in row_ranges),
+            view_depth=_to_view_depth(children),
+            access_cost=_to_multi_children_access_cost(children),
+        ),
+        policy,
+    )
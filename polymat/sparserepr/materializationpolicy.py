@@ -0,0 +1,30 @@
+from typing import NamedTuple
+
+
+class MaterializationPolicy(NamedTuple):
+    """
+    Decides when a lazy view is converted to a dictionary.
+
+    A view like the transpose or the Kronecker product does not store its entries,
+    but computes them from its children on each access. Chaining views therefore
+    multiplies the work done per accessed entry, which is repeated every time the
+    resulting polynomial matrix is accessed, e.g. by a matrix multiplication.
+
+    The policy is given by the state, see `init_state`. Views are never materialized
+    with `MaterializationPolicy(None, None)`.
+    """
+
+    max_depth: int | None = 4
+    """ Maximum number of views chained on top of a polynomial matrix stored as a dictionary. """
+
+    max_access_cost: int | None = 8
+    """ Maximum estimated cost of accessing an entry of a view, see `to_access_cost`. """
+
+    entry_cache_size: int | None = 1024
+    """
+    Number of computed entries kept by the views that multiply or add polynomials on
+    access, i.e. the Kronecker product and the symmetric view.
+    """
+
+
+DEFAULT_MATERIALIZATION_POLICY = MaterializationPolicy()
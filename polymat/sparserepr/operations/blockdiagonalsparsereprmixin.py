@@ -1,7 +1,9 @@
 from abc import abstractmethod
-from typing import override
+from bisect import bisect_right
+from typing import Iterable, override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import MultiChildrenSparseReprMixin
 
 
@@ -10,10 +12,27 @@ class BlockDiagonalSparseReprMixin(MultiChildrenSparseReprMixin):
     @abstractmethod
     def row_col_ranges(self) -> tuple[tuple[range, range], ...]: ...
 
+    @property
+    @abstractmethod
+    def row_starts(self) -> tuple[int, ...]:
+        """First row of each block in ascending order, used to bisect the block of a row."""
+
     @override
     def at(self, row: int, col: int) -> MaybePolynomialType:
+        index = bisect_right(self.row_starts, row) - 1
+
+        if index < 0:
+            return None
+
+        row_range, col_range = self.row_col_ranges[index]
+
+        if row in row_range and col in col_range:
+            block_row = row - row_range.start
+            block_col = col - col_range.start
+            return self.children[index].at(block_row, block_col)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
         for (row_range, col_range), pm in zip(self.row_col_ranges, self.children):
-            if row in row_range and col in col_range:
-                block_row = row - row_range.start
-                block_col = col - col_range.start
-                return pm.at(block_row, block_col)
+            for (row, col), polynomial in pm.entries():
+                yield (row + row_range.start, col + col_range.start), polynomial
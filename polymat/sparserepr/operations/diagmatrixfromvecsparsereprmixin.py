@@ -1,6 +1,9 @@
+from typing import Iterable
+
 from typing_extensions import override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import SingleChildSparseReprMixin
 
 
@@ -9,3 +12,8 @@ class DiagMatrixFromVecSparseReprMixin(SingleChildSparseReprMixin):
     def at(self, row: int, col: int) -> MaybePolynomialType:
         if row == col:
             return self.child.at(row, 0)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        for (row, _), polynomial in self.child.entries():
+            yield (row, row), polynomial
@@ -0,0 +1,41 @@
+from abc import abstractmethod
+from bisect import bisect_right
+from typing import Iterable
+
+from typing_extensions import override
+
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
+from polymat.sparserepr.sparserepr import MultiChildrenSparseReprMixin
+
+
+class HStackSparseReprMixin(MultiChildrenSparseReprMixin):
+    @property
+    @abstractmethod
+    def col_ranges(self) -> tuple[range, ...]: ...
+
+    @property
+    @abstractmethod
+    def col_starts(self) -> tuple[int, ...]:
+        """First column of each block in ascending order, used to bisect the block of a column."""
+
+    @override
+    def at(self, row: int, col: int) -> MaybePolynomialType:
+        index = bisect_right(self.col_starts, col) - 1
+
+        if index < 0:
+            return None
+
+        block_range = self.col_ranges[index]
+
+        if col < block_range.stop:
+            return self.children[index].at(
+                row=row,
+                col=col - block_range.start,
+            )
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        for polymatrix, block_range in zip(self.children, self.col_ranges):
+            for (row, col), polynomial in polymatrix.entries():
+                yield (row, col + block_range.start), polynomial
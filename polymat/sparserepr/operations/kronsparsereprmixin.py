@@ -1,12 +1,40 @@
-from typing import override
+from abc import abstractmethod
+from typing import Iterable, override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType, multiply_polynomials
+from polymat.sparserepr.data.polynomial import (
+    MaybePolynomialType,
+    PolynomialType,
+    multiply_polynomials,
+)
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import TwoChildrenSparseReprMixin
+from polymat.utils.lrucache import LRUCache
 
 
 class KronSparseReprMixin(TwoChildrenSparseReprMixin):
+    @property
+    @abstractmethod
+    def entry_cache(self) -> LRUCache | None:
+        """Recently accessed entries, such that their products are not recomputed."""
+
     @override
     def at(self, row: int, col: int) -> MaybePolynomialType:
+        cache = self.entry_cache
+
+        if cache is None:
+            return self._compute_entry(row, col)
+
+        try:
+            polynomial = cache[row, col]
+        except KeyError:
+            polynomial = self._compute_entry(row, col)
+            cache[row, col] = polynomial
+
+        # the caller may modify the returned polynomial, e.g. when adding to it
+        if polynomial is not None:
+            return dict(polynomial)
+
+    def _compute_entry(self, row: int, col: int) -> MaybePolynomialType:
         left_row = row // self.right.shape[0]
         right_row = row - left_row * self.right.shape[0]
 
@@ -18,3 +46,15 @@ class KronSparseReprMixin(TwoChildrenSparseReprMixin):
 
         if left and right:
             return multiply_polynomials(left, right)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        n_row, n_col = self.right.shape
+        right_entries = tuple(self.right.entries())
+
+        for (left_row, left_col), left in self.left.entries():
+            for (right_row, right_col), right in right_entries:
+                result = multiply_polynomials(left, right)
+
+                if result:
+                    yield (left_row * n_row + right_row, left_col * n_col + right_col), result
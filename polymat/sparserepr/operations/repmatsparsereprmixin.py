@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import override
+from typing import Iterable, override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import SingleChildSparseReprMixin
 
 
@@ -18,3 +19,14 @@ class RepMatSparseReprMixin(SingleChildSparseReprMixin):
         rel_col = col % n_col
 
         return self.child.at(row=rel_row, col=rel_col)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        n_row, n_col = self.child_shape
+        row_reps = self.shape[0] // n_row
+        col_reps = self.shape[1] // n_col
+
+        for (rel_row, rel_col), polynomial in self.child.entries():
+            for row_rep in range(row_reps):
+                for col_rep in range(col_reps):
+                    yield (row_rep * n_row + rel_row, col_rep * n_col + rel_col), polynomial
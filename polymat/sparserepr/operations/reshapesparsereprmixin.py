@@ -1,6 +1,7 @@
-from typing import override
+from typing import Iterable, override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import SingleChildSparseReprMixin
 
 
@@ -13,3 +14,13 @@ class ReshapeSparseReprMixin(SingleChildSparseReprMixin):
         child_row = index - child_col * self.child.shape[0]
 
         return self.child.at(row=child_row, col=child_col)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        for (child_row, child_col), polynomial in self.child.entries():
+            index = child_row + self.child.shape[0] * child_col
+
+            col = index // self.shape[0]
+            row = index - col * self.shape[0]
+
+            yield (row, col), polynomial
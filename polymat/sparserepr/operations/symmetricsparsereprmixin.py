@@ -1,12 +1,16 @@
-from typing import override
+from abc import abstractmethod
+from typing import Iterable, override
 
 from polymat.sparserepr.data.polynomial import (
     MaybePolynomialType,
+    PolynomialType,
     add_polynomials,
     multiply_with_scalar,
     multiply_with_scalar_mutable,
 )
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import SingleChildSparseReprMixin
+from polymat.utils.lrucache import LRUCache
 
 
 class SymmetricSparseReprMixin(SingleChildSparseReprMixin):
@@ -15,8 +19,29 @@ class SymmetricSparseReprMixin(SingleChildSparseReprMixin):
         max_dim = max(self.child.shape)
         return max_dim, max_dim
 
+    @property
+    @abstractmethod
+    def entry_cache(self) -> LRUCache | None:
+        """Recently accessed entries, such that their sums are not recomputed."""
+
     @override
     def at(self, row: int, col: int) -> MaybePolynomialType:
+        cache = self.entry_cache
+
+        if cache is None:
+            return self._compute_entry(row, col)
+
+        try:
+            polynomial = cache[row, col]
+        except KeyError:
+            polynomial = self._compute_entry(row, col)
+            cache[row, col] = polynomial
+
+        # the caller may modify the returned polynomial, e.g. when adding to it
+        if polynomial is not None:
+            return dict(polynomial)
+
+    def _compute_entry(self, row: int, col: int) -> MaybePolynomialType:
         left = self.child.at(row, col)
         right = self.child.at(col, row)
 
@@ -31,3 +56,17 @@ class SymmetricSparseReprMixin(SingleChildSparseReprMixin):
 
                 if mutable:
                     return multiply_with_scalar_mutable(mutable=mutable, scalar=0.5)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        indices = set()
+
+        for (row, col), _ in self.child.entries():
+            indices.add((row, col))
+            indices.add((col, row))
+
+        for row, col in sorted(indices):
+            polynomial = self.at(row, col)
+
+            if polynomial:
+                yield (row, col), polynomial
@@ -1,8 +1,10 @@
 from functools import cached_property
+from typing import Iterable
 
 from typing_extensions import override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import SingleChildSparseReprMixin
 
 
@@ -14,3 +16,8 @@ class TransposeSparseReprMixin(SingleChildSparseReprMixin):
     @override
     def at(self, row: int, col: int) -> MaybePolynomialType:
         return self.child.at(row=col, col=row)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        for (row, col), polynomial in self.child.entries():
+            yield (col, row), polynomial
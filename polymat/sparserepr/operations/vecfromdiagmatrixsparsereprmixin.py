@@ -1,6 +1,9 @@
+from typing import Iterable
+
 from typing_extensions import override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import SingleChildSparseReprMixin
 
 
@@ -8,3 +11,9 @@ class VecFromDiagMatrixSparseReprMixin(SingleChildSparseReprMixin):
     @override
     def at(self, row: int, col: int) -> MaybePolynomialType:
         return self.child.at(row, row)
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
+        for (row, col), polynomial in self.child.entries():
+            if row == col:
+                yield (row, 0), polynomial
@@ -1,7 +1,11 @@
 from abc import abstractmethod
+from bisect import bisect_right
+from typing import Iterable
+
 from typing_extensions import override
 
-from polymat.sparserepr.data.polynomial import MaybePolynomialType
+from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
+from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.sparserepr import MultiChildrenSparseReprMixin
 
 
@@ -10,11 +14,28 @@ class VStackSparseReprMixin(MultiChildrenSparseReprMixin):
     @abstractmethod
     def row_ranges(self) -> tuple[range, ...]: ...
 
+    @property
+    @abstractmethod
+    def row_starts(self) -> tuple[int, ...]:
+        """First row of each block in ascending order, used to bisect the block of a row."""
+
     @override
     def at(self, row: int, col: int) -> MaybePolynomialType:
+        index = bisect_right(self.row_starts, row) - 1
+
+        if index < 0:
+            return None
+
+        block_range = self.row_ranges[index]
+
+        if row < block_range.stop:
+            return self.children[index].at(
+                row=row - block_range.start,
+                col=col,
+            )
+
+    @override
+    def entries(self) -> Iterable[tuple[MatrixIndexType, PolynomialType]]:
         for polymatrix, block_range in zip(self.children, self.row_ranges):
-            if block_range.start <= row < block_range.stop:
-                return polymatrix.at(
-                    row=row - block_range.start,
-                    col=col,
-                )
+            for (row, col), polynomial in polymatrix.entries():
+                yield (row + block_range.start, col), polynomial
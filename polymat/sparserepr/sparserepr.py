@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
+from polymat.sparserepr.data.entryarrays import (
+    EntryArrays,
+    entry_arrays_from_iterable,
+)
 from polymat.sparserepr.data.monomial import MonomialType
 from polymat.sparserepr.data.polynomialmatrix import MatrixIndexType
 from polymat.sparserepr.data.polynomial import MaybePolynomialType, PolynomialType
@@ -51,6 +55,17 @@ class SparseRepr(ABC):
                 if polynomial:
                     yield (row, col), polynomial
 
+    def to_entry_arrays(self, variables: set[int] | None = None) -> EntryArrays:
+        """
+        Export the non-zero entries as flat arrays of rows, columns, constant terms
+        and degrees.
+
+        Args:
+            variables: If given, the degrees only count the powers of these variables.
+        """
+
+        return entry_arrays_from_iterable(self.entries(), variables=variables)
+
     @property
     def n_entries(self) -> int:
         nrows, ncols = self.shape
@@ -69,7 +84,23 @@ class SparseRepr(ABC):
                 yield index
 
 
-class TwoChildrenSparseReprMixin(SparseRepr):
+class ViewSparseReprMixin(SparseRepr):
+    """
+    Polynomial matrix that computes its entries from its children on each access.
+    """
+
+    @property
+    @abstractmethod
+    def view_depth(self) -> int:
+        """Number of views chained on top of the polynomial matrices stored as dictionaries."""
+
+    @property
+    @abstractmethod
+    def access_cost(self) -> int:
+        """Estimated cost of accessing an entry, see `to_access_cost`."""
+
+
+class TwoChildrenSparseReprMixin(ViewSparseReprMixin):
     @property
     @abstractmethod
     def left(self) -> SparseRepr: ...
@@ -79,13 +110,13 @@ class TwoChildrenSparseReprMixin(SparseRepr):
     def right(self) -> SparseRepr: ...
 
 
-class SingleChildSparseReprMixin(SparseRepr):
+class SingleChildSparseReprMixin(ViewSparseReprMixin):
     @property
     @abstractmethod
     def child(self) -> SparseRepr: ...
 
 
-class MultiChildrenSparseReprMixin(SparseRepr):
+class MultiChildrenSparseReprMixin(ViewSparseReprMixin):
     @property
     @abstractmethod
     def children(self) -> tuple[SparseRepr, ...]: ...
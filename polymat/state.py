@@ -1,8 +1,14 @@
-from typing import NamedTuple, Self
+from concurrent.futures import Executor
+from typing import Iterable, NamedTuple, Self
 from dataclasses import replace
 from dataclassabc import dataclassabc
 
+from polymat.sparserepr.materializationpolicy import (
+    DEFAULT_MATERIALIZATION_POLICY,
+    MaterializationPolicy,
+)
 from polymat.utils.getstacklines import FrameSummary, to_operator_traceback
+from polymat.utils.profiler import Profiler
 from polymat.symbol import Symbol
 
 
@@ -21,6 +27,10 @@ class State:
         def __iter__(self):
             return iter(range(self.start, self.stop))
 
+        # the default implementation uses tuple(self), which is changed by __iter__
+        def __reduce__(self):
+            return type(self), (self.start, self.stop)
+
     n_indices: int
 
     indices: dict[Symbol, IndexRange]
@@ -32,8 +42,80 @@ class State:
     it does not need to be recomputed again. 
     """
 
-    def copy(self, cache: dict) -> Self:
-        return replace(self, cache=cache)
+    executor: Executor | None
+    """
+    If set, independent children of an expression are applied concurrently using this executor.
+    The results of a process pool executor need to be picklable.
+    """
+
+    profiler: Profiler | None
+    """ If set, records the calls of `ExpressionNode.apply`. """
+
+    materialization_policy: MaterializationPolicy
+    """ Decides when a lazy view of a polynomial matrix is converted to a dictionary. """
+
+    def copy(self, /, **changes) -> Self:
+        return replace(self, **changes)
+
+    def merge(self, other: Self) -> tuple[Self, dict[int, int]] | None:
+        """
+        Merge the variable indices and the cache of a state that was derived independently
+        from a predecessor of this state.
+
+        The variables that `other` indexed after the predecessor are indexed again in
+        the same order, as a sequential evaluation starting from this state would have.
+        The merged state is returned together with the map from the indices of `other`
+        to the new indices, which only contains the indices that changed.
+
+        Returns None if the new indices cannot be obtained by renumbering the indices of
+        `other` without changing their order, or if a variable was indexed with a
+        different size.
+        """
+
+        n_indices = self.n_indices
+        new_indices = {}
+        index_map = {}
+        prev_start = -1
+
+        for symbol, index_range in sorted(
+            other.indices.items(), key=lambda item: item[1].start
+        ):
+            if symbol in self.indices:
+                new_range = self.indices[symbol]
+
+                if len(new_range) != len(index_range):
+                    return None
+
+            else:
+                new_range = State.IndexRange(
+                    start=n_indices, stop=n_indices + len(index_range)
+                )
+                n_indices += len(index_range)
+                new_indices[symbol] = new_range
+
+            # the renumbering has to preserve the order of the indices
+            if new_range.start <= prev_start:
+                return None
+
+            prev_start = new_range.start
+
+            if new_range != index_range:
+                index_map |= dict(zip(index_range, new_range))
+
+        # the cached values of `other` refer to its indices
+        if index_map:
+            cache = self.cache
+        else:
+            cache = self.cache | other.cache
+
+        state = replace(
+            self,
+            n_indices=n_indices,
+            indices=self.indices | new_indices,
+            cache=cache,
+        )
+
+        return state, index_map
 
     def register(
         self, symbol: Symbol, size: int, stack: tuple[FrameSummary, ...]
@@ -69,6 +151,47 @@ class State:
             indices=self.indices | {symbol: index},
         ), index
 
+    def register_all(
+        self,
+        symbols: Iterable[tuple[Symbol, int]],
+        stack: tuple[FrameSummary, ...],
+    ) -> tuple[Self, tuple[IndexRange, ...]]:
+        """
+        Index several variables in the given order and get their index ranges.
+
+        The state is copied only once, instead of once per new variable.
+        """
+
+        n_indices = self.n_indices
+        new_indices = {}
+        index_ranges = []
+
+        for symbol, size in symbols:
+            if symbol in new_indices:
+                index = new_indices[symbol]
+
+            elif symbol in self.indices:
+                # raises an exception if the size does not match
+                _, index = self.register(symbol=symbol, size=size, stack=stack)
+
+            else:
+                index = State.IndexRange(start=n_indices, stop=n_indices + size)
+                n_indices += size
+                new_indices[symbol] = index
+
+            index_ranges.append(index)
+
+        if new_indices:
+            state = replace(
+                self,
+                n_indices=n_indices,
+                indices=self.indices | new_indices,
+            )
+        else:
+            state = self
+
+        return state, tuple(index_ranges)
+
     # retrieval of indices
     ######################
 
@@ -109,9 +232,16 @@ class State:
         return str(symbol)
 
 
-def init_state():
+def init_state(
+    executor: Executor | None = None,
+    profiler: Profiler | None = None,
+    materialization_policy: MaterializationPolicy = DEFAULT_MATERIALIZATION_POLICY,
+):
     return State(
         n_indices=0,
         indices={},
         cache={},
+        executor=executor,
+        profiler=profiler,
+        materialization_policy=materialization_policy,
     )
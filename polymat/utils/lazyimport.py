@@ -0,0 +1,27 @@
+"""
+sympy and scipy are imported lazily, i.e. only by the functions that need them, since
+importing them takes much longer than importing polymat itself.
+
+A value cannot be an instance of a class defined in a module that has not been
+imported yet. Therefore, the type checks below do not import the module.
+"""
+
+import sys
+
+
+def is_sympy_instance(value, class_name: str) -> bool:
+    """Check if the value is an instance of `sympy.<class_name>`."""
+
+    if (sympy := sys.modules.get("sympy")) is None:
+        return False
+
+    return isinstance(value, getattr(sympy, class_name))
+
+
+def is_scipy_sparse(value) -> bool:
+    """Check if the value is a scipy sparse matrix or array."""
+
+    if (scipy_sparse := sys.modules.get("scipy.sparse")) is None:
+        return False
+
+    return scipy_sparse.issparse(value)
@@ -0,0 +1,33 @@
+from collections import OrderedDict
+
+
+class LRUCache(OrderedDict):
+    """
+    Dictionary holding at most `maxsize` items, the least recently used item is
+    removed first.
+
+    A concurrent access by another thread may remove an item between the lookup and
+    the update of its position. In this case a `KeyError` is raised, which the caller
+    handles like a cache miss.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __reduce__(self):
+        return type(self), (self.maxsize,), None, None, iter(self.items())
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+
+        while self.maxsize < len(self):
+            try:
+                self.popitem(last=False)
+            except KeyError:
+                break
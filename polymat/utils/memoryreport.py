@@ -0,0 +1,307 @@
+import dataclasses
+import json
+import sys
+from dataclasses import dataclass, field
+from types import FunctionType, ModuleType
+from typing import Any
+
+import numpy as np
+
+from polymat.arrayrepr.arrayrepr import ArrayRepr
+from polymat.sparserepr.sparserepr import SparseRepr
+
+
+@dataclass
+class MemoryRecord:
+    name: str
+    depth: int
+    shape: tuple[int, ...]
+
+    bytes: int = 0
+    """ Deep size in bytes of the data owned by the node, excluding its children. """
+
+    total_bytes: int = 0
+    """ Deep size in bytes including the children. """
+
+    n_polynomials: int | None = None
+    """ Number of non-zero entries, None if not counted. """
+
+    n_terms: int | None = None
+
+    n_monomials: int | None = None
+    """ Number of distinct monomials. """
+
+    children: list["MemoryRecord"] = field(default_factory=list)
+
+
+def _deep_getsizeof(obj, seen: set[int]) -> int:
+    """
+    Size in bytes of an object and all objects reachable from it. Objects whose
+    id is contained in `seen` are not counted again, such that shared polynomials
+    and monomials are only accounted for once.
+    """
+
+    size = 0
+    stack = [obj]
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType)):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, np.ndarray):
+            # the size of a view does not include the data of the base array
+            if obj.base is not None:
+                stack.append(obj.base)
+
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+
+        elif isinstance(obj, (tuple, list, set, frozenset)):
+            stack.extend(obj)
+
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.extend(vars(obj).values())
+
+            for cls in type(obj).__mro__:
+                for slot in cls.__dict__.get("__slots__", ()):
+                    if hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+
+    return size
+
+
+def _get_fields(obj) -> dict[str, Any]:
+    if dataclasses.is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+
+    return dict(vars(obj))
+
+
+def _is_sparse_repr_tuple(value) -> bool:
+    return (
+        isinstance(value, tuple)
+        and 0 < len(value)
+        and all(isinstance(v, SparseRepr) for v in value)
+    )
+
+
+def _get_name(obj) -> str:
+    return type(obj).__name__.removesuffix("Impl")
+
+
+class MemoryReport:
+    """
+    Memory consumption of a `SparseRepr` tree or an `ArrayRepr`.
+
+    .. code:: py
+
+        state, sparse_repr = polymat.to_sparse_repr(expr).apply(state)
+
+        print(polymat.memory_report(sparse_repr))
+    """
+
+    def __init__(self, root: MemoryRecord):
+        self.root = root
+
+    @property
+    def total_bytes(self) -> int:
+        return self.root.total_bytes
+
+    def records(self):
+        """Iterate over all records in depth-first order."""
+
+        stack = [self.root]
+
+        while stack:
+            record = stack.pop()
+            yield record
+            stack.extend(reversed(record.children))
+
+    def to_json(self, indent: int | None = 2) -> str:
+        def gen_records():
+            for record in self.records():
+                yield {
+                    "name": record.name,
+                    "depth": record.depth,
+                    "shape": record.shape,
+                    "bytes": record.bytes,
+                    "total_bytes": record.total_bytes,
+                    "n_polynomials": record.n_polynomials,
+                    "n_terms": record.n_terms,
+                    "n_monomials": record.n_monomials,
+                }
+
+        return json.dumps(list(gen_records()), indent=indent)
+
+    def __str__(self):
+        def to_str(value):
+            if value is None:
+                return "-"
+            return str(value)
+
+        header = ("node", "shape", "bytes", "total", "polys", "terms", "monos")
+
+        rows = [header] + [
+            (
+                "  " * record.depth + record.name,
+                "x".join(str(n) for n in record.shape),
+                to_str(record.bytes),
+                to_str(record.total_bytes),
+                to_str(record.n_polynomials),
+                to_str(record.n_terms),
+                to_str(record.n_monomials),
+            )
+            for record in self.records()
+        ]
+
+        widths = tuple(max(len(row[i]) for row in rows) for i in range(len(header)))
+
+        def gen_lines():
+            for row in rows:
+                yield "  ".join(
+                    [row[0].ljust(widths[0])]
+                    + [value.rjust(width) for value, width in zip(row[1:], widths[1:])]
+                )
+
+        return "\n".join(gen_lines())
+
+
+def _sparse_repr_record(
+    sparse_repr: SparseRepr,
+    depth: int,
+    seen: set[int],
+    count_views: bool,
+) -> MemoryRecord:
+    record = MemoryRecord(
+        name=_get_name(sparse_repr),
+        depth=depth,
+        shape=sparse_repr.shape,
+    )
+
+    # the node object itself, without following its fields
+    if id(sparse_repr) not in seen:
+        seen.add(id(sparse_repr))
+        record.bytes = sys.getsizeof(sparse_repr)
+
+    children = []
+
+    for value in _get_fields(sparse_repr).values():
+        if isinstance(value, SparseRepr):
+            children.append(value)
+
+        elif _is_sparse_repr_tuple(value):
+            children.extend(value)
+
+        else:
+            record.bytes += _deep_getsizeof(value, seen)
+
+    for child in children:
+        record.children.append(
+            _sparse_repr_record(child, depth + 1, seen, count_views)
+        )
+
+    record.total_bytes = record.bytes + sum(c.total_bytes for c in record.children)
+
+    # counting the entries of a lazy view computes them
+    if count_views or not record.children:
+        n_polynomials = 0
+        n_terms = 0
+        monomials = set()
+
+        for _, polynomial in sparse_repr.entries():
+            n_polynomials += 1
+            n_terms += len(polynomial)
+            monomials.update(polynomial.keys())
+
+        record.n_polynomials = n_polynomials
+        record.n_terms = n_terms
+        record.n_monomials = len(monomials)
+
+    return record
+
+
+def _array_repr_record(array_repr: ArrayRepr, seen: set[int]) -> MemoryRecord:
+    record = MemoryRecord(
+        name=_get_name(array_repr),
+        depth=0,
+        shape=(array_repr.n_eq, array_repr.n_param),
+        n_polynomials=array_repr.n_eq,
+    )
+
+    seen.add(id(array_repr))
+    record.bytes = sys.getsizeof(array_repr)
+
+    for name, value in _get_fields(array_repr).items():
+        # the degree blocks are reported below
+        if name != "data" and value is not array_repr.data:
+            record.bytes += _deep_getsizeof(value, seen)
+
+    seen.add(id(array_repr.data))
+    record.bytes += sys.getsizeof(array_repr.data)
+
+    for degree, array in sorted(array_repr.data.items()):
+        if isinstance(array, np.ndarray):
+            rows, cols = np.nonzero(array)
+        else:
+            import scipy.sparse
+
+            coo = scipy.sparse.coo_array(array)
+            rows, cols = coo.row, coo.col
+
+        record.children.append(
+            MemoryRecord(
+                name=f"degree {degree} ({type(array).__name__})",
+                depth=1,
+                shape=array.shape,
+                bytes=_deep_getsizeof(array, seen),
+                n_polynomials=len(np.unique(rows)),
+                n_terms=len(rows),
+                n_monomials=len(np.unique(cols)),
+            )
+        )
+
+    for child in record.children:
+        child.total_bytes = child.bytes
+
+    record.total_bytes = record.bytes + sum(c.total_bytes for c in record.children)
+    record.n_terms = sum(c.n_terms for c in record.children)
+    record.n_monomials = sum(c.n_monomials for c in record.children)
+
+    return record
+
+
+def memory_report(
+    obj: SparseRepr | ArrayRepr,
+    count_views: bool = True,
+) -> MemoryReport:
+    """
+    Report the deep size in bytes, the number of polynomials, the number of terms
+    and the number of distinct monomials of each node of a `SparseRepr` tree, or of
+    each degree of an `ArrayRepr`.
+
+    Objects shared among several nodes are only accounted for at their first
+    occurrence in depth-first order.
+
+    Args:
+        count_views: If False, the polynomials of the lazy views are not counted,
+            since this requires to compute their entries.
+    """
+
+    seen = set()
+
+    match obj:
+        case SparseRepr():
+            root = _sparse_repr_record(obj, 0, seen, count_views)
+        case ArrayRepr():
+            root = _array_repr_record(obj, seen)
+        case _:
+            raise TypeError(f"Cannot report the memory of {type(obj).__name__}.")
+
+    return MemoryReport(root)
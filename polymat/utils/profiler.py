@@ -0,0 +1,199 @@
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from polymat.sparserepr.operations.frompolynomialmixin import (
+    FromPolynomialMatrixMixin,
+)
+
+
+@dataclass
+class ProfileRecord:
+    node: Any
+    depth: int
+
+    wall_time: float = 0.0
+    """ Time in seconds spent in `apply`, including the children. """
+
+    children_time: float = 0.0
+
+    n_entries: int | None = None
+    """ Number of non-zero entries, None if the result is a lazy view. """
+
+    n_terms: int | None = None
+    """ Number of polynomial terms, None if the result is a lazy view. """
+
+    cache_hit: bool | None = None
+    """ None if the node does not use the cache. """
+
+    children: list["ProfileRecord"] = field(default_factory=list)
+
+    @property
+    def self_time(self) -> float:
+        return self.wall_time - self.children_time
+
+    @property
+    def location(self) -> str | None:
+        stack = getattr(self.node, "stack", None)
+
+        if stack:
+            frame = stack[-1]
+            return f"{frame.filename}:{frame.lineno}"
+
+    @property
+    def operator_name(self) -> str:
+        return type(self.node).__name__.removesuffix("Impl")
+
+
+class Profiler:
+    """
+    Records for each call of `ExpressionNode.apply` the wall time, the size of the result,
+    and whether the cache was hit.
+
+    .. code:: py
+
+        profiler = Profiler()
+        state = polymat.init_state(profiler=profiler)
+        state, _ = polymat.to_array(expr, x).apply(state)
+
+        print(profiler.to_json())
+    """
+
+    def __init__(self):
+        self.roots: list[ProfileRecord] = []
+        self._stack: list[ProfileRecord] = []
+        self._starts: list[float] = []
+
+    @property
+    def depth(self) -> int:
+        """Number of nodes whose `apply` is currently recorded."""
+
+        return len(self._stack)
+
+    def enter(self, node):
+        """Start recording the call of `apply` of the node."""
+
+        record = ProfileRecord(node=node, depth=len(self._stack))
+        self._stack.append(record)
+        self._starts.append(time.perf_counter())
+
+    def exit(self, result=None):
+        """
+        Stop recording the most recently entered node, the result is None if `apply`
+        raised an exception.
+        """
+
+        record = self._stack.pop()
+        record.wall_time = time.perf_counter() - self._starts.pop()
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent.children.append(record)
+            parent.children_time += record.wall_time
+        else:
+            self.roots.append(record)
+
+        # counting the entries of a lazy view would compute it
+        if isinstance(result, FromPolynomialMatrixMixin):
+            record.n_entries = len(result.data)
+            record.n_terms = sum(len(polynomial) for polynomial in result.data.values())
+
+    def profile(self, apply, node, state):
+        self.enter(node)
+
+        try:
+            state, result = apply(node, state)
+
+        except BaseException:
+            self.exit()
+            raise
+
+        self.exit(result)
+
+        return state, result
+
+    def merge(self, other: "Profiler"):
+        """
+        Add the records of the profiler of a concurrently applied node as children of
+        the currently recorded node.
+
+        Their wall times overlap, and are therefore not subtracted from the self time
+        of the node.
+        """
+
+        depth = len(self._stack)
+
+        for record in other.records():
+            record.depth += depth
+
+        if self._stack:
+            self._stack[-1].children.extend(other.roots)
+        else:
+            self.roots.extend(other.roots)
+
+    def mark_cache(self, hit: bool):
+        """Called by the currently profiled node if it looks up the cache."""
+
+        if self._stack:
+            self._stack[-1].cache_hit = hit
+
+    def records(self):
+        """Iterate over all records in depth-first order."""
+
+        stack = list(reversed(self.roots))
+
+        while stack:
+            record = stack.pop()
+            yield record
+            stack.extend(reversed(record.children))
+
+    def to_json(self, max_expression_length: int = 200, indent: int | None = 2) -> str:
+        def gen_records():
+            for record in self.records():
+                expression = str(record.node)
+
+                if max_expression_length < len(expression):
+                    expression = expression[:max_expression_length] + "..."
+
+                yield {
+                    "operator": record.operator_name,
+                    "expression": expression,
+                    "location": record.location,
+                    "depth": record.depth,
+                    "wall_time": record.wall_time,
+                    "self_time": record.self_time,
+                    "n_entries": record.n_entries,
+                    "n_terms": record.n_terms,
+                    "cache_hit": record.cache_hit,
+                }
+
+        return json.dumps(list(gen_records()), indent=indent)
+
+    def to_folded(self) -> str:
+        """
+        Folded stack format where each line consists of the operator names of a path in
+        the expression tree and the self time in microseconds. It can be rendered by
+        flame graph tools like `flamegraph.pl` or speedscope.
+        """
+
+        def to_frame(record: ProfileRecord):
+            if location := record.location:
+                frame = f"{record.operator_name} ({location})"
+            else:
+                frame = record.operator_name
+
+            return frame.replace(";", ",")
+
+        def gen_lines():
+            stack = [(record, to_frame(record)) for record in reversed(self.roots)]
+
+            while stack:
+                record, path = stack.pop()
+
+                yield f"{path} {max(round(record.self_time * 1e6), 0)}"
+
+                for child in reversed(record.children):
+                    stack.append((child, f"{path};{to_frame(child)}"))
+
+        return "\n".join(gen_lines())
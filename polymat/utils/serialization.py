@@ -0,0 +1,232 @@
+from itertools import pairwise
+
+import numpy as np
+
+from polymat.arrayrepr.arrayrepr import ArrayRepr
+from polymat.arrayrepr.init import init_array_repr
+from polymat.sparserepr.init import init_from_polynomial_matrix
+from polymat.sparserepr.sparserepr import SparseRepr
+from polymat.state import State, init_state
+from polymat.symbol import Symbol
+
+
+FORMAT_VERSION = 1
+
+
+def _encode_sparse_repr(sparse_repr: SparseRepr):
+    """
+    The polynomial matrix is stored in flat arrays:
+
+    - `rows`, `cols`: matrix index of each non-zero entry
+    - `entry_offsets`: the terms of entry i are given by the range
+        entry_offsets[i]:entry_offsets[i+1]
+    - `coefficients`: coefficient of each term
+    - `term_offsets`: the variables of term j are given by the range
+        term_offsets[j]:term_offsets[j+1]
+    - `indices`, `powers`: variable index and power of each variable of a term
+    """
+
+    rows = []
+    cols = []
+    entry_offsets = [0]
+    coefficients = []
+    term_offsets = [0]
+    indices = []
+    powers = []
+
+    for (row, col), polynomial in sparse_repr.entries():
+        rows.append(row)
+        cols.append(col)
+
+        for monomial, coefficient in polynomial.items():
+            coefficients.append(coefficient)
+
+            for index, power in monomial:
+                indices.append(index)
+                powers.append(power)
+
+            term_offsets.append(len(indices))
+
+        entry_offsets.append(len(coefficients))
+
+    return {
+        "shape": np.array(sparse_repr.shape, dtype=np.int64),
+        "rows": np.array(rows, dtype=np.int64),
+        "cols": np.array(cols, dtype=np.int64),
+        "entry_offsets": np.array(entry_offsets, dtype=np.int64),
+        "coefficients": np.array(coefficients, dtype=np.double),
+        "term_offsets": np.array(term_offsets, dtype=np.int64),
+        "indices": np.array(indices, dtype=np.int64),
+        "powers": np.array(powers, dtype=np.int64),
+    }
+
+
+def _decode_sparse_repr(arrays) -> SparseRepr:
+    indices = arrays["indices"].tolist()
+    powers = arrays["powers"].tolist()
+    coefficients = arrays["coefficients"].tolist()
+
+    monomials = [
+        tuple(zip(indices[start:stop], powers[start:stop]))
+        for start, stop in pairwise(arrays["term_offsets"].tolist())
+    ]
+
+    data = {
+        (row, col): dict(zip(monomials[start:stop], coefficients[start:stop]))
+        for row, col, (start, stop) in zip(
+            arrays["rows"].tolist(),
+            arrays["cols"].tolist(),
+            pairwise(arrays["entry_offsets"].tolist()),
+        )
+    }
+
+    n_rows, n_cols = arrays["shape"].tolist()
+
+    return init_from_polynomial_matrix(data=data, shape=(n_rows, n_cols))
+
+
+def _encode_array_repr(array_repr: ArrayRepr):
+    """
+    The dense degree blocks are stored as `degree_<d>`, the sparse ones by their
+    CSR components `degree_<d>_data`, `degree_<d>_indices` and `degree_<d>_indptr`.
+    """
+
+    n_row = -1 if array_repr.n_row is None else array_repr.n_row
+
+    arrays = {
+        "shape": np.array(
+            (array_repr.n_eq, array_repr.n_param, n_row), dtype=np.int64
+        ),
+        "degrees": np.array(sorted(array_repr.data), dtype=np.int64),
+    }
+
+    for degree, array in array_repr.data.items():
+        if isinstance(array, np.ndarray):
+            arrays[f"degree_{degree}"] = array
+
+        else:
+            import scipy.sparse
+
+            csr = scipy.sparse.csr_array(array)
+            arrays[f"degree_{degree}_data"] = csr.data
+            arrays[f"degree_{degree}_indices"] = csr.indices
+            arrays[f"degree_{degree}_indptr"] = csr.indptr
+
+    return arrays
+
+
+def _decode_array_repr(arrays) -> ArrayRepr:
+    n_eq, n_param, n_row = arrays["shape"].tolist()
+
+    array_repr = init_array_repr(
+        n_eq=n_eq,
+        n_param=n_param,
+        n_row=None if n_row == -1 else n_row,
+    )
+
+    for degree in arrays["degrees"].tolist():
+        if f"degree_{degree}" in arrays:
+            array_repr.data[degree] = arrays[f"degree_{degree}"]
+
+        else:
+            import scipy.sparse
+
+            array_repr.data[degree] = scipy.sparse.csr_array(
+                (
+                    arrays[f"degree_{degree}_data"],
+                    arrays[f"degree_{degree}_indices"],
+                    arrays[f"degree_{degree}_indptr"],
+                ),
+                shape=(n_eq, n_param**degree),
+            )
+
+    return array_repr
+
+
+def _encode_state(state: State):
+    """
+    Only the variable indices are stored, not the cache, the executor and the
+    profiler.
+    """
+
+    return {
+        "n_indices": np.array(state.n_indices, dtype=np.int64),
+        "symbols": np.array(list(state.indices), dtype=np.str_),
+        "starts": np.array([r.start for r in state.indices.values()], dtype=np.int64),
+        "stops": np.array([r.stop for r in state.indices.values()], dtype=np.int64),
+    }
+
+
+def _decode_state(arrays) -> State:
+    indices = {
+        Symbol(symbol): State.IndexRange(start=start, stop=stop)
+        for symbol, start, stop in zip(
+            arrays["symbols"].tolist(),
+            arrays["starts"].tolist(),
+            arrays["stops"].tolist(),
+        )
+    }
+
+    return init_state().copy(
+        n_indices=int(arrays["n_indices"]),
+        indices=indices,
+    )
+
+
+def save(file, obj: SparseRepr | ArrayRepr | State, compressed: bool = False):
+    """
+    Save a `SparseRepr`, an `ArrayRepr` or the variable indices of a `State` in
+    the NumPy `.npz` format, such that it can be loaded by another process without
+    recomputing it.
+
+    .. code:: py
+
+        state, sparse_repr = polymat.to_sparse_repr(expr).apply(state)
+
+        polymat.save("model.npz", sparse_repr)
+        polymat.save("state.npz", state)
+
+    Args:
+        file: File name or file object.
+        compressed: If True, the arrays are compressed.
+    """
+
+    match obj:
+        case SparseRepr():
+            kind, arrays = "sparse_repr", _encode_sparse_repr(obj)
+        case ArrayRepr():
+            kind, arrays = "array_repr", _encode_array_repr(obj)
+        case State():
+            kind, arrays = "state", _encode_state(obj)
+        case _:
+            raise TypeError(f"Cannot save {type(obj).__name__}.")
+
+    arrays = arrays | {
+        "kind": np.array(kind),
+        "version": np.array(FORMAT_VERSION),
+    }
+
+    if compressed:
+        np.savez_compressed(file, **arrays)
+    else:
+        np.savez(file, **arrays)
+
+
+def load(file) -> SparseRepr | ArrayRepr | State:
+    """Load an object saved by `save`."""
+
+    with np.load(file, allow_pickle=False) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+
+    if int(arrays["version"]) != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {int(arrays['version'])}.")
+
+    match str(arrays["kind"]):
+        case "sparse_repr":
+            return _decode_sparse_repr(arrays)
+        case "array_repr":
+            return _decode_array_repr(arrays)
+        case "state":
+            return _decode_state(arrays)
+        case kind:
+            raise ValueError(f"Unknown kind {kind}.")
@@ -0,0 +1,53 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import polymat
+from polymat.expressiontree.init import (
+    init_from_sparse_repr,
+    init_transpose,
+)
+from polymat.sparserepr.init import init_from_polynomial_matrix
+from polymat.state import init_state
+
+
+def init_deep_tree():
+    child = init_from_sparse_repr(
+        init_from_polynomial_matrix(
+            data={(0, 1): {tuple(): 1.0}},
+            shape=(1, 2),
+        )
+    )
+
+    # deeper than the recursion limit
+    expr = child
+    for _ in range(5001):
+        expr = init_transpose(expr)
+
+    return expr
+
+
+class TestDeepTree(unittest.TestCase):
+    def test_1(self):
+        state = init_state()
+        state, sparse_repr = init_deep_tree().apply(state)
+
+        self.assertTupleEqual((2, 1), sparse_repr.shape)
+        self.assertDictEqual({tuple(): 1.0}, sparse_repr.at(1, 0))
+
+    def test_2(self):
+        profiler = polymat.Profiler()
+        state = init_state(profiler=profiler)
+        state, sparse_repr = init_deep_tree().apply(state)
+
+        self.assertDictEqual({tuple(): 1.0}, sparse_repr.at(1, 0))
+
+        # the records are nested like the expression tree
+        depths = [record.depth for record in profiler.records()]
+        self.assertListEqual(list(range(5002)), depths)
+
+    def test_3(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            state = init_state(executor=executor)
+            state, sparse_repr = init_deep_tree().apply(state)
+
+        self.assertDictEqual({tuple(): 1.0}, sparse_repr.at(1, 0))
@@ -1,6 +1,11 @@
 import unittest
 
-from polymat.expressiontree.init import init_from_sparse_repr, init_addition
+from polymat.expressiontree.init import (
+    init_from_sparse_repr,
+    init_addition,
+    init_summation,
+)
+from polymat.sparserepr.data.monomial import add_monomials, monomial_validation
 from polymat.sparserepr.init import init_from_polynomial_matrix
 from polymat.state import init_state
 
@@ -68,3 +73,105 @@ class TestAddition(unittest.TestCase):
         self.assertTrue({
             tuple(): 1.0,
         }.items() <= data.items())
+
+    def test_2(self):
+        child = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data={(0, 0): {tuple(): 1.0}},
+                shape=(1, 1),
+            )
+        )
+
+        # deeper than the recursion limit
+        expr = child
+        for _ in range(5000):
+            expr = init_addition(left=expr, right=child, stack=tuple())
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertDictEqual({tuple(): 5001.0}, sparse_repr.at(0, 0))
+
+    def test_3(self):
+        vector = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data={
+                    (0, 0): {((0, 1),): 1.0},
+                    (1, 0): {((1, 1),): 1.0},
+                },
+                shape=(2, 1),
+            )
+        )
+
+        scalar = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data={(0, 0): {((0, 1),): -1.0, tuple(): 2.0}},
+                shape=(1, 1),
+            )
+        )
+
+        expr = init_summation(
+            children=(
+                vector,
+                init_addition(left=scalar, right=vector, stack=tuple()),
+                scalar,
+            ),
+            stack=tuple(),
+        )
+
+        # the nested addition is flattened, each summand is applied once
+        self.assertTupleEqual((vector, scalar), expr.operands())
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertDictEqual({tuple(): 4.0}, sparse_repr.at(0, 0))
+        self.assertDictEqual(
+            {((1, 1),): 2.0, ((0, 1),): -2.0, tuple(): 4.0}, sparse_repr.at(1, 0)
+        )
+
+    def test_4(self):
+        # the product of two canonical monomials is canonical
+        monomial = add_monomials(((1, 1), (3, 1)), ((0, 2), (1, 1)))
+        self.assertTupleEqual(((0, 2), (1, 2), (3, 1)), monomial)
+
+        def to_expr(data):
+            return init_from_sparse_repr(
+                init_from_polynomial_matrix(data=data, shape=(1, 1))
+            )
+
+        expr = init_addition(
+            left=to_expr({(0, 0): {monomial: 1.0}}),
+            right=to_expr({(0, 0): {((1, 2), (0, 2), (3, 1)): 1.0}}),
+            stack=tuple(),
+        )
+
+        enabled = monomial_validation.enabled
+        monomial_validation.enabled = True
+
+        try:
+            with self.assertRaises(AssertionError):
+                expr.apply(init_state())
+
+        finally:
+            monomial_validation.enabled = enabled
+
+    def test_5(self):
+        child = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data={(0, 0): {((0, 1),): 1.0}},
+                shape=(1, 1),
+            )
+        )
+
+        # each addition is shared, the flattened chain would have 2**100 summands
+        expr = child
+        for _ in range(100):
+            expr = init_addition(left=expr, right=expr, stack=tuple())
+
+        self.assertTupleEqual(((child, 2**100),), expr.summands)
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertDictEqual({((0, 1),): 2.0**100}, sparse_repr.at(0, 0))
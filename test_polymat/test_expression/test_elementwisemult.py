@@ -0,0 +1,24 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import polymat
+from polymat.state import init_state
+
+
+class TestElementwiseMult(unittest.TestCase):
+    def test_1(self):
+        x = polymat.define_variable("x", size=3)
+        y = polymat.define_variable("y")
+
+        # element-wise with equal shapes, and broadcast of a (1, 1) polynomial
+        expr = polymat.v_stack(((x + 1) * (x - y), (y + 2) * x))
+
+        state = init_state()
+        state, expected = polymat.to_sympy(expr).apply(state)
+
+        for executor_type in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with executor_type(max_workers=2) as executor:
+                state = init_state(executor=executor)
+                state, result = polymat.to_sympy(expr).apply(state)
+
+            self.assertEqual(expected, result)
@@ -1,8 +1,17 @@
 import unittest
+from unittest import mock
 
-from polymat.expressiontree.init import init_from_sparse_repr, init_evaluate
+from polymat.expressiontree.init import (
+    init_addition,
+    init_define_variable,
+    init_elementwise_mult,
+    init_evaluate,
+    init_from_sparse_repr,
+)
+from polymat.expressiontree.operations import evaluate
 from polymat.sparserepr.init import init_from_polynomial_matrix
 from polymat.state import init_state
+from polymat.utils.profiler import Profiler
 from polymat.symbol import Symbol
 
 
@@ -58,3 +67,92 @@ class TestEval(unittest.TestCase):
             }.items()
             <= data.items()
         )
+
+    def test_2(self):
+        expr_terms = {
+            (0, 0): {
+                ((0, 2), (1, 1)): 2.0,
+                ((0, 1), (1, 3)): 1.0,
+                ((1, 1),): 3.0,
+            },
+            (0, 1): {
+                ((0, 3),): 1.0,
+                tuple(): -8.0,
+            },
+        }
+
+        expr = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data=expr_terms,
+                shape=(1, 2),
+            )
+        )
+
+        state = init_state()
+
+        x1 = Symbol("x1")
+
+        state, _ = state.register(x1, 1, stack=tuple())
+
+        expr = init_evaluate(expr, substitutions=(
+            (x1, (2.0,)),
+        ), stack=tuple())
+
+        state, sparse_repr = expr.apply(state)
+
+        data = sparse_repr.at(0, 0)
+        self.assertDictEqual(
+            {
+                ((1, 1),): 11.0,
+                ((1, 3),): 2.0,
+            },
+            data,
+        )
+
+        # 2**3 - 8 cancels out
+        self.assertIsNone(sparse_repr.at(0, 1))
+
+    def test_3(self):
+        x1 = Symbol("x1")
+        x2 = Symbol("x2")
+
+        x1_expr = init_define_variable(x1, stack=tuple())
+        x2_expr = init_define_variable(x2, stack=tuple())
+
+        # x1*x2 + x2*x2
+        expr = init_addition(
+            init_elementwise_mult(x1_expr, x2_expr, stack=tuple()),
+            init_elementwise_mult(x2_expr, x2_expr, stack=tuple()),
+            stack=tuple(),
+        )
+
+        profiler = Profiler()
+        state = init_state(profiler=profiler)
+
+        with mock.patch.object(
+            evaluate, "prepare_substitution", wraps=evaluate.prepare_substitution
+        ) as prepare_substitution:
+            for value in (1.0, 3.0, -2.0):
+                eval_expr = init_evaluate(expr, substitutions=(
+                    (x1, (value,)),
+                ), stack=tuple())
+
+                state, sparse_repr = eval_expr.apply(state)
+
+                self.assertDictEqual(
+                    {
+                        ((1, 1),): value,
+                        ((1, 2),): 1.0,
+                    },
+                    sparse_repr.at(0, 0),
+                )
+
+        # the later evaluations reuse the substitution structure of the first
+        prepare_substitution.assert_called_once()
+
+        cache_hits = tuple(
+            record.cache_hit
+            for record in profiler.records()
+            if record.operator_name == "Evaluate"
+        )
+        self.assertTupleEqual((False, True, True), cache_hits)
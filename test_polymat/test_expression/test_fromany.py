@@ -0,0 +1,34 @@
+import unittest
+
+import sympy
+
+from polymat.expressiontree.from_ import from_any_or_raise_exception
+from polymat.state import init_state
+from polymat.symbol import Symbol
+
+
+class TestFromAny(unittest.TestCase):
+    def test_1(self):
+        x, y, z = sympy.symbols("x y z")
+
+        matrix = sympy.Matrix([[y + 1, 0], [2 * x * y, 3], [x - x, z**2 * x]])
+
+        expr = from_any_or_raise_exception(matrix, stack=tuple())
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        # the variables are indexed in the order of their first appearance
+        self.assertListEqual(
+            [Symbol("y"), Symbol("x"), Symbol("z")], list(state.indices)
+        )
+
+        self.assertDictEqual(
+            {
+                (0, 0): {tuple(): 1.0, ((0, 1),): 1.0},
+                (1, 0): {((0, 1), (1, 1)): 2.0},
+                (1, 1): {tuple(): 3.0},
+                (2, 1): {((1, 1), (2, 2)): 1.0},
+            },
+            dict(sparse_repr.entries()),
+        )
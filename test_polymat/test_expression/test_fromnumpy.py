@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+import scipy.sparse
+
+import polymat
+from polymat.expression.to import to_numpy
+
+from polymat.expressiontree.from_ import from_any_or_raise_exception
+from polymat.expressiontree.operations.fromnumpy import FromNumpy
+from polymat.state import init_state
+
+
+class TestFromNumpy(unittest.TestCase):
+    def test_1(self):
+        array = np.array([[1, 0], [0, -2.5], [3, 0]])
+
+        expr = from_any_or_raise_exception(array, stack=tuple())
+
+        self.assertIsInstance(expr, FromNumpy)
+        # the array is not copied
+        self.assertTrue(np.shares_memory(expr.data, array))
+        self.assertFalse(expr.data.flags.writeable)
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertTupleEqual((3, 2), sparse_repr.shape)
+        self.assertDictEqual(
+            {
+                (0, 0): {tuple(): 1.0},
+                (1, 1): {tuple(): -2.5},
+                (2, 0): {tuple(): 3.0},
+            },
+            dict(sparse_repr.entries()),
+        )
+
+    def test_2(self):
+        # the explicitly stored zero is skipped
+        matrix = scipy.sparse.csr_array(
+            (np.array([2.0, 0.0, 4.0]), (np.array([0, 1, 2]), np.array([1, 0, 2]))),
+            shape=(3, 3),
+        )
+
+        expr = from_any_or_raise_exception(matrix, stack=tuple())
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertTupleEqual((3, 3), sparse_repr.shape)
+        self.assertDictEqual(
+            {
+                (0, 1): {tuple(): 2.0},
+                (2, 2): {tuple(): 4.0},
+            },
+            dict(sparse_repr.entries()),
+        )
+
+    def test_3(self):
+        expr = polymat.from_(np.array([[1.0, 0.0], [0.0, 2.0]])).cache()
+
+        state = init_state()
+        state, first = polymat.to_sparse_repr(expr).apply(state)
+        state, second = polymat.to_sparse_repr(expr).apply(state)
+
+        self.assertEqual(1, len(state.cache))
+        self.assertIs(first, second)
+
+    def test_4(self):
+        array = np.array([[1.0, 0.0], [0.0, 2.0]])
+        expr = polymat.from_(array)
+
+        state = init_state()
+
+        # constant fast paths
+        state, dense = to_numpy(expr).apply(state)
+        state, sparse = polymat.to_scipy_sparse(expr, format="csc").apply(state)
+
+        np.testing.assert_array_equal(array, dense)
+        self.assertEqual("csc", sparse.format)
+        self.assertEqual(2, sparse.nnz)
+        np.testing.assert_array_equal(array, sparse.toarray())
@@ -0,0 +1,47 @@
+import unittest
+
+from polymat.expressiontree.init import (
+    init_from_sparse_repr,
+    init_h_stack,
+)
+from polymat.sparserepr.init import init_from_polynomial_matrix
+from polymat.state import init_state
+
+
+class TestHStack(unittest.TestCase):
+    def test_1(self):
+        left = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data={
+                    (0, 0): {((1, 1),): 1.0},
+                    (1, 0): {tuple(): 2.0},
+                },
+                shape=(2, 1),
+            )
+        )
+
+        right = init_from_sparse_repr(
+            init_from_polynomial_matrix(
+                data={
+                    (0, 1): {tuple(): 3.0},
+                },
+                shape=(2, 2),
+            )
+        )
+
+        # nested stacks are flattened into a single node
+        expr = init_h_stack(
+            children=(init_h_stack(children=(left, right), stack=tuple()), left),
+            stack=tuple(),
+        )
+
+        self.assertEqual(len(expr.children), 3)
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertTupleEqual(sparse_repr.shape, (2, 4))
+        self.assertDictEqual({((1, 1),): 1.0}, sparse_repr.at(0, 0))
+        self.assertDictEqual({tuple(): 3.0}, sparse_repr.at(0, 2))
+        self.assertDictEqual({tuple(): 2.0}, sparse_repr.at(1, 3))
+        self.assertIsNone(sparse_repr.at(1, 1))
@@ -1,8 +1,15 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
-from polymat.expressiontree.init import init_from_sparse_repr, init_v_stack
+from polymat.expressiontree.init import (
+    init_define_variable,
+    init_from_sparse_repr,
+    init_v_stack,
+)
 from polymat.sparserepr.init import init_from_polynomial_matrix
-from polymat.state import init_state
+from polymat.state import State, init_state
+from polymat.symbol import Symbol
 
 
 class TestVStack(unittest.TestCase):
@@ -75,3 +82,90 @@ class TestVStack(unittest.TestCase):
             }.items()
             <= data.items()
         )
+
+    def test_2(self):
+        x = Symbol("x")
+        y = Symbol("y")
+
+        # the second child indexes y before x, unlike a sequential evaluation
+        children = (
+            init_define_variable(x, stack=tuple()),
+            init_v_stack(
+                children=(
+                    init_define_variable(y, stack=tuple()),
+                    init_define_variable(x, stack=tuple()),
+                ),
+                stack=tuple(),
+            ),
+        )
+
+        expr = init_v_stack(children=children, stack=tuple())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            state = init_state(executor=executor)
+            state, sparse_repr = expr.apply(state)
+
+        self.assertEqual(state.indices[x], (0, 1))
+        self.assertEqual(state.indices[y], (1, 2))
+
+        self.assertDictEqual({((0, 1),): 1.0}, sparse_repr.at(0, 0))
+        self.assertDictEqual({((1, 1),): 1.0}, sparse_repr.at(1, 0))
+        self.assertDictEqual({((0, 1),): 1.0}, sparse_repr.at(2, 0))
+
+    def test_3(self):
+        def init_block(value: float, n_row: int):
+            return init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={(row, 0): {tuple(): value} for row in range(n_row)},
+                    shape=(n_row, 1),
+                )
+            )
+
+        children = (init_block(1.0, 2), init_block(2.0, 0), init_block(3.0, 1))
+
+        expr = init_v_stack(children=children, stack=tuple())
+
+        state = init_state()
+        state, sparse_repr = expr.apply(state)
+
+        self.assertDictEqual({tuple(): 1.0}, sparse_repr.at(1, 0))
+        self.assertDictEqual({tuple(): 3.0}, sparse_repr.at(2, 0))
+        self.assertIsNone(sparse_repr.at(3, 0))
+
+        self.assertListEqual(
+            [(0, 0), (1, 0), (2, 0)],
+            [index for index, _ in sparse_repr.entries()],
+        )
+
+    def test_4(self):
+        symbols = tuple(Symbol(f"x{i}") for i in range(6))
+
+        # each child indexes its own variable
+        children = tuple(
+            init_define_variable(symbol, stack=tuple(), size=2) for symbol in symbols
+        )
+
+        expr = init_v_stack(children=children, stack=tuple())
+
+        merged = []
+        merge = State.merge
+
+        def merge_and_record(self, other):
+            result = merge(self, other)
+            merged.append(result is not None)
+            return result
+
+        with (
+            patch.object(State, "merge", merge_and_record),
+            ThreadPoolExecutor(max_workers=3) as executor,
+        ):
+            state = init_state(executor=executor)
+            state, sparse_repr = expr.apply(state)
+
+        # the results of all workers are used
+        self.assertListEqual([True] * 6, merged)
+
+        for i, symbol in enumerate(symbols):
+            self.assertEqual(state.indices[symbol], (2 * i, 2 * i + 2))
+            self.assertDictEqual({((2 * i, 1),): 1.0}, sparse_repr.at(2 * i, 0))
+            self.assertDictEqual({((2 * i + 1, 1),): 1.0}, sparse_repr.at(2 * i + 1, 0))
@@ -0,0 +1,18 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestImport(unittest.TestCase):
+    def test_1(self):
+        # sympy and scipy are only imported by the functions that need them
+        code = (
+            "import sys, polymat; "
+            "print(*sorted({m.split('.')[0] for m in sys.modules} & {'sympy', 'scipy'}))"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        )
+
+        self.assertEqual("", result.stdout.strip())
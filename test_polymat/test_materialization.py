@@ -0,0 +1,117 @@
+import unittest
+
+from polymat.expressiontree.init import init_from_sparse_repr, init_transpose
+from polymat.sparserepr.init import (
+    MaterializationPolicy,
+    init_from_polynomial_matrix,
+    init_kron_sparse_repr,
+    init_reshape_sparse_repr,
+    init_transpose_sparse_repr,
+    to_view_depth,
+)
+from polymat.sparserepr.operations.frompolynomialmixin import (
+    FromPolynomialMatrixMixin,
+)
+from polymat.state import init_state
+
+
+class TestMaterialization(unittest.TestCase):
+    def setUp(self):
+        self.sparse_repr = init_from_polynomial_matrix(
+            data={
+                (0, 0): {((0, 1),): 1.0},
+                (1, 2): {((1, 2),): 2.0},
+            },
+            shape=(2, 3),
+        )
+
+    def test_1(self):
+        def init_chain(policy: MaterializationPolicy):
+            sparse_repr = self.sparse_repr
+
+            for _ in range(3):
+                sparse_repr = init_transpose_sparse_repr(
+                    child=sparse_repr, policy=policy
+                )
+                sparse_repr = init_reshape_sparse_repr(
+                    child=sparse_repr, shape=sparse_repr.shape, policy=policy
+                )
+
+            return sparse_repr
+
+        views = init_chain(MaterializationPolicy(None, None))
+        self.assertEqual(6, to_view_depth(views))
+
+        # the fifth view is materialized, the sixth view is created on top of it
+        sparse_repr = init_chain(MaterializationPolicy(max_depth=4))
+        self.assertEqual(1, to_view_depth(sparse_repr))
+        self.assertIsInstance(sparse_repr.child, FromPolynomialMatrixMixin)
+
+        expected = {
+            (0, 0): {((0, 1),): 1.0},
+            (2, 1): {((1, 2),): 2.0},
+        }
+        self.assertDictEqual(expected, dict(views.entries()))
+        self.assertDictEqual(expected, dict(sparse_repr.entries()))
+
+    def test_2(self):
+        policy = MaterializationPolicy(None, None)
+
+        sparse_repr = init_kron_sparse_repr(
+            left=init_kron_sparse_repr(
+                left=self.sparse_repr,
+                right=self.sparse_repr,
+                shape=(4, 9),
+                policy=policy,
+            ),
+            right=self.sparse_repr,
+            shape=(8, 27),
+            policy=policy,
+        )
+
+        self.assertNotIsInstance(sparse_repr, FromPolynomialMatrixMixin)
+        self.assertEqual(sparse_repr.at(7, 26), {((1, 6),): 8.0})
+
+    def test_3(self):
+        sparse_repr = init_kron_sparse_repr(
+            left=self.sparse_repr,
+            right=self.sparse_repr,
+            shape=(4, 9),
+            policy=MaterializationPolicy(entry_cache_size=2),
+        )
+
+        polynomial = sparse_repr.at(3, 8)
+
+        self.assertEqual(polynomial, {((1, 4),): 4.0})
+
+        # modifying a returned polynomial does not change the cached entry
+        polynomial[tuple()] = 1.0
+        self.assertEqual(sparse_repr.at(3, 8), {((1, 4),): 4.0})
+
+        sparse_repr.at(0, 0)
+        sparse_repr.at(0, 1)
+
+        self.assertEqual(len(sparse_repr.entry_cache), 2)
+        self.assertNotIn((3, 8), sparse_repr.entry_cache)
+
+        # the cache is not compared
+        self.assertEqual(
+            sparse_repr,
+            init_kron_sparse_repr(
+                left=self.sparse_repr, right=self.sparse_repr, shape=(4, 9)
+            ),
+        )
+
+    def test_4(self):
+        expr = init_transpose(init_transpose(init_from_sparse_repr(self.sparse_repr)))
+
+        # the policy is given by the state
+        for policy, depth in (
+            (MaterializationPolicy(None, None), 2),
+            (MaterializationPolicy(max_depth=1), 0),
+        ):
+            state = init_state(materialization_policy=policy)
+            state, sparse_repr = expr.apply(state)
+
+            self.assertEqual(depth, to_view_depth(sparse_repr))
+            self.assertDictEqual(self.sparse_repr.data, dict(sparse_repr.entries()))
@@ -0,0 +1,56 @@
+import json
+import unittest
+
+import polymat
+from polymat.sparserepr.init import (
+    init_from_polynomial_matrix,
+    init_kron_sparse_repr,
+)
+
+
+class TestMemoryReport(unittest.TestCase):
+    def test_1(self):
+        left = init_from_polynomial_matrix(
+            data={
+                (0, 0): {((0, 1),): 1.0, ((1, 1),): 2.0},
+                (1, 0): {((0, 1),): 3.0},
+            },
+            shape=(2, 1),
+        )
+        right = init_from_polynomial_matrix(
+            data={(0, 0): {tuple(): 1.0}},
+            shape=(1, 1),
+        )
+
+        sparse_repr = init_kron_sparse_repr(left=left, right=right, shape=(2, 1))
+
+        report = polymat.memory_report(sparse_repr)
+        records = json.loads(report.to_json())
+
+        self.assertEqual(records[0]["name"], "KronSparseRepr")
+        self.assertEqual(records[0]["n_polynomials"], 2)
+        self.assertEqual(records[0]["n_terms"], 3)
+        self.assertEqual(records[0]["n_monomials"], 2)
+
+        self.assertEqual(records[1]["name"], "FromPolynomialMatrix")
+        self.assertEqual(records[1]["depth"], 1)
+        self.assertGreater(records[1]["bytes"], 0)
+
+        self.assertEqual(
+            report.total_bytes, sum(record["bytes"] for record in records)
+        )
+
+    def test_2(self):
+        x = polymat.define_variable("x", size=2)
+        f = polymat.from_(((1.0, 2.0),)) @ x + x.T @ x
+
+        state = polymat.init_state()
+        state, array_repr = polymat.to_array(f, x).apply(state)
+
+        report = polymat.memory_report(array_repr)
+        records = json.loads(report.to_json())
+
+        # ArrayRepr, degree 1 and degree 2
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[1]["n_terms"], 2)
+        self.assertEqual(records[2]["n_terms"], 2)
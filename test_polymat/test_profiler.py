@@ -0,0 +1,55 @@
+import json
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import polymat
+
+
+class TestProfiler(unittest.TestCase):
+    def test_1(self):
+        x = polymat.define_variable("x")
+        y = polymat.define_variable("y")
+
+        f = ((x + y) * x).cache()
+        g = f + f * y
+
+        profiler = polymat.Profiler()
+        state = polymat.init_state(profiler=profiler)
+
+        state, _ = polymat.to_sparse_repr(g).apply(state)
+
+        records = json.loads(profiler.to_json())
+
+        self.assertEqual(records[0]["operator"], "Addition")
+        self.assertEqual(records[0]["depth"], 0)
+        self.assertEqual(records[0]["n_entries"], 1)
+        self.assertEqual(records[0]["n_terms"], 4)
+
+        cache_hits = tuple(
+            record["cache_hit"] for record in records if record["operator"] == "Cache"
+        )
+        self.assertTupleEqual(cache_hits, (False, True))
+
+        lines = profiler.to_folded().split("\n")
+        self.assertEqual(len(lines), len(records))
+        self.assertTrue(lines[1].startswith("Addition ("))
+
+    def test_2(self):
+        x = polymat.define_variable("x")
+        y = polymat.define_variable("y")
+
+        f = polymat.v_stack((x * x, y * y))
+
+        for executor_type in (ThreadPoolExecutor, ProcessPoolExecutor):
+            profiler = polymat.Profiler()
+
+            with executor_type(max_workers=2) as executor:
+                state = polymat.init_state(executor=executor, profiler=profiler)
+                state, _ = polymat.to_sparse_repr(f).apply(state)
+
+            # the children applied by the workers are recorded
+            records = tuple(
+                (record.operator_name, record.depth) for record in profiler.records()
+            )
+            self.assertEqual(records[0], ("VerticalStack", 0))
+            self.assertEqual(records.count(("ElementwiseMult", 1)), 2)
@@ -0,0 +1,59 @@
+import io
+import unittest
+
+import numpy as np
+
+import polymat
+from polymat.expression.init import init_expression
+from polymat.expressiontree.init import init_from_sparse_repr
+from polymat.sparserepr.init import init_from_polynomial_matrix
+
+
+def save_and_load(obj):
+    file = io.BytesIO()
+    polymat.save(file, obj)
+    file.seek(0)
+    return polymat.load(file)
+
+
+class TestSerialization(unittest.TestCase):
+    def test_1(self):
+        data = {
+            (0, 0): {tuple(): 1.0, ((0, 1), (1, 2)): 2.0},
+            (2, 1): {((1, 1),): -3.0},
+        }
+
+        sparse_repr = init_from_polynomial_matrix(data=data, shape=(3, 2))
+
+        loaded = save_and_load(sparse_repr)
+
+        self.assertTupleEqual((3, 2), loaded.shape)
+        self.assertDictEqual(data, dict(loaded.entries()))
+
+    def test_2(self):
+        state, x = polymat.define_variable("x", size=2).apply(polymat.init_state())
+        state, _ = polymat.define_variable("y").apply(state)
+
+        loaded_state = save_and_load(state)
+
+        self.assertEqual(state.n_indices, loaded_state.n_indices)
+        self.assertDictEqual(state.indices, loaded_state.indices)
+
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {tuple(): 1.0, ((0, 1),): 2.0},
+                        (1, 0): {((0, 1), (1, 1)): 3.0, ((2, 2),): 1.0},
+                    },
+                    shape=(2, 1),
+                )
+            )
+        )
+
+        state, array_repr = polymat.to_array(expr, (0, 1, 2)).apply(state)
+
+        loaded = save_and_load(array_repr)
+
+        values = np.array([[1.0], [2.0], [3.0]])
+        np.testing.assert_array_almost_equal(array_repr(values), loaded(values))
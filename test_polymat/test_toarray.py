@@ -1,6 +1,14 @@
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
 import polymat
+from polymat.arrayrepr.init import (
+    init_memory_mapped_array_repr,
+    load_memory_mapped_array_repr,
+)
 from polymat.expression.init import init_expression
 from polymat.expressiontree.init import init_from_sparse_repr
 from polymat.sparserepr.init import init_from_polynomial_matrix
@@ -73,3 +81,181 @@ class TestToArray(unittest.TestCase):
         self.assertEqual(A3[2, 3], 1.0)
         self.assertEqual(A3[2, 5], 1.0)
         self.assertEqual(A3[2, 6], 1.0)
+
+    def test_2(self):
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {tuple(): 1.0, ((2, 1),): 2.0},
+                        (2, 0): {((0, 1),): -1.0, ((2, 1),): 3.0},
+                    },
+                    shape=(3, 1),
+                )
+            )
+        )
+
+        state = init_state()
+
+        # variables with indices 2 and 0
+        state, (A, b) = polymat.to_affine_arrays(expr, (2, 0)).apply(state)
+
+        self.assertEqual("csc", A.format)
+        np.testing.assert_array_equal(A.toarray(), ((2, 0), (0, 0), (3, -1)))
+        np.testing.assert_array_equal(b, (1, 0, 0))
+
+        b_out = np.ones(3)
+        a_out = np.ones((3, 2))
+        state, (A, b) = polymat.to_affine_arrays(
+            expr, (2, 0), b_out=b_out, a_out=a_out
+        ).apply(state)
+
+        self.assertIs(a_out, A)
+        self.assertIs(b_out, b)
+        np.testing.assert_array_equal(A, ((2, 0), (0, 0), (3, -1)))
+        np.testing.assert_array_equal(b, (1, 0, 0))
+
+        # the matrix is reshaped to a vector column by column
+        matrix = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {tuple(): 1.0},
+                        (1, 0): {((0, 1),): 2.0},
+                        (0, 1): {((2, 1),): -1.0, tuple(): 4.0},
+                    },
+                    shape=(2, 2),
+                )
+            )
+        )
+
+        state, (A, b) = polymat.to_affine_arrays(matrix, (2, 0)).apply(state)
+
+        np.testing.assert_array_equal(A.toarray(), ((0, 0), (0, 2), (-1, 0), (0, 0)))
+        np.testing.assert_array_equal(b, (1, 0, 4, 0))
+
+    def test_3(self):
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {tuple(): 1.0, ((0, 1), (1, 2)): 3.0},
+                        (2, 0): {((0, 1),): -1.0, ((1, 1),): 2.0},
+                        (3, 0): {((0, 2),): 4.0},
+                    },
+                    shape=(4, 1),
+                )
+            )
+        )
+
+        values = np.array([[2.0], [-3.0]])
+
+        state = init_state()
+        state, array_repr = polymat.to_array(expr, (0, 1)).apply(state)
+
+        with tempfile.TemporaryDirectory() as directory:
+            state, memory_mapped = polymat.to_array(
+                expr, (0, 1), directory=directory
+            ).apply(state)
+
+            loaded = load_memory_mapped_array_repr(directory, chunk_size=3)
+
+            for result in (memory_mapped(values), loaded(values)):
+                np.testing.assert_array_almost_equal(array_repr(values), result)
+
+            # the degree blocks follow the contract of `ArrayRepr.__getitem__`
+            for degree in (0, 1, 2, 3):
+                block = memory_mapped[degree]
+                expected = array_repr[degree]
+
+                if degree <= 1:
+                    self.assertIsInstance(block, np.ndarray)
+                else:
+                    block, expected = block.toarray(), expected.toarray()
+
+                np.testing.assert_array_equal(expected, block)
+
+    def test_4(self):
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {tuple(): 1.0, ((0, 1), (1, 2)): 3.0},
+                        (1, 1): {((0, 1),): -1.0, ((1, 1),): 2.0},
+                        (2, 1): {((0, 2),): 4.0},
+                    },
+                    shape=(3, 2),
+                )
+            )
+        )
+
+        values = np.array([[2.0], [-3.0]])
+
+        state = init_state()
+        state, array_repr = polymat.to_array(expr, (0, 1)).apply(state)
+        state, chunks = polymat.to_array_chunks(expr, (0, 1), chunk_size=4).apply(state)
+
+        chunks = list(chunks)
+
+        self.assertEqual([4, 2], [chunk.n_eq for chunk in chunks])
+        np.testing.assert_array_almost_equal(
+            array_repr(values).reshape(-1, 1, order="F"),
+            np.vstack([chunk(values) for chunk in chunks]),
+        )
+
+    def test_5(self):
+        # the rows of the second chunk are zero
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {((0, 1),): 1.0},
+                        (5, 0): {((0, 2),): 2.0},
+                    },
+                    shape=(6, 1),
+                )
+            )
+        )
+
+        values = np.array([[3.0]])
+
+        state = init_state()
+        state, chunks = polymat.to_array_chunks(expr, (0,), chunk_size=2).apply(state)
+
+        np.testing.assert_array_equal(
+            ((3.0,), (0.0,), (0.0,), (0.0,), (0.0,), (18.0,)),
+            np.vstack([chunk(values) for chunk in chunks]),
+        )
+
+    def test_6(self):
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {((0, 1),): 1.0},
+                        (1, 0): {((1, 1),): 2.0},
+                    },
+                    shape=(2, 1),
+                )
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            # variable 1 is not part of the array
+            with self.assertRaises(Exception):
+                polymat.to_array(expr, (0,), directory=directory).apply(init_state())
+
+            # the files of the degree blocks are closed and removed
+            self.assertListEqual([], os.listdir(directory))
+
+            array_repr = init_memory_mapped_array_repr(directory, n_eq=2, n_param=1)
+            array_repr.add(0, 0, 1, 1.0)
+
+            # reporting the memory does not finalize the array
+            polymat.memory_report(array_repr)
+            self.assertIn(1, array_repr.writers)
+
+            array_repr.finalize()
+            np.testing.assert_array_equal(
+                ((2.0,), (0.0,)), array_repr(np.array([[2.0]]))
+            )
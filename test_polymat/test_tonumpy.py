@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+
+import polymat
+from polymat.expression.init import init_expression
+from polymat.expression.to import to_numpy
+from polymat.expressiontree.init import init_from_sparse_repr
+from polymat.sparserepr.init import init_from_polynomial_matrix
+
+
+class TestToNumpy(unittest.TestCase):
+    def test_1(self):
+        sparse_repr = init_from_polynomial_matrix(
+            data={
+                (0, 0): {tuple(): 2.0},
+                (1, 2): {tuple(): -1.0, ((0, 1), (1, 2)): 3.0},
+                (2, 1): {((1, 1),): 1.0},
+            },
+            shape=(3, 3),
+        )
+
+        entry_arrays = sparse_repr.to_entry_arrays(variables={1})
+
+        np.testing.assert_array_equal(entry_arrays.rows, (0, 1, 2))
+        np.testing.assert_array_equal(entry_arrays.cols, (0, 2, 1))
+        np.testing.assert_array_equal(entry_arrays.constants, (2.0, -1.0, 0.0))
+        np.testing.assert_array_equal(entry_arrays.degrees, (0, 2, 1))
+        np.testing.assert_array_equal(entry_arrays.is_constant, (True, False, False))
+
+        expr = init_expression(init_from_sparse_repr(sparse_repr))
+        state = polymat.init_state()
+
+        state, array = to_numpy(expr, assert_constant=False).apply(state)
+        np.testing.assert_array_equal(
+            array, ((2.0, 0.0, 0.0), (0.0, 0.0, -1.0), (0.0, 0.0, 0.0))
+        )
+
+        state, degrees = polymat.to_degree(expr).apply(state)
+        np.testing.assert_array_equal(degrees, ((0, 0, 0), (0, 0, 3), (0, 1, 0)))
+
+        with self.assertRaises(Exception):
+            polymat.to_tuple(expr).apply(state)
+
+    def test_2(self):
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 2): {tuple(): 2.0, ((0, 1),): 1.0},
+                        (1, 0): {((0, 1),): -1.0},
+                    },
+                    shape=(2, 3),
+                )
+            )
+        )
+
+        state = polymat.init_state()
+
+        state, matrix = polymat.to_scipy_sparse(
+            expr, format="csc", assert_constant=False
+        ).apply(state)
+
+        self.assertEqual("csc", matrix.format)
+        self.assertEqual(1, matrix.nnz)
+        np.testing.assert_array_equal(matrix.toarray(), ((0, 0, 2), (0, 0, 0)))
+
+        state, matrices = polymat.to_scipy_sparse(expr, per_monomial=True).apply(state)
+
+        self.assertSetEqual({tuple(), ((0, 1),)}, set(matrices))
+        np.testing.assert_array_equal(
+            matrices[((0, 1),)].toarray(), ((0, 0, 1), (-1, 0, 0))
+        )
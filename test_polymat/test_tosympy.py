@@ -0,0 +1,35 @@
+import unittest
+
+import sympy
+
+import polymat
+from polymat.expression.init import init_expression
+from polymat.expressiontree.init import init_from_sparse_repr
+from polymat.sparserepr.init import init_from_polynomial_matrix
+
+
+class TestToSympy(unittest.TestCase):
+    def test_1(self):
+        expr = init_expression(
+            init_from_sparse_repr(
+                init_from_polynomial_matrix(
+                    data={
+                        (0, 0): {tuple(): 1.0, ((0, 1),): 2.0},
+                        (2, 1): {((0, 1), (1, 2)): 1.0},
+                    },
+                    shape=(3, 2),
+                )
+            )
+        )
+
+        state, _ = polymat.define_variable("x", size=2).apply(polymat.init_state())
+
+        state, dense = polymat.to_sympy(expr).apply(state)
+        state, sparse = polymat.to_sympy(expr, sparse=True).apply(state)
+
+        x0, x1 = sympy.symbols("x_0 x_1")
+        expected = sympy.Matrix([[2.0 * x0 + 1, 0], [0, 0], [0, x0 * x1**2]])
+
+        self.assertIsInstance(sparse, sympy.SparseMatrix)
+        self.assertEqual(expected, dense)
+        self.assertEqual(expected, sympy.Matrix(sparse))